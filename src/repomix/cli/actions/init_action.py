@@ -3,14 +3,43 @@ Initialization Action Module - Create new configuration file
 """
 
 import json
+from dataclasses import asdict, fields, is_dataclass
 from pathlib import Path
+from typing import Any, Dict
 
-from ...config.config_schema import RepomixConfig
+from ...config.config_schema import (
+    RepomixConfig,
+    RepomixConfigCompression,
+    RepomixConfigIgnore,
+    RepomixConfigOutput,
+    RepomixConfigRemote,
+    RepomixConfigSecurity,
+)
 from ...config.global_directory import get_global_directory
 from ...shared.error_handle import RepomixError
 from ...shared.logger import logger
 
 
+def _section_to_dict(section: Any, section_type: type) -> Dict[str, Any]:
+    """Convert a configuration section to a serializable dictionary
+
+    Args:
+        section: Configuration section instance
+        section_type: Dataclass type of the section
+
+    Returns:
+        Dictionary of public fields, with nested sections converted as well
+    """
+    section_dict = {}
+    for section_field in fields(section_type):
+        # Skip internal fields that start with underscore
+        if section_field.name.startswith("_"):
+            continue
+        value = getattr(section, section_field.name)
+        section_dict[section_field.name] = asdict(value) if is_dataclass(value) else value
+    return section_dict
+
+
 def run_init_action(cwd: str | Path, use_global: bool = False) -> None:
     """Execute initialization operation
 
@@ -41,18 +70,17 @@ def run_init_action(cwd: str | Path, use_global: bool = False) -> None:
     config = RepomixConfig()
 
     # Convert configuration to serializable dictionary
-    # Get only public fields, excluding internal fields that start with underscore
-    output_dict = {k: v for k, v in config.output.__dict__.items() if not k.startswith("_")}
+    output_dict = _section_to_dict(config.output, RepomixConfigOutput)
     # Ensure style is exported as string value
     if hasattr(config.output, "style_enum"):
         output_dict["style"] = config.output.style_enum.value
 
     config_dict = {
-        "remote": config.remote.__dict__,
+        "remote": _section_to_dict(config.remote, RepomixConfigRemote),
         "output": output_dict,
-        "security": config.security.__dict__,
-        "compression": config.compression.__dict__,
-        "ignore": config.ignore.__dict__,
+        "security": _section_to_dict(config.security, RepomixConfigSecurity),
+        "compression": _section_to_dict(config.compression, RepomixConfigCompression),
+        "ignore": _section_to_dict(config.ignore, RepomixConfigIgnore),
         "include": config.include,
     }
 
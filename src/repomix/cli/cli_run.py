@@ -6,8 +6,10 @@ import re
 import sys
 import asyncio
 import argparse
+from concurrent.futures import Executor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, NoReturn
+from typing import Callable, Dict, List, NoReturn, Optional, Tuple
 
 from ..__init__ import __version__
 from ..shared.error_handle import handle_error, RepomixError
@@ -18,38 +20,24 @@ from .actions.remote_action import run_remote_action
 from .actions.version_action import run_version_action
 from .types import CliOptions, CliResult
 
+# Semantic suggestions: valid options paired with the conceptually related terms that map to them.
+# Each options tuple is shared by all of its terms instead of allocating one list per term.
+_SEMANTIC_SUGGESTION_GROUPS: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (("--ignore",), ("exclude", "reject", "omit", "skip", "blacklist")),
+    (("--output",), ("save", "export", "out", "file")),
+    (("--style",), ("format", "type", "syntax")),
+    (("--verbose",), ("debug", "detailed")),
+    (("--quiet",), ("silent", "mute")),
+    (("--include",), ("add", "with", "whitelist")),
+    (("--remote",), ("clone", "git")),
+    (("--compress",), ("minimize", "reduce")),
+    (("--remove-comments",), ("strip-comments", "no-comments")),
+    (("--stdout",), ("print", "console", "terminal")),
+    (("--stdin",), ("pipe",)),
+)
+
 # Semantic suggestion map: maps conceptually related terms to valid options
-SEMANTIC_SUGGESTION_MAP: Dict[str, List[str]] = {
-    "exclude": ["--ignore"],
-    "reject": ["--ignore"],
-    "omit": ["--ignore"],
-    "skip": ["--ignore"],
-    "blacklist": ["--ignore"],
-    "save": ["--output"],
-    "export": ["--output"],
-    "out": ["--output"],
-    "file": ["--output"],
-    "format": ["--style"],
-    "type": ["--style"],
-    "syntax": ["--style"],
-    "debug": ["--verbose"],
-    "detailed": ["--verbose"],
-    "silent": ["--quiet"],
-    "mute": ["--quiet"],
-    "add": ["--include"],
-    "with": ["--include"],
-    "whitelist": ["--include"],
-    "clone": ["--remote"],
-    "git": ["--remote"],
-    "minimize": ["--compress"],
-    "reduce": ["--compress"],
-    "strip-comments": ["--remove-comments"],
-    "no-comments": ["--remove-comments"],
-    "print": ["--stdout"],
-    "console": ["--stdout"],
-    "terminal": ["--stdout"],
-    "pipe": ["--stdin"],
-}
+SEMANTIC_SUGGESTION_MAP: Dict[str, Tuple[str, ...]] = {term: options for options, terms in _SEMANTIC_SUGGESTION_GROUPS for term in terms}
 
 
 class RepomixArgumentParser(argparse.ArgumentParser):
@@ -73,7 +61,13 @@ class RepomixArgumentParser(argparse.ArgumentParser):
         super().error(message)
 
 
+@lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
+    """Get the command line argument parser, built once and shared (parse_args does not modify it)"""
+    return _build_parser()
+
+
+def _build_parser() -> argparse.ArgumentParser:
     """Create command line argument parser"""
     parser = RepomixArgumentParser(description="Repomix - Code Repository Packaging Tool")
 
@@ -202,6 +196,11 @@ def create_parser() -> argparse.ArgumentParser:
 
 def run() -> None:
     """Run CLI command"""
+    # Fast path: a bare `repomix --version` needs neither the parser nor any action setup
+    if sys.argv[1:] in (["-v"], ["--version"]):
+        run_version_action()
+        return
+
     parser = create_parser()
     args = parser.parse_args()
 
@@ -211,13 +210,19 @@ def run() -> None:
         handle_error(e)
 
 
-async def run_cli(directories: List[str], cwd: str, cli_options: CliOptions) -> CliResult | None:
+async def run_cli(
+    directories: List[str],
+    cwd: str,
+    cli_options: CliOptions,
+    executor: Optional[Executor] = None,
+) -> CliResult | None:
     """Run CLI programmatically for MCP tools.
 
     Args:
         directories: List of directories to process (usually just one)
         cwd: Current working directory
         cli_options: CLI options object
+        executor: Executor to run the pack in (defaults to the event loop's default executor)
 
     Returns:
         CliResult with pack_result
@@ -247,8 +252,9 @@ async def run_cli(directories: List[str], cwd: str, cli_options: CliOptions) ->
             # Normalize empty directories to default
             dirs = directories if directories else ["."]
 
-            # Run default action in a separate thread to avoid blocking the event loop
-            result = await asyncio.to_thread(run_default_action, dirs, cwd, options)
+            # Run default action off the event loop, reusing the caller's (or the loop's) thread pool
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(executor, run_default_action, dirs, cwd, options)
 
             # Return the result
             return CliResult(pack_result=result.pack_result)
@@ -262,6 +268,29 @@ async def run_cli(directories: List[str], cwd: str, cli_options: CliOptions) ->
         return None
 
 
+def _run_init(directories: List[str], cwd: Path, options: argparse.Namespace) -> None:
+    run_init_action(cwd, options.use_global)
+
+
+def _run_mcp(directories: List[str], cwd: Path, options: argparse.Namespace) -> None:
+    from ..mcp.mcp_server import run_mcp_server
+
+    # MCP mode runs in complete silence to avoid interfering with stdio protocol
+    asyncio.run(run_mcp_server())
+
+
+def _run_remote(directories: List[str], cwd: Path, options: argparse.Namespace) -> None:
+    run_remote_action(options.remote, vars(options))
+
+
+# Exclusive actions in priority order; the first truthy flag wins, otherwise the default action runs
+_ACTION_ORDER: Tuple[Tuple[str, Callable[[List[str], Path, argparse.Namespace], None]], ...] = (
+    ("init", _run_init),
+    ("mcp", _run_mcp),
+    ("remote", _run_remote),
+)
+
+
 def execute_action(directories: List[str], cwd: Path, options: argparse.Namespace) -> None:
     """Execute corresponding action
 
@@ -282,25 +311,15 @@ def execute_action(directories: List[str], cwd: Path, options: argparse.Namespac
     elif options.verbose:
         logger.set_log_level(LogLevel.DEBUG)
 
-    if options.version:
+    if getattr(options, "version", False):
         run_version_action()
         return
 
     logger.log(f"\n📦 Repomix v{__version__}\n")
 
-    if options.init:
-        run_init_action(cwd, options.use_global)
-        return
-
-    if options.mcp:
-        from ..mcp.mcp_server import run_mcp_server
-
-        # MCP mode runs in complete silence to avoid interfering with stdio protocol
-        asyncio.run(run_mcp_server())
-        return
-
-    if options.remote:
-        run_remote_action(options.remote, vars(options))
-        return
+    for flag, handler in _ACTION_ORDER:
+        if getattr(options, flag, False):
+            handler(directories, cwd, options)
+            return
 
     run_default_action(directories, cwd, vars(options))
@@ -4,6 +4,7 @@ Configuration Loading Module - Responsible for Loading and Merging Configuration
 
 import os
 import json
+from dataclasses import fields, is_dataclass
 from pathlib import Path
 from typing import Dict, Any
 
@@ -117,7 +118,7 @@ def load_global_config() -> RepomixConfig | None:
         except Exception as e:
             logger.warn(f"Failed to update global configuration file: {e}")
 
-        return RepomixConfig(**config_dict)
+        return RepomixConfig.from_dict(config_dict)
     except Exception as error:
         logger.warn(f"Failed to load global configuration: {error}")
         return None
@@ -159,7 +160,7 @@ def load_local_config(directory: str | Path, cwd: str | Path, config_path: str |
         # Migrate old configuration format
         config_dict = migrate_config_format(config_dict)
 
-        return RepomixConfig(**config_dict)
+        return RepomixConfig.from_dict(config_dict)
     except json.JSONDecodeError as error:
         raise RepomixError(f"Invalid configuration file format: {config_path_obj}") from error
     except Exception as error:
@@ -186,10 +187,10 @@ def merge_configs(
 
     # Merge configurations by priority: global config < local config < CLI options
     if global_config:
-        merge_config_dict(merged_config.__dict__, global_config.__dict__)
+        merge_config_object(merged_config, config_to_field_dict(global_config))
 
     if local_config:
-        merge_config_dict(merged_config.__dict__, local_config.__dict__)
+        merge_config_object(merged_config, config_to_field_dict(local_config))
 
     # Merge CLI options
     if cli_options:
@@ -202,11 +203,40 @@ def merge_configs(
                 cli_options["output"]["file_path"] = "repomix-output.txt"
             elif cli_options.get("output", {}).get("style") == "json":
                 cli_options["output"]["file_path"] = "repomix-output.json"
-        merge_config_dict(merged_config.__dict__, cli_options)
+        merge_config_object(merged_config, cli_options)
 
     return merged_config
 
 
+def config_to_field_dict(config: Any) -> Dict[str, Any]:
+    """Get the fields of a configuration dataclass as a shallow dictionary
+
+    Configuration classes use slots and carry no __dict__, so fields are read explicitly.
+
+    Args:
+        config: Configuration dataclass instance
+
+    Returns:
+        Dictionary mapping field names to their current values
+    """
+    return {f.name: getattr(config, f.name) for f in fields(config)}
+
+
+def merge_config_object(target: Any, source: Dict[str, Any]) -> None:
+    """Merge a source dictionary into a configuration dataclass instance
+
+    Args:
+        target: Target configuration object
+        source: Source dictionary
+    """
+    values = config_to_field_dict(target)
+    merge_config_dict(values, source)
+    for key in source:
+        if key in values and values[key] is not getattr(target, key):
+            # setattr keeps per-class validation (e.g. RepomixConfigOutput style handling)
+            setattr(target, key, values[key])
+
+
 def merge_config_dict(target: Dict[str, Any], source: Dict[str, Any]) -> None:
     """Merge configuration dictionaries
 
@@ -214,8 +244,6 @@ def merge_config_dict(target: Dict[str, Any], source: Dict[str, Any]) -> None:
         target: Target dictionary
         source: Source dictionary
     """
-    from .config_schema import RepomixConfigOutput
-
     for key, value in source.items():
         if value is not None:
             if isinstance(value, dict):
@@ -223,12 +251,9 @@ def merge_config_dict(target: Dict[str, Any], source: Dict[str, Any]) -> None:
                     # If target is a dictionary, merge recursively
                     if isinstance(target[key], dict):
                         merge_config_dict(target[key], value)
-                    # If target is an object, merge into its __dict__
-                    elif hasattr(target[key], "__dict__"):
-                        merge_config_dict(target[key].__dict__, value)
-                        # Special handling for RepomixConfigOutput to update _style when style changes
-                        if isinstance(target[key], RepomixConfigOutput) and "style" in value:
-                            target[key]._process_style_value(value["style"])
+                    # If target is a configuration object, merge into its fields
+                    elif is_dataclass(target[key]):
+                        merge_config_object(target[key], value)
                     else:
                         target[key] = value
                 else:
@@ -3,7 +3,7 @@ Configuration Module - Defines Repomix Configuration Schema and Default Values
 """
 
 from enum import Enum
-from typing import Any, Dict, List, cast
+from typing import Any, Dict, List, Tuple, cast
 from dataclasses import dataclass, field
 
 
@@ -16,7 +16,11 @@ class RepomixOutputStyle(str, Enum):
     JSON = "json"
 
 
-@dataclass
+# Lowercase style name -> enum member, resolved with a single dict lookup
+_STYLE_MAP: Dict[str, RepomixOutputStyle] = {style.value: style for style in RepomixOutputStyle}
+
+
+@dataclass(slots=True)
 class RepomixConfigGit:
     """Git-related output configuration"""
 
@@ -27,14 +31,14 @@ class RepomixConfigGit:
     include_logs_count: int = 50
 
 
-@dataclass
+@dataclass(slots=True)
 class RepomixConfigInput:
     """Input configuration"""
 
     max_file_size: int = 50 * 1024 * 1024  # Default: 50MB
 
 
-@dataclass
+@dataclass(slots=True)
 class RepomixConfigOutput:
     """Output configuration"""
 
@@ -66,19 +70,19 @@ class RepomixConfigOutput:
     git: RepomixConfigGit = field(default_factory=RepomixConfigGit)
     # Legacy field for backward compatibility (deprecated, use git.include_diffs)
     include_diffs: bool = False
+    # Internal state derived from style in __post_init__ (not constructor arguments)
+    _original_style: str = field(default="markdown", init=False, repr=False, compare=False)
+    _style_enum: RepomixOutputStyle = field(default=RepomixOutputStyle.MARKDOWN, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Convert string style to enum after initialization"""
         # Store the original style value
         self._original_style = self.style
 
-        if isinstance(self.style, str):
-            try:
-                self._style_enum = RepomixOutputStyle(self.style.lower())
-            except ValueError:
-                self._style_enum = RepomixOutputStyle.MARKDOWN
-        elif isinstance(self.style, RepomixOutputStyle):
+        if isinstance(self.style, RepomixOutputStyle):
             self._style_enum = self.style
+        elif isinstance(self.style, str):
+            self._style_enum = _STYLE_MAP.get(self.style.lower(), RepomixOutputStyle.MARKDOWN)
         else:
             self._style_enum = RepomixOutputStyle.MARKDOWN
 
@@ -92,18 +96,18 @@ class RepomixConfigOutput:
             self.git.include_diffs = True
 
     def _process_style_value(self, value):
-        """Process style value and set _style accordingly"""
+        """Process style value and set _style_enum accordingly"""
         if isinstance(value, RepomixOutputStyle):
             self._style_enum = value
             # Update the style field to match the enum value
             object.__setattr__(self, "style", value.value)
         elif isinstance(value, str):
-            try:
-                self._style_enum = RepomixOutputStyle(value.lower())
-                # Update the style field to match the enum value
-                object.__setattr__(self, "style", value.lower())
-            except ValueError:
-                raise ValueError(f"Invalid style value: {value}. Must be one of: {', '.join(s.value for s in RepomixOutputStyle)}") from None
+            style_enum = _STYLE_MAP.get(value.lower())
+            if style_enum is None:
+                raise ValueError(f"Invalid style value: {value}. Must be one of: {', '.join(s.value for s in RepomixOutputStyle)}")
+            self._style_enum = style_enum
+            # Update the style field to match the enum value
+            object.__setattr__(self, "style", style_enum.value)
         else:
             raise TypeError("Style must be either string or RepomixOutputStyle enum")
 
@@ -113,7 +117,8 @@ class RepomixConfigOutput:
             # Only validate if we're setting style after initialization
             self._process_style_value(value)
         else:
-            super().__setattr__(name, value)
+            # Zero-argument super() does not work in slotted dataclasses
+            object.__setattr__(self, name, value)
 
     @property
     def style_enum(self) -> RepomixOutputStyle:
@@ -125,8 +130,18 @@ class RepomixConfigOutput:
         """Set the output style, supports string or RepomixOutputStyle enum"""
         self._process_style_value(value)
 
+    @property
+    def _style(self) -> RepomixOutputStyle:
+        """Legacy alias of style_enum (the attribute name used before the 'style' migration)"""
+        return self.style_enum
+
+    @_style.setter
+    def _style(self, value):
+        """Set the output style through the legacy attribute name"""
+        self._process_style_value(value)
 
-@dataclass
+
+@dataclass(slots=True)
 class RepomixConfigSecurity:
     """Security configuration"""
 
@@ -134,7 +149,7 @@ class RepomixConfigSecurity:
     exclude_suspicious_files: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class RepomixConfigIgnore:
     """Ignore configuration"""
 
@@ -144,7 +159,7 @@ class RepomixConfigIgnore:
     use_default_ignore: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class RepomixConfigCompression:
     """Compression configuration"""
 
@@ -154,14 +169,14 @@ class RepomixConfigCompression:
     keep_interfaces: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class RepomixConfigTokenCount:
     """Token count configuration"""
 
     encoding: str = "o200k_base"
 
 
-@dataclass
+@dataclass(slots=True)
 class RepomixConfigRemote:
     """Remote repository configuration"""
 
@@ -169,7 +184,7 @@ class RepomixConfigRemote:
     branch: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class RepomixConfig:
     """Repomix main configuration class"""
 
@@ -186,42 +201,44 @@ class RepomixConfig:
     # Current working directory (set at runtime)
     cwd: str = "."
 
+    @classmethod
+    def from_dict(cls, config_dict: Dict[str, Any]) -> "RepomixConfig":
+        """Create a configuration from a plain dictionary (e.g. a loaded JSON config file)
+
+        Nested sections are converted to their dataclasses here, so the object is
+        fully built before construction and __post_init__ has nothing to convert.
+
+        Args:
+            config_dict: Configuration dictionary
+
+        Returns:
+            Configuration object
+        """
+        kwargs = dict(config_dict)
+        for name, section_type in _NESTED_SECTION_TYPES:
+            section = kwargs.get(name)
+            if isinstance(section, dict):
+                kwargs[name] = section_type(**section)
+        return cls(**kwargs)
+
     def __post_init__(self):
-        """Post-initialization processing to handle nested dictionaries"""
-        # Handle input if it's a dictionary
-        if isinstance(self.input, dict):
-            d: Dict[str, Any] = cast(Dict[str, Any], self.input)
-            self.input = RepomixConfigInput(**d)
-
-        # Handle output if it's a dictionary
-        if isinstance(self.output, dict):
-            # Create output object with all parameters (including style)
-            d = cast(Dict[str, Any], self.output)
-            self.output = RepomixConfigOutput(**d)
-
-        # Handle security if it's a dictionary
-        if isinstance(self.security, dict):
-            d = cast(Dict[str, Any], self.security)
-            self.security = RepomixConfigSecurity(**d)
-
-        # Handle ignore if it's a dictionary
-        if isinstance(self.ignore, dict):
-            d = cast(Dict[str, Any], self.ignore)
-            self.ignore = RepomixConfigIgnore(**d)
-
-        if isinstance(self.compression, dict):
-            d = cast(Dict[str, Any], self.compression)
-            self.compression = RepomixConfigCompression(**d)
-
-        # Handle remote if it's a dictionary
-        if isinstance(self.remote, dict):
-            d = cast(Dict[str, Any], self.remote)
-            self.remote = RepomixConfigRemote(**d)
-
-        # Handle token_count if it's a dictionary
-        if isinstance(self.token_count, dict):
-            d = cast(Dict[str, Any], self.token_count)
-            self.token_count = RepomixConfigTokenCount(**d)
+        """Post-initialization processing to handle nested dictionaries passed as keyword arguments"""
+        for name, section_type in _NESTED_SECTION_TYPES:
+            section = getattr(self, name)
+            if isinstance(section, dict):
+                setattr(self, name, section_type(**cast(Dict[str, Any], section)))
+
+
+# Nested configuration sections that may be given as plain dictionaries
+_NESTED_SECTION_TYPES: Tuple[Tuple[str, type], ...] = (
+    ("input", RepomixConfigInput),
+    ("output", RepomixConfigOutput),
+    ("security", RepomixConfigSecurity),
+    ("ignore", RepomixConfigIgnore),
+    ("compression", RepomixConfigCompression),
+    ("remote", RepomixConfigRemote),
+    ("token_count", RepomixConfigTokenCount),
+)
 
 
 # Default configuration
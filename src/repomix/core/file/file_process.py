@@ -2,10 +2,11 @@
 File Processing Module - Responsible for Processing Collected File Contents
 """
 
+import os
 from typing import List
 
 from ...config.config_schema import RepomixConfig
-from ...shared.process_concurrency import get_process_concurrency
+from ...shared.process_concurrency import get_chunk_size, get_process_concurrency
 from .file_manipulate import get_file_manipulator
 from .file_types import ProcessedFile, RawFile
 from .truncate_base64 import truncate_base64_content
@@ -40,12 +41,31 @@ def process_files(raw_files: List[RawFile], config: RepomixConfig) -> List[Proce
     # Create argument list, each element is a tuple of (raw file, configuration)
     file_args = [(raw_file, config) for raw_file in raw_files]
 
+    # Stripping and line numbering are cheap string operations; shipping every file to a
+    # worker and back would cost more than doing them here
+    if not _uses_code_manipulation(config):
+        return [_process_single_file(args) for args in file_args]
+
+    # Batch files per task so process workers are not sent one file at a time
+    chunk_size = get_chunk_size(len(file_args), (os.cpu_count() or 1) * 4)
     with get_process_concurrency() as executor:
-        processed_files = list(executor.map(_process_single_file, file_args))
+        processed_files = list(executor.map(_process_single_file, file_args, chunksize=chunk_size))
 
     return processed_files
 
 
+def _uses_code_manipulation(config: RepomixConfig) -> bool:
+    """Check whether processing runs any of the heavier content transformations
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        True if base64 truncation, compression or comment/empty-line removal is enabled
+    """
+    return bool(config.output.truncate_base64 or config.compression.enabled or config.output.remove_comments or config.output.remove_empty_lines)
+
+
 def process_content(content: str, file_path: str, config: RepomixConfig) -> str:
     """Process single file content
 
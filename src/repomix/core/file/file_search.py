@@ -3,8 +3,11 @@ File Search Module - Responsible for Searching and Filtering Files in the File S
 """
 
 import fnmatch
+import os
+import re
+import threading
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Tuple
 from dataclasses import dataclass
 
 from ...config.config_schema import RepomixConfig
@@ -25,6 +28,30 @@ class FileSearchResult:
     empty_dir_paths: List[str]
 
 
+# Ignore files read by get_ignore_patterns, in the order their patterns are applied
+_IGNORE_FILE_NAMES = (".repomixignore", ".ignore", ".gitignore")
+
+# Cache for get_ignore_patterns results
+# Key format: `(root_dir, ignore settings, custom patterns)`; the value keeps the ignore files'
+# `(mtime_ns, size)` stamps next to the patterns, and an entry with stale stamps is replaced
+_ignore_patterns_cache: Dict[Tuple, Tuple[Tuple, List[str]]] = {}
+
+# Cache for parsed ignore files (.repomixignore, .ignore, .gitignore at any level)
+# Key format: `file_path`; the value is `((mtime_ns, size), patterns)`, replaced when the file changes
+_ignore_file_cache: Dict[str, Tuple[Tuple[int, int], Tuple[str, ...]]] = {}
+
+# Entry limits for the caches above; the oldest entry is evicted first, so long-running
+# processes scanning many repositories keep a bounded working set
+_MAX_IGNORE_PATTERNS_CACHE_ENTRIES = 256
+_MAX_IGNORE_FILE_CACHE_ENTRIES = 4096
+
+# Guards cache writes and evictions; searches can run from several worker threads at once
+_ignore_cache_lock = threading.Lock()
+
+# Non-empty ignore file lines that are not '#' comments (text mode reads all line endings as '\n')
+_IGNORE_LINE_RE = re.compile(r"^[^#\n].*$", re.MULTILINE)
+
+
 @dataclass
 class PermissionError(Exception):
     """Permission Error Exception"""
@@ -206,14 +233,12 @@ def _scan_directory(
     current_ignore_patterns = ignore_patterns.copy()
     if config and config.ignore.use_gitignore:
         gitignore_path = current_dir / ".gitignore"
-        if gitignore_path.exists() and gitignore_path != (root_path / ".gitignore"):
+        if gitignore_path != (root_path / ".gitignore"):
             try:
-                with open(gitignore_path, encoding="utf-8") as f:
-                    lines = f.readlines()
-                    local_patterns = [line.strip() for line in lines if line.strip() and not line.startswith("#")]
-                    if local_patterns:
-                        logger.debug(f"Found {len(local_patterns)} patterns in {gitignore_path}")
-                        current_ignore_patterns.extend(local_patterns)
+                local_patterns = read_ignore_file(gitignore_path)
+                if local_patterns:
+                    logger.debug(f"Found {len(local_patterns)} patterns in {gitignore_path}")
+                    current_ignore_patterns.extend(local_patterns)
             except Exception as e:
                 logger.warn(f"Failed to read local .gitignore file at {gitignore_path}: {e}")
 
@@ -434,41 +459,122 @@ def search_files(root_dir: str | Path, config: RepomixConfig) -> FileSearchResul
     return FileSearchResult(file_paths=unique_final_files, empty_dir_paths=empty_dirs)
 
 
+def read_ignore_file(path: str | Path) -> Tuple[str, ...] | None:
+    """Read the patterns of an ignore file, skipping blank lines and comments
+
+    Parsed patterns are cached per file together with its modification time and size, so
+    unchanged files (e.g. parent .gitignore files consulted for every subdirectory) are
+    read once and an edited file replaces its previous entry.
+
+    Args:
+        path: Path to the ignore file
+
+    Returns:
+        Patterns in file order, or None if the file does not exist
+
+    Raises:
+        OSError, UnicodeDecodeError: When the file exists but cannot be read
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    cache_key = os.fspath(path)
+    file_stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _ignore_file_cache.get(cache_key)
+    if cached is not None and cached[0] == file_stamp:
+        return cached[1]
+
+    with open(path, encoding="utf-8") as f:
+        lines = _IGNORE_LINE_RE.findall(f.read())
+    patterns = tuple(filter(None, map(str.strip, lines)))
+    _store_cache_entry(_ignore_file_cache, cache_key, (file_stamp, patterns), _MAX_IGNORE_FILE_CACHE_ENTRIES)
+    return patterns
+
+
+def _store_cache_entry(cache: Dict[Any, Any], key: Any, value: Any, max_entries: int) -> None:
+    """Store a cache entry, replacing any previous one for the key and evicting the oldest when full"""
+    with _ignore_cache_lock:
+        if cache.pop(key, None) is None and len(cache) >= max_entries:
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+
+def _ignore_file_stamp(path: str) -> Tuple[int, int] | None:
+    """Get an ignore file's (mtime_ns, size), or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 def get_ignore_patterns(root_dir: str | Path, config: RepomixConfig) -> List[str]:
-    """Get list of ignore patterns"""
+    """Get list of ignore patterns
+
+    Results are cached per directory and ignore settings together with the ignore file
+    stamps, so the search and tree building passes over the same root parse the files once.
+    """
+    root = os.path.abspath(root_dir)
+    ignore = config.ignore
+    cache_key = (
+        root,
+        ignore.use_default_ignore,
+        ignore.use_dot_ignore,
+        ignore.use_gitignore,
+        tuple(ignore.custom_patterns or ()),
+    )
+    file_stamps = tuple(_ignore_file_stamp(os.path.join(root, name)) for name in _IGNORE_FILE_NAMES)
+
+    cached = _ignore_patterns_cache.get(cache_key)
+    if cached is not None and cached[0] == file_stamps:
+        return list(cached[1])
+
+    patterns = _read_ignore_patterns(root_dir, config)
+    _store_cache_entry(_ignore_patterns_cache, cache_key, (file_stamps, patterns), _MAX_IGNORE_PATTERNS_CACHE_ENTRIES)
+    return list(patterns)
+
+
+def clear_ignore_patterns_cache() -> None:
+    """Clear the ignore patterns and ignore file caches (useful for testing)"""
+    with _ignore_cache_lock:
+        _ignore_patterns_cache.clear()
+        _ignore_file_cache.clear()
+
+
+def _read_ignore_patterns(root_dir: str | Path, config: RepomixConfig) -> List[str]:
+    """Collect ignore patterns from defaults, ignore files and custom configuration"""
     patterns: List[str] = []
 
     # Add default ignore patterns
     if config.ignore.use_default_ignore:
         patterns.extend(default_ignore_list)
 
-    repomixignore_path = Path(root_dir) / ".repomixignore"
-    if repomixignore_path.exists():
-        try:
-            new_patterns = [line.strip() for line in repomixignore_path.read_text().splitlines() if line.strip() and not line.startswith("#")]
+    try:
+        new_patterns = read_ignore_file(Path(root_dir) / ".repomixignore")
+        if new_patterns:
             patterns.extend(new_patterns)
-        except Exception as error:
-            logger.warn(f"Failed to read .repomixignore: {error}")
+    except Exception as error:
+        logger.warn(f"Failed to read .repomixignore: {error}")
 
     # Add patterns from .ignore files
     if config.ignore.use_dot_ignore:
-        ignore_path = Path(root_dir) / ".ignore"
-        if ignore_path.exists():
-            try:
-                new_patterns = [line.strip() for line in ignore_path.read_text().splitlines() if line.strip() and not line.startswith("#")]
+        try:
+            new_patterns = read_ignore_file(Path(root_dir) / ".ignore")
+            if new_patterns:
                 patterns.extend(new_patterns)
-            except Exception as error:
-                logger.warn(f"Failed to read .ignore file: {error}")
+        except Exception as error:
+            logger.warn(f"Failed to read .ignore file: {error}")
 
     # Add patterns from .gitignore
     if config.ignore.use_gitignore:
-        gitignore_path = Path(root_dir) / ".gitignore"
-        if gitignore_path.exists():
-            try:
-                new_patterns = [line.strip() for line in gitignore_path.read_text().splitlines() if line.strip() and not line.startswith("#")]
+        try:
+            new_patterns = read_ignore_file(Path(root_dir) / ".gitignore")
+            if new_patterns:
                 patterns.extend(new_patterns)
-            except Exception as error:
-                logger.warn(f"Failed to read .gitignore file: {error}")
+        except Exception as error:
+            logger.warn(f"Failed to read .gitignore file: {error}")
 
     # Add custom ignore patterns
     if config.ignore.custom_patterns:
@@ -494,15 +600,13 @@ def collect_gitignore_patterns(directory_path: Path, root_path: Path) -> List[st
     while str(current_dir).startswith(str(root_path)):
         gitignore_path = current_dir / ".gitignore"
 
-        if gitignore_path.exists():
-            try:
-                with open(gitignore_path, encoding="utf-8") as f:
-                    lines = f.readlines()
-                    dir_patterns = [line.strip() for line in lines if line.strip() and not line.startswith("#")]
-                    patterns.extend(dir_patterns)
-                    logger.debug(f"Added {len(dir_patterns)} patterns from {gitignore_path}")
-            except Exception as e:
-                logger.warn(f"Failed to read .gitignore file at {gitignore_path}: {e}")
+        try:
+            dir_patterns = read_ignore_file(gitignore_path)
+            if dir_patterns is not None:
+                patterns.extend(dir_patterns)
+                logger.debug(f"Added {len(dir_patterns)} patterns from {gitignore_path}")
+        except Exception as e:
+            logger.warn(f"Failed to read .gitignore file at {gitignore_path}: {e}")
 
         # If we've reached the project root, stop
         if current_dir == root_path:
@@ -2,16 +2,34 @@
 Git Command Processing Module - Provides Git-related Functionality
 """
 
+import os
 import subprocess
+import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Tuple
 
 from ...shared.logger import logger
+from .file_search import _ignore_file_stamp, _store_cache_entry
 
+# Marker git prints on stderr when a command runs outside of any work tree
+_NOT_A_GIT_REPOSITORY_MARKER = "not a git repository"
 
+# Cache for parsed .gitignore patterns
+# Key format: `gitignore_path`; the value is `((mtime_ns, size), patterns)`, replaced when the file changes
+_gitignore_patterns_cache: Dict[str, Tuple[Tuple[int, int], List[str]]] = {}
+
+# Entry limit for the .gitignore cache; the oldest entry is evicted first
+_MAX_GITIGNORE_PATTERNS_CACHE_ENTRIES = 1024
+
+
+@lru_cache(maxsize=1)
 def is_git_installed() -> bool:
     """Check if Git is installed
 
+    Results are cached for the lifetime of the process.
+
     Returns:
         True if Git is installed, False otherwise
     """
@@ -46,6 +64,21 @@ def is_git_repository(directory: str | Path) -> bool:
         return False
 
 
+def is_not_git_repository_error(error: subprocess.CalledProcessError) -> bool:
+    """Check whether a failed git command failed only because the directory is not a Git repository
+
+    Lets callers run the real git command directly instead of probing with
+    `rev-parse --is-inside-work-tree` first, saving one git process per operation.
+
+    Args:
+        error: Error raised by a git subprocess call
+
+    Returns:
+        True if git reported that the directory is not inside a repository
+    """
+    return _NOT_A_GIT_REPOSITORY_MARKER in (error.stderr or "").lower()
+
+
 def exec_git_diff(directory: str | Path, options: List[str] | None = None) -> str:
     """Execute git diff command
 
@@ -71,6 +104,45 @@ def exec_git_diff(directory: str | Path, options: List[str] | None = None) -> st
         raise
 
 
+def exec_git_diff_both(directory: str | Path) -> Tuple[str, str]:
+    """Execute the work tree and staged git diffs concurrently
+
+    Both git processes are started before either is awaited, so the two diffs
+    overlap instead of paying git's startup and index scan back to back.
+
+    Args:
+        directory: Repository directory
+
+    Returns:
+        Tuple of (work tree diff, staged diff) output strings
+
+    Raises:
+        subprocess.CalledProcessError: When either Git command execution fails
+    """
+    base_cmd = ["git", "-C", str(directory), "diff", "--no-color"]
+    cmds = [base_cmd, [*base_cmd, "--cached"]]
+
+    procs: List[subprocess.Popen] = []
+    try:
+        for cmd in cmds:
+            procs.append(subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True))
+    except Exception:
+        for proc in procs:
+            proc.kill()
+            proc.wait()
+        raise
+
+    # Drain both processes before raising so neither is left running
+    outputs = [proc.communicate() for proc in procs]
+
+    for cmd, proc, (stdout, stderr) in zip(cmds, procs, outputs, strict=True):
+        if proc.returncode != 0:
+            logger.trace(f"Failed to execute git diff: {stderr}")
+            raise subprocess.CalledProcessError(proc.returncode, cmd, output=stdout, stderr=stderr)
+
+    return outputs[0][0] or "", outputs[1][0] or ""
+
+
 def exec_git_log(
     directory: str | Path,
     max_commits: int = 50,
@@ -112,15 +184,21 @@ def exec_git_log(
         raise
 
 
-def exec_git_log_filenames(directory: str | Path, max_commits: int = 100) -> List[str]:
-    """Get list of filenames from git log
+def iter_git_log_filenames(directory: str | Path, max_commits: int = 100) -> Iterator[str]:
+    """Stream filenames from git log, one per changed file per commit
+
+    Lines are consumed from the git pipe as they arrive, so the full log is never
+    buffered as a single string or split into an intermediate list.
 
     Args:
         directory: Repository directory
         max_commits: Maximum number of commits to check
 
-    Returns:
-        List of filenames that have been changed
+    Yields:
+        Interned filenames that have been changed (repeated once per commit touching them)
+
+    Raises:
+        subprocess.CalledProcessError: When Git command execution fails
     """
     cmd = [
         "git",
@@ -133,11 +211,43 @@ def exec_git_log_filenames(directory: str | Path, max_commits: int = 100) -> Lis
         str(max_commits),
     ]
 
+    # stderr goes to a temporary file rather than a pipe: it is only read once stdout is
+    # exhausted, and a pipe filled with warnings would block git while we wait on stdout
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="replace") as stderr_file:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True)
+        try:
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                filename = line.strip()
+                if filename:
+                    # Hot files repeat once per commit; interning makes every occurrence one object
+                    yield sys.intern(filename)
+            proc.wait()
+        finally:
+            # The consumer may stop early; never leave git blocked on a full pipe
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            if proc.stdout is not None:
+                proc.stdout.close()
+
+        if proc.returncode != 0:
+            stderr_file.seek(0)
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr_file.read())
+
+
+def exec_git_log_filenames(directory: str | Path, max_commits: int = 100) -> List[str]:
+    """Get list of filenames from git log
+
+    Args:
+        directory: Repository directory
+        max_commits: Maximum number of commits to check
+
+    Returns:
+        List of filenames that have been changed
+    """
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        # Filter out empty lines and return unique filenames
-        filenames = [line.strip() for line in result.stdout.split("\n") if line.strip()]
-        return filenames
+        return list(iter_git_log_filenames(directory, max_commits))
     except subprocess.CalledProcessError as e:
         logger.trace(f"Failed to get git log filenames: {e.stderr}")
         return []
@@ -172,25 +282,39 @@ def exec_git_shallow_clone(repo_url: str, target_dir: str | Path, branch: str |
 def get_git_ignore_patterns(repo_dir: str | Path) -> List[str]:
     """Get ignore patterns from .gitignore
 
+    Parsed patterns are cached per file together with its modification time and size, so
+    unchanged .gitignore files are only read once per process and an edited file
+    replaces its previous entry.
+
     Args:
         repo_dir: Repository directory
 
     Returns:
         List of ignore patterns
     """
-    patterns: List[str] = []
-    gitignore_path = Path(repo_dir) / ".gitignore"
+    gitignore_path = os.path.join(repo_dir, ".gitignore")
+
+    stamp = _ignore_file_stamp(gitignore_path)
+    if stamp is None:
+        return []
 
-    if not gitignore_path.exists():
-        return patterns
+    cached = _gitignore_patterns_cache.get(gitignore_path)
+    if cached is not None and cached[0] == stamp:
+        return list(cached[1])
 
     try:
-        with gitignore_path.open("r") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    patterns.append(line)
+        with open(gitignore_path) as gitignore_file:
+            lines = gitignore_file.read().splitlines()
     except Exception as error:
         logger.warn(f"Failed to read .gitignore: {error}")
+        return []
+
+    patterns = [line for line in (raw.strip() for raw in lines) if line and line[0] != "#"]
+    _store_cache_entry(_gitignore_patterns_cache, gitignore_path, (stamp, patterns), _MAX_GITIGNORE_PATTERNS_CACHE_ENTRIES)
+    return list(patterns)
+
 
-    return patterns
+def clear_caches() -> None:
+    """Clear git probe caches (useful for testing)"""
+    is_git_installed.cache_clear()
+    _gitignore_patterns_cache.clear()
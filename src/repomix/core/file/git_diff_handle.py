@@ -2,14 +2,16 @@
 Git Diff Handle Module - Handles Git Diff Operations
 """
 
+import subprocess
 from dataclasses import dataclass
+from typing import Tuple
 
 from ...shared.logger import logger
 from ...config.config_schema import RepomixConfig
-from .git_command import exec_git_diff, is_git_repository
+from .git_command import exec_git_diff, exec_git_diff_both, is_not_git_repository_error
 
 
-@dataclass
+@dataclass(slots=True)
 class GitDiffResult:
     """Result of git diff operations"""
 
@@ -52,19 +54,41 @@ def _get_diff(directory: str, options: list) -> str:
         Git diff output string
     """
     try:
-        # Check if the directory is a git repository
-        if not is_git_repository(directory):
+        # Run the diff directly; a separate repository probe would cost another git process
+        return exec_git_diff(directory, options)
+    except subprocess.CalledProcessError as e:
+        if is_not_git_repository_error(e):
             logger.trace("Not a git repository, skipping diff generation")
-            return ""
-
-        # Get the diff with provided options
-        result = exec_git_diff(directory, options)
-        return result
+        else:
+            logger.trace(f"Failed to get git diff: {e}")
+        return ""
     except Exception as e:
         logger.trace(f"Failed to get git diff: {e}")
         return ""
 
 
+def _get_both_diffs(directory: str) -> Tuple[str, str]:
+    """Helper function to get the work tree and staged diffs in one step
+
+    Args:
+        directory: Repository directory
+
+    Returns:
+        Tuple of (work tree diff, staged diff); empty strings when unavailable
+    """
+    try:
+        return exec_git_diff_both(directory)
+    except subprocess.CalledProcessError as e:
+        if is_not_git_repository_error(e):
+            logger.trace("Not a git repository, skipping diff generation")
+        else:
+            logger.trace(f"Failed to get git diff: {e}")
+        return "", ""
+    except Exception as e:
+        logger.trace(f"Failed to get git diff: {e}")
+        return "", ""
+
+
 def get_git_diffs(
     root_dirs: list,
     config: RepomixConfig,
@@ -86,8 +110,7 @@ def get_git_diffs(
         # Use the first directory as the git repository root
         git_root = root_dirs[0] if root_dirs else "."
 
-        work_tree_diff_content = get_work_tree_diff(git_root)
-        staged_diff_content = get_staged_diff(git_root)
+        work_tree_diff_content, staged_diff_content = _get_both_diffs(git_root)
 
         return GitDiffResult(
             work_tree_diff_content=work_tree_diff_content,
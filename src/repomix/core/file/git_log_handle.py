@@ -2,12 +2,13 @@
 Git Log Handle Module - Handles Git Log Operations
 """
 
+import subprocess
 from dataclasses import dataclass, field
-from typing import List
+from typing import Iterator, List
 
 from ...shared.logger import logger
 from ...config.config_schema import RepomixConfig
-from .git_command import exec_git_log, is_git_repository
+from .git_command import exec_git_log, is_not_git_repository_error
 
 
 # Null character used as record separator in git log output for robust parsing
@@ -19,7 +20,7 @@ GIT_LOG_RECORD_SEPARATOR = "\x00"
 GIT_LOG_FORMAT_SEPARATOR = "%x00"
 
 
-@dataclass
+@dataclass(slots=True)
 class GitLogCommit:
     """Represents a single git commit"""
 
@@ -28,54 +29,102 @@ class GitLogCommit:
     files: List[str] = field(default_factory=list)
 
 
-@dataclass
 class GitLogResult:
-    """Result of git log operations"""
-
-    log_content: str
-    commits: List[GitLogCommit] = field(default_factory=list)
+    """Result of git log operations
 
+    Results built with from_log_content parse their commits from log_content on first
+    access, so outputs that never render the log section skip parsing entirely.
+    """
 
-def parse_git_log(raw_log_output: str, record_separator: str = GIT_LOG_RECORD_SEPARATOR) -> List[GitLogCommit]:
-    """Parse raw git log output into structured commits
+    __slots__ = ("log_content", "_commits", "max_commits")
+
+    def __init__(
+        self,
+        log_content: str,
+        commits: List[GitLogCommit] | None = None,
+        max_commits: int | None = None,
+    ):
+        self.log_content = log_content
+        # Parsed commits; None until first access for results built with from_log_content
+        self._commits: List[GitLogCommit] | None = [] if commits is None else commits
+        # Commit limit the log was requested with (None if unknown)
+        self.max_commits = max_commits
+
+    @classmethod
+    def from_log_content(cls, log_content: str, max_commits: int | None = None) -> "GitLogResult":
+        """Create a result whose commits are parsed from log_content on first access
+
+        Args:
+            log_content: Raw git log output
+            max_commits: Commit limit the log was requested with
+
+        Returns:
+            Git log result with lazily parsed commits
+        """
+        result = cls(log_content, max_commits=max_commits)
+        result._commits = None
+        return result
+
+    @property
+    def commits(self) -> List[GitLogCommit]:
+        """Parsed commits, materialized from log_content on first access"""
+        if self._commits is None:
+            self._commits = list(iter_parse_git_log(self.log_content))
+        return self._commits
+
+    @commits.setter
+    def commits(self, value: List[GitLogCommit]) -> None:
+        self._commits = value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GitLogResult):
+            return NotImplemented
+        return (self.log_content, self.commits, self.max_commits) == (other.log_content, other.commits, other.max_commits)
+
+    def __repr__(self) -> str:
+        return f"GitLogResult(log_content={self.log_content!r}, _commits={self._commits!r}, max_commits={self.max_commits!r})"
+
+
+def iter_parse_git_log(raw_log_output: str, record_separator: str = GIT_LOG_RECORD_SEPARATOR) -> Iterator[GitLogCommit]:
+    """Lazily parse raw git log output into structured commits
 
     Args:
         raw_log_output: Raw output from git log command
         record_separator: Separator used between commits
 
-    Returns:
-        List of GitLogCommit objects
+    Yields:
+        GitLogCommit objects in log order
     """
-    if not raw_log_output.strip():
-        return []
-
-    commits: List[GitLogCommit] = []
-
     # Split by record separator used in git log output
     # This is more robust than splitting by double newlines, as commit messages may contain newlines
-    log_entries = [entry for entry in raw_log_output.split(record_separator) if entry]
-
-    for entry in log_entries:
-        # Split on both \n and \r\n to handle different line ending formats across platforms
-        lines = [line for line in entry.replace("\r\n", "\n").split("\n") if line.strip()]
+    for entry in raw_log_output.split(record_separator):
+        # splitlines handles both \n and \r\n line endings without a normalized copy of the entry
+        lines = [line for line in entry.splitlines() if line.strip()]
         if not lines:
             continue
 
         # First line contains date and message separated by |
-        first_line = lines[0]
-        separator_index = first_line.find("|")
-        if separator_index == -1:
+        date, separator, message = lines[0].partition("|")
+        if not separator:
             continue
 
-        date = first_line[:separator_index]
-        message = first_line[separator_index + 1 :]
-
         # Remaining lines are file paths
-        files = [line.strip() for line in lines[1:] if line.strip()]
+        files = [line.strip() for line in lines[1:]]
+
+        yield GitLogCommit(date=date, message=message, files=files)
+
+
+def parse_git_log(raw_log_output: str, record_separator: str = GIT_LOG_RECORD_SEPARATOR) -> List[GitLogCommit]:
+    """Parse raw git log output into structured commits
 
-        commits.append(GitLogCommit(date=date, message=message, files=files))
+    Args:
+        raw_log_output: Raw output from git log command
+        record_separator: Separator used between commits
 
-    return commits
+    Returns:
+        List of GitLogCommit objects
+    """
+    return list(iter_parse_git_log(raw_log_output, record_separator))
 
 
 def get_git_log(directory: str, max_commits: int) -> str:
@@ -88,12 +137,18 @@ def get_git_log(directory: str, max_commits: int) -> str:
     Returns:
         Raw git log output string
     """
-    if not is_git_repository(directory):
-        logger.trace(f"Directory {directory} is not a git repository")
-        return ""
-
     try:
+        # Run the log directly; a separate repository probe would cost another git process
         return exec_git_log(directory, max_commits, GIT_LOG_FORMAT_SEPARATOR)
+    except subprocess.CalledProcessError as e:
+        if is_not_git_repository_error(e):
+            logger.trace(f"Directory {directory} is not a git repository")
+        else:
+            logger.trace(f"Failed to get git log: {e}")
+        return ""
+    except FileNotFoundError:
+        logger.trace("Git is not installed, skipping log generation")
+        return ""
     except Exception as e:
         logger.trace(f"Failed to get git log: {e}")
         raise
@@ -123,10 +178,8 @@ def get_git_logs(
 
         log_content = get_git_log(git_root, max_commits)
 
-        # Parse the raw log content into structured commits
-        commits = parse_git_log(log_content)
-
-        return GitLogResult(log_content=log_content, commits=commits)
+        # Commits are parsed from the raw log content on first access
+        return GitLogResult.from_log_content(log_content, max_commits=max_commits)
     except Exception as e:
         logger.warn(f"Failed to get git logs: {e}")
         return None
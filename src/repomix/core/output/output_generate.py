@@ -3,7 +3,6 @@ Output Generation Module - Responsible for Generating Final Output Content
 """
 
 from typing import Dict, List, Any
-from pathlib import Path
 
 from ...shared.logger import logger
 from .output_styles import get_output_style
@@ -24,24 +23,44 @@ def build_filtered_file_tree(processed_files: List[ProcessedFile]) -> Dict:
     tree: Dict[str, Any] = {}
 
     for processed_file in processed_files:
-        # Split the path into parts
-        path_parts = Path(processed_file.path).parts
+        # Paths are stored POSIX-style; plain string splitting avoids a PurePath per file
+        *dir_parts, file_name = processed_file.path.replace("\\", "/").split("/")
         current_level = tree
 
         # Navigate/create the directory structure
-        for i, part in enumerate(path_parts):
-            if i == len(path_parts) - 1:
-                # This is the file (leaf node)
-                current_level[part] = ""
-            else:
-                # This is a directory
-                if part not in current_level:
-                    current_level[part] = {}
-                current_level = current_level[part]
+        for part in dir_parts:
+            next_level = current_level.get(part)
+            if not isinstance(next_level, dict):
+                next_level = current_level[part] = {}
+            current_level = next_level
+
+        # This is the file (leaf node)
+        current_level[file_name] = ""
 
     return tree
 
 
+def prepare_display_tree(processed_files: List[ProcessedFile], config: RepomixConfig, file_tree: Dict) -> Dict:
+    """Select the file tree shown in the directory structure section.
+
+    Compute this once and pass it to generate_output as display_tree when rendering
+    the same files more than once.
+
+    Args:
+        processed_files: List of files that will be included in the output
+        config: Configuration object
+        file_tree: Full file tree (used when the full directory structure is requested)
+
+    Returns:
+        Dictionary representing the file tree to display
+    """
+    if config.output.include_full_directory_structure:
+        # Use the full file tree passed in (already built without filtering)
+        return file_tree
+    # Build filtered tree showing only included files
+    return build_filtered_file_tree(processed_files)
+
+
 def generate_output(
     processed_files: List[ProcessedFile],
     config: RepomixConfig,
@@ -50,6 +69,9 @@ def generate_output(
     file_tree: Dict,
     git_diff_result: Any | None = None,
     git_log_result: Any | None = None,
+    total_chars: int | None = None,
+    total_tokens: int | None = None,
+    display_tree: Dict | None = None,
 ) -> str:
     """Generate output content
 
@@ -61,20 +83,23 @@ def generate_output(
         file_tree: File tree (full or filtered based on config)
         git_diff_result: Git diff result (optional)
         git_log_result: Git log result (optional)
+        total_chars: Pre-accumulated character total (optional, summed from file_char_counts if omitted)
+        total_tokens: Pre-accumulated token total (optional, summed from file_token_counts if omitted)
+        display_tree: Tree from prepare_display_tree (optional, computed here if omitted)
     Returns:
         Generated output content
     """
-    # Calculate statistics
-    total_chars = sum(file_char_counts.values())
-    total_tokens = sum(file_token_counts.values()) if config.output.calculate_tokens else 0
-
-    # Determine which file tree to use for display
-    if config.output.include_full_directory_structure:
-        # Use the full file tree passed in (already built without filtering)
-        display_tree = file_tree
-    else:
-        # Build filtered tree showing only included files
-        display_tree = build_filtered_file_tree(processed_files)
+    # Calculate statistics unless the caller already accumulated them while counting
+    if total_chars is None:
+        total_chars = sum(file_char_counts.values())
+    if not config.output.calculate_tokens:
+        total_tokens = 0
+    elif total_tokens is None:
+        total_tokens = sum(file_token_counts.values())
+
+    # Determine which file tree to use for display unless the caller already did
+    if display_tree is None:
+        display_tree = prepare_display_tree(processed_files, config, file_tree)
 
     # Handle JSON output style specially
     if config.output.style_enum == RepomixOutputStyle.JSON:
@@ -99,35 +124,37 @@ def generate_output(
         style = get_output_style(empty_config)
         assert style is not None
 
-    # Generate output content
+    # Generate output content as a list of sections joined once at the end
+    sections: List[str] = []
+
     # Only include file summary (header) if file_summary is enabled
     if config.output.file_summary:
-        output = style.generate_header()
-    else:
-        output = ""
+        sections.append(style.generate_header())
 
     # Add file tree if configured to do so
     if config.output.show_directory_structure and config.output.directory_structure:
-        output += style.generate_file_tree_section(display_tree)
+        sections.append(style.generate_file_tree_section(display_tree))
 
     # Add files section (unless --no-files is set)
     if config.output.files:
-        output += style.generate_files_section(processed_files, file_char_counts, file_token_counts)
+        sections.append(style.generate_files_section(processed_files, file_char_counts, file_token_counts))
 
     # Add git diff section if enabled
     if config.output.git.include_diffs and git_diff_result:
-        output += style.generate_git_diff_section(
-            work_tree_diff=git_diff_result.work_tree_diff_content,
-            staged_diff=git_diff_result.staged_diff_content,
+        sections.append(
+            style.generate_git_diff_section(
+                work_tree_diff=git_diff_result.work_tree_diff_content,
+                staged_diff=git_diff_result.staged_diff_content,
+            )
         )
 
     # Add git log section if enabled
     if config.output.git.include_logs and git_log_result:
-        output += style.generate_git_log_section(commits=git_log_result.commits)
+        sections.append(style.generate_git_log_section(commits=git_log_result.commits))
 
     # Add statistics
-    output += style.generate_statistics(len(processed_files), total_chars, total_tokens)
+    sections.append(style.generate_statistics(len(processed_files), total_chars, total_tokens))
 
-    output += style.generate_footer()
+    sections.append(style.generate_footer())
 
-    return output
+    return "".join(sections)
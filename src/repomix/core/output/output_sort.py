@@ -2,13 +2,16 @@
 Output Sort Module - Sorts files by git change count
 """
 
-from pathlib import Path
-from typing import Dict, List
+import os
+from collections import Counter
+from itertools import chain
+from typing import Counter as CounterType, Dict, List
 
 from ...shared.logger import logger
 from ...config.config_schema import RepomixConfig
 from ..file.file_types import ProcessedFile
-from ..file.git_command import exec_git_log_filenames, is_git_installed
+from ..file.git_log_handle import GitLogResult
+from ..file.git_command import clear_caches as clear_git_command_caches, is_git_installed, iter_git_log_filenames
 
 
 # Cache for git file change counts to avoid repeated git operations
@@ -24,7 +27,7 @@ def _build_cache_key(cwd: str, max_commits: int | None) -> str:
     return f"{cwd}:{max_commits if max_commits else 'default'}"
 
 
-def get_file_change_count(directory: str, max_commits: int = 100) -> Dict[str, int]:
+def get_file_change_count(directory: str, max_commits: int = 100) -> CounterType[str]:
     """Get file change counts from git log
 
     Args:
@@ -32,19 +35,14 @@ def get_file_change_count(directory: str, max_commits: int = 100) -> Dict[str, i
         max_commits: Maximum number of commits to check
 
     Returns:
-        Dictionary mapping file paths to change counts
+        Counter mapping file paths to change counts
     """
     try:
-        filenames = exec_git_log_filenames(directory, max_commits)
-
-        file_change_counts: Dict[str, int] = {}
-        for filename in filenames:
-            file_change_counts[filename] = file_change_counts.get(filename, 0) + 1
-
-        return file_change_counts
+        # Count while streaming so the raw log is never held in memory
+        return Counter(iter_git_log_filenames(directory, max_commits))
     except Exception as e:
         logger.trace(f"Failed to get file change counts: {e}")
-        return {}
+        return Counter()
 
 
 def _check_git_availability(cwd: str) -> bool:
@@ -61,16 +59,16 @@ def _check_git_availability(cwd: str) -> bool:
     if cached is not None:
         return cached
 
-    # Check if Git is installed
-    if not is_git_installed():
-        logger.trace("Git is not installed")
+    # Check if .git directory exists first: a stat is far cheaper than forking git
+    # exists() rather than isdir(): worktrees and submodules use a .git file
+    if not os.path.exists(os.path.join(cwd, ".git")):
+        logger.trace("Git folder not found")
         _git_availability_cache[cwd] = False
         return False
 
-    # Check if .git directory exists
-    git_folder_path = Path(cwd) / ".git"
-    if not git_folder_path.exists():
-        logger.trace("Git folder not found")
+    # Check if Git is installed
+    if not is_git_installed():
+        logger.trace("Git is not installed")
         _git_availability_cache[cwd] = False
         return False
 
@@ -106,15 +104,34 @@ def _get_file_change_counts(cwd: str, max_commits: int | None) -> Dict[str, int]
         file_change_counts = get_file_change_count(cwd, max_commits or 100)
         _file_change_counts_cache[cache_key] = file_change_counts
 
-        sorted_counts = sorted(file_change_counts.items(), key=lambda x: x[1], reverse=True)
         logger.trace(f"Git File change counts max commits: {max_commits}")
-        logger.trace(f"Git File change counts: {sorted_counts[:10]}...")  # Log top 10
+        logger.trace(f"Git File change counts: {file_change_counts.most_common(10)}...")  # Log top 10
 
         return file_change_counts
     except Exception:
         return None
 
 
+def _get_file_change_counts_from_log(git_log_result: GitLogResult, max_commits: int) -> Dict[str, int] | None:
+    """Derive file change counts from an already fetched git log.
+    Returns None if the log does not cover the requested number of commits.
+
+    Args:
+        git_log_result: Git log result with parsed commits
+        max_commits: Maximum number of commits to count
+
+    Returns:
+        Dictionary mapping file paths to change counts, or None if the log is insufficient
+    """
+    commits = git_log_result.commits
+    if len(commits) < max_commits:
+        # Fewer commits than needed is only the full history if the log was not truncated
+        if git_log_result.max_commits is None or len(commits) >= git_log_result.max_commits:
+            return None
+
+    return Counter(chain.from_iterable(commit.files for commit in commits[:max_commits]))
+
+
 def _sort_files_by_change_counts(files: List[ProcessedFile], file_change_counts: Dict[str, int]) -> List[ProcessedFile]:
     """Sort files by change count (files with more changes go to the bottom)
 
@@ -125,28 +142,46 @@ def _sort_files_by_change_counts(files: List[ProcessedFile], file_change_counts:
     Returns:
         Sorted list of processed files
     """
-    return sorted(files, key=lambda f: file_change_counts.get(f.path, 0))
+    # Look up every count once up front, then sort indices with a C-level key
+    # (list.__getitem__) instead of calling a Python lambda per comparison key
+    get_count = file_change_counts.get
+    counts = [get_count(f.path, 0) for f in files]
+    order = sorted(range(len(files)), key=counts.__getitem__)
+    return [files[i] for i in order]
 
 
 def sort_output_files(
     files: List[ProcessedFile],
     config: RepomixConfig,
+    git_log_result: GitLogResult | None = None,
 ) -> List[ProcessedFile]:
     """Sort files by git change count for output
 
     Args:
         files: List of processed files
         config: Repomix configuration
+        git_log_result: Git log already fetched for the same repository (optional).
+            When it covers enough commits, change counts are derived from it
+            instead of running a second git log.
 
     Returns:
         Sorted list of processed files
     """
+    if not files:
+        return files
+
     if not config.output.git.sort_by_changes:
         logger.trace("Git sort is not enabled")
         return files
 
-    cwd = config.cwd or "."
-    file_change_counts = _get_file_change_counts(cwd, config.output.git.sort_by_changes_max_commits)
+    max_commits = config.output.git.sort_by_changes_max_commits
+    file_change_counts = None
+    if git_log_result is not None:
+        file_change_counts = _get_file_change_counts_from_log(git_log_result, max_commits or 100)
+
+    if file_change_counts is None:
+        cwd = config.cwd or "."
+        file_change_counts = _get_file_change_counts(cwd, max_commits)
 
     if not file_change_counts:
         return files
@@ -159,3 +194,4 @@ def clear_caches() -> None:
     global _file_change_counts_cache, _git_availability_cache
     _file_change_counts_cache = {}
     _git_availability_cache = {}
+    clear_git_command_caches()
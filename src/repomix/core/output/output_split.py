@@ -2,13 +2,31 @@
 Output Split Module - Splits output into multiple parts based on size
 """
 
-from dataclasses import dataclass, field
+import sys
+from collections import deque
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import List, Callable, Any
+from typing import Deque, Dict, List, Callable, Any, Tuple
 
 from ...shared.logger import logger
+from ...shared.process_concurrency import get_process_concurrency
 from ...config.config_schema import RepomixConfig
 from ..file.file_types import ProcessedFile
+from .output_generate import build_filtered_file_tree
+from .output_styles import XmlStyle, get_output_style
+from .output_styles._utils import format_file_tree
+
+# Upper bound on how much the non-tree envelope (statistics counters) can grow per added group
+_ENVELOPE_GROWTH_SLACK_BYTES = 64
+
+# Group bodies are measured in a worker pool only when there is enough content to amortize its startup
+_PARALLEL_MIN_GROUPS = 8
+_PARALLEL_MIN_TOTAL_CHARS = 4 * 1024 * 1024
+
+# Below this many groups, parts keep the plain alphabetical sequential packing
+_BIN_PACKING_MIN_GROUPS = 3
 
 
 @dataclass
@@ -31,6 +49,7 @@ class OutputSplitPart:
     groups: List[OutputSplitGroup] = field(default_factory=list)
 
 
+@lru_cache(maxsize=65536)
 def get_root_entry(relative_file_path: str) -> str:
     """Get the root entry (first directory or file) from a path
 
@@ -40,10 +59,12 @@ def get_root_entry(relative_file_path: str) -> str:
     Returns:
         Root entry name
     """
-    # Normalize path separators
-    normalized = relative_file_path.replace("\\", "/")
-    parts = normalized.split("/")
-    return parts[0] if parts else normalized
+    # Normalize path separators only when needed (POSIX-style paths skip the copy)
+    if "\\" in relative_file_path:
+        relative_file_path = relative_file_path.replace("\\", "/")
+    # partition stops at the first separator instead of splitting the whole path; the result
+    # is interned so every path under a root shares one key object in the grouping dicts
+    return sys.intern(relative_file_path.partition("/")[0])
 
 
 def build_output_split_groups(processed_files: List[ProcessedFile], all_file_paths: List[str]) -> List[OutputSplitGroup]:
@@ -58,22 +79,24 @@ def build_output_split_groups(processed_files: List[ProcessedFile], all_file_pat
     """
     groups_by_root: dict[str, OutputSplitGroup] = {}
 
-    # Group all file paths by root entry
+    # Group all file paths by root entry (one lookup per path, one insertion on a miss)
     for file_path in all_file_paths:
         root_entry = get_root_entry(file_path)
-        if root_entry not in groups_by_root:
-            groups_by_root[root_entry] = OutputSplitGroup(root_entry=root_entry)
-        groups_by_root[root_entry].all_file_paths.append(file_path)
+        group = groups_by_root.get(root_entry)
+        if group is None:
+            group = groups_by_root[root_entry] = OutputSplitGroup(root_entry=root_entry)
+        group.all_file_paths.append(file_path)
 
     # Add processed files to their groups
     for processed_file in processed_files:
         root_entry = get_root_entry(processed_file.path)
-        if root_entry not in groups_by_root:
-            groups_by_root[root_entry] = OutputSplitGroup(root_entry=root_entry, all_file_paths=[processed_file.path])
-        groups_by_root[root_entry].processed_files.append(processed_file)
+        group = groups_by_root.get(root_entry)
+        if group is None:
+            group = groups_by_root[root_entry] = OutputSplitGroup(root_entry=root_entry, all_file_paths=[processed_file.path])
+        group.processed_files.append(processed_file)
 
     # Sort by root entry and return
-    return sorted(groups_by_root.values(), key=lambda g: g.root_entry)
+    return sorted(groups_by_root.values(), key=attrgetter("root_entry"))
 
 
 def build_split_output_file_path(base_file_path: str, part_index: int) -> str:
@@ -103,9 +126,79 @@ def get_utf8_byte_length(content: str) -> int:
     Returns:
         Byte length in UTF-8 encoding
     """
+    # ASCII text is one byte per character; isascii() scans without allocating a bytes copy
+    if content.isascii():
+        return len(content)
     return len(content.encode("utf-8"))
 
 
+def render_group_body(
+    group: OutputSplitGroup,
+    config: RepomixConfig,
+    file_char_counts: dict[str, int],
+    file_token_counts: dict[str, int],
+) -> str:
+    """Render only the per-file sections of a group (no header, tree, statistics or footer)
+
+    Args:
+        group: Group to render
+        config: Configuration selecting the output style
+        file_char_counts: Character counts per file
+        file_token_counts: Token counts per file
+
+    Returns:
+        Concatenated file sections of the group, as laid out in the files section
+    """
+    style = get_output_style(config) or get_output_style(RepomixConfig())
+    assert style is not None
+    return style.generate_files_body(group.processed_files, file_char_counts, file_token_counts)
+
+
+def _measure_group_body(args: Tuple[OutputSplitGroup, RepomixConfig, Dict[str, int], Dict[str, int]]) -> int:
+    """Worker entry point: render a group's file sections and return their UTF-8 byte length
+
+    Only the length is sent back, so the rendered text never crosses the process boundary.
+    """
+    group, config, file_char_counts, file_token_counts = args
+    return get_utf8_byte_length(render_group_body(group, config, file_char_counts, file_token_counts))
+
+
+def measure_group_bodies_parallel(
+    groups: List[OutputSplitGroup],
+    config: RepomixConfig,
+    file_char_counts: dict[str, int],
+    file_token_counts: dict[str, int],
+) -> Dict[str, int] | None:
+    """Measure the rendered file sections of every group in a worker pool
+
+    Args:
+        groups: Groups to measure
+        config: Configuration selecting the output style
+        file_char_counts: Character counts per file
+        file_token_counts: Token counts per file
+
+    Returns:
+        Body byte length per root entry, or None when the pool could not be used
+    """
+    # Each worker receives only the counts of its own group's files
+    tasks = [
+        (
+            group,
+            config,
+            {f.path: file_char_counts[f.path] for f in group.processed_files if f.path in file_char_counts},
+            {f.path: file_token_counts[f.path] for f in group.processed_files if f.path in file_token_counts},
+        )
+        for group in groups
+    ]
+    try:
+        with get_process_concurrency() as executor:
+            body_bytes = list(executor.map(_measure_group_body, tasks))
+    except Exception as error:
+        logger.trace(f"Parallel group rendering unavailable, measuring serially: {error}")
+        return None
+    return {group.root_entry: size for group, size in zip(groups, body_bytes, strict=True)}
+
+
 def make_chunk_config(base_config: RepomixConfig, part_index: int) -> RepomixConfig:
     """Create config for a chunk, disabling git diffs/logs for non-first chunks
 
@@ -119,13 +212,12 @@ def make_chunk_config(base_config: RepomixConfig, part_index: int) -> RepomixCon
     if part_index == 1:
         return base_config
 
-    # For non-first chunks, disable git diffs/logs to avoid repeating large sections
-    import copy
-
-    chunk_config = copy.deepcopy(base_config)
-    chunk_config.output.git.include_diffs = False
-    chunk_config.output.git.include_logs = False
-    return chunk_config
+    # For non-first chunks, disable git diffs/logs to avoid repeating large sections.
+    # Only the output/git path is copied; other sections are shared with the base config.
+    chunk_git = replace(base_config.output.git, include_diffs=False, include_logs=False)
+    # The legacy include_diffs flag is cleared too, or __post_init__ would re-enable git diffs
+    chunk_output = replace(base_config.output, git=chunk_git, include_diffs=False)
+    return replace(base_config, output=chunk_output)
 
 
 def generate_split_output_parts(
@@ -172,18 +264,36 @@ def generate_split_output_parts(
             progress_callback(message)
         logger.trace(message)
 
-    def render_groups(groups_to_render: List[OutputSplitGroup], part_index: int) -> str:
+    # Groups have distinct root entries, so a part's file tree is the union of disjoint
+    # per-group subtrees; each subtree is built once and merged instead of rebuilding
+    # the whole tree from every file in the part for each candidate
+    group_trees: Dict[str, Dict] = {}
+
+    def get_group_tree(group: OutputSplitGroup) -> Dict:
+        group_tree = group_trees.get(group.root_entry)
+        if group_tree is None:
+            group_tree = group_trees[group.root_entry] = build_filtered_file_tree(group.processed_files)
+        return group_tree
+
+    def build_part_tree(groups_in_part: List[OutputSplitGroup]) -> Dict:
+        part_tree: Dict = {}
+        for g in groups_in_part:
+            part_tree.update(get_group_tree(g))
+        return part_tree
+
+    def render_groups(
+        groups_to_render: List[OutputSplitGroup],
+        part_index: int,
+        config: RepomixConfig | None = None,
+        file_tree: Dict | None = None,
+    ) -> str:
         """Render a list of groups into output content"""
-        chunk_processed_files = []
-        for g in groups_to_render:
-            chunk_processed_files.extend(g.processed_files)
+        chunk_processed_files = [processed_file for g in groups_to_render for processed_file in g.processed_files]
 
-        chunk_config = make_chunk_config(base_config, part_index)
+        chunk_config = config or make_chunk_config(base_config, part_index)
 
-        # Build file tree from groups
-        from .output_generate import build_filtered_file_tree
-
-        file_tree = build_filtered_file_tree(chunk_processed_files)
+        if file_tree is None:
+            file_tree = build_part_tree(groups_to_render)
 
         return generate_output_fn(
             chunk_processed_files,
@@ -193,70 +303,244 @@ def generate_split_output_parts(
             file_tree,
             git_diff_result if part_index == 1 else None,
             git_log_result if part_index == 1 else None,
+            # The chunk tree is already filtered to this part's files
+            display_tree=file_tree,
         )
 
-    parts: List[OutputSplitPart] = []
-    current_groups: List[OutputSplitGroup] = []
-    current_content = ""
-    current_bytes = 0
-
-    for group in groups:
-        part_index = len(parts) + 1
-        next_groups = current_groups + [group]
-        report_progress(f"Generating output... (part {part_index}) evaluating {group.root_entry}")
-
-        next_content = render_groups(next_groups, part_index)
-        next_bytes = get_utf8_byte_length(next_content)
-
-        if next_bytes <= max_bytes_per_part:
-            current_groups = next_groups
-            current_content = next_content
-            current_bytes = next_bytes
-            continue
-
-        if not current_groups:
+    # Each group's file sections are rendered once; candidate parts are then sized as
+    # envelope (everything but the file sections) + the sum of their groups' body bytes,
+    # instead of re-serializing every file already in the part for each new group
+    style = get_output_style(base_config) or get_output_style(RepomixConfig())
+    assert style is not None
+    include_files = base_config.output.files
+    files_wrapper_bytes = 0
+    if include_files:
+        files_wrapper_bytes = get_utf8_byte_length(style.generate_files_section([], file_char_counts, file_token_counts))
+
+    body_bytes_by_root: Dict[str, int] = {}
+    if include_files and len(groups) >= _PARALLEL_MIN_GROUPS:
+        total_chars = sum(len(f.content) for g in groups for f in g.processed_files)
+        if total_chars >= _PARALLEL_MIN_TOTAL_CHARS:
+            report_progress(f"Generating output... rendering {len(groups)} groups in parallel")
+            body_bytes_by_root = measure_group_bodies_parallel(groups, base_config, file_char_counts, file_token_counts) or {}
+    envelope_configs: Dict[bool, RepomixConfig] = {}
+
+    def get_body_bytes(group: OutputSplitGroup) -> int:
+        body_bytes = body_bytes_by_root.get(group.root_entry)
+        if body_bytes is None:
+            body_bytes = 0
+            if include_files:
+                body_bytes = get_utf8_byte_length(render_group_body(group, base_config, file_char_counts, file_token_counts))
+            body_bytes_by_root[group.root_entry] = body_bytes
+        return body_bytes
+
+    tree_bytes_by_root: Dict[str, int] = {}
+
+    def get_envelope_growth_bound(group: OutputSplitGroup) -> int:
+        """Upper bound on how much adding a group can grow the envelope of a part"""
+        tree_bytes = tree_bytes_by_root.get(group.root_entry)
+        if tree_bytes is None:
+            # Top-level subtrees format independently, so this is the group's share of the tree
+            # section; doubled to cover escaping in XML/JSON documents
+            group_tree = get_group_tree(group)
+            tree_bytes = 2 * get_utf8_byte_length(format_file_tree(group_tree))
+            if isinstance(style, XmlStyle):
+                # XML lays the tree out as elements rather than the indented text format
+                tree_bytes += get_utf8_byte_length(style.generate_file_tree_section(group_tree))
+            tree_bytes_by_root[group.root_entry] = tree_bytes
+        return tree_bytes + _ENVELOPE_GROWTH_SLACK_BYTES
+
+    def render_envelope_bytes(groups_to_render: List[OutputSplitGroup], part_index: int, file_tree: Dict) -> int:
+        """Measure everything but the file sections of a candidate part"""
+        is_first = part_index == 1
+        envelope_config = envelope_configs.get(is_first)
+        if envelope_config is None:
+            chunk_config = make_chunk_config(base_config, part_index)
+            envelope_config = replace(chunk_config, output=replace(chunk_config.output, files=False))
+            envelope_configs[is_first] = envelope_config
+
+        return get_utf8_byte_length(render_groups(groups_to_render, part_index, envelope_config, file_tree))
+
+    envelope_base_bytes: Dict[bool, int] = {}
+
+    def get_envelope_base_bytes(part_index: int) -> int:
+        """Envelope of a part with no files; header, footer and git sections are rendered once per part kind"""
+        is_first = part_index == 1
+        base_bytes = envelope_base_bytes.get(is_first)
+        if base_bytes is None:
+            base_bytes = envelope_base_bytes[is_first] = render_envelope_bytes([], part_index, {})
+        return base_bytes
+
+    def finalize_part(part_groups: List[OutputSplitGroup], part_index: int, pending_groups: Deque[OutputSplitGroup]) -> OutputSplitPart:
+        """Render a part exactly, handing trailing groups back if the estimate fell short"""
+        while True:
+            content = render_groups(part_groups, part_index)
+            byte_length = get_utf8_byte_length(content)
+            if byte_length <= max_bytes_per_part or len(part_groups) == 1:
+                break
+            pending_groups.appendleft(part_groups.pop())
+
+        if byte_length > max_bytes_per_part:
             raise ValueError(
-                f"Cannot split output: root entry '{group.root_entry}' exceeds max size. Part size {next_bytes:,} bytes > limit {max_bytes_per_part:,} bytes."
+                f"Cannot split output: root entry '{part_groups[0].root_entry}' exceeds max size. "
+                f"Part size {byte_length:,} bytes > limit {max_bytes_per_part:,} bytes."
             )
 
-        # Finalize current part and start a new one
-        parts.append(
-            OutputSplitPart(
-                index=part_index,
-                file_path=build_split_output_file_path(base_config.output.file_path, part_index),
-                content=current_content,
-                byte_length=current_bytes,
-                groups=current_groups,
-            )
+        return OutputSplitPart(
+            index=part_index,
+            file_path=build_split_output_file_path(base_config.output.file_path, part_index),
+            content=content,
+            byte_length=byte_length,
+            groups=part_groups,
         )
 
-        new_part_index = len(parts) + 1
-        report_progress(f"Generating output... (part {new_part_index}) evaluating {group.root_entry}")
-
-        single_group_content = render_groups([group], new_part_index)
-        single_group_bytes = get_utf8_byte_length(single_group_content)
-
-        if single_group_bytes > max_bytes_per_part:
-            raise ValueError(
-                f"Cannot split output: root entry '{group.root_entry}' exceeds max size. "
-                f"Part size {single_group_bytes:,} bytes > limit {max_bytes_per_part:,} bytes."
-            )
-
-        current_groups = [group]
-        current_content = single_group_content
-        current_bytes = single_group_bytes
-
-    # Add final part
-    if current_groups:
-        final_index = len(parts) + 1
-        parts.append(
-            OutputSplitPart(
-                index=final_index,
-                file_path=build_split_output_file_path(base_config.output.file_path, final_index),
-                content=current_content,
-                byte_length=current_bytes,
-                groups=current_groups,
-            )
+    def pack_first_fit_decreasing() -> List[List[OutputSplitGroup]] | None:
+        """Pack groups into parts by first-fit-decreasing on upper-bound size estimates
+
+        Returns:
+            Groups per part, or None when some group may not fit a part on its own
+        """
+        # Later parts never carry more envelope than the first one, so its empty envelope bounds them all
+        capacity = max_bytes_per_part - files_wrapper_bytes - get_envelope_base_bytes(1)
+        sized_groups = sorted(
+            ((get_body_bytes(g) + get_envelope_growth_bound(g), g) for g in groups),
+            key=itemgetter(0),
+            reverse=True,
         )
-
-    return parts
+        if sized_groups[0][0] > capacity:
+            return None
+
+        bins: List[List[OutputSplitGroup]] = []
+        remaining: List[int] = []
+        for size, group in sized_groups:
+            for bin_index, space in enumerate(remaining):
+                if space >= size:
+                    bins[bin_index].append(group)
+                    remaining[bin_index] = space - size
+                    break
+            else:
+                bins.append([group])
+                remaining.append(capacity - size)
+
+        # Keep root entries alphabetical within each part and order parts by their first root entry
+        for part_groups in bins:
+            part_groups.sort(key=attrgetter("root_entry"))
+        bins.sort(key=lambda part_groups: part_groups[0].root_entry)
+        return bins
+
+    def pack_sequentially(groups_to_pack: List[OutputSplitGroup], first_part_index: int) -> List[List[OutputSplitGroup]]:
+        """Pack groups in order, closing a part as soon as the next group does not fit
+
+        Args:
+            groups_to_pack: Groups in output order
+            first_part_index: Index of the part the first group goes into
+
+        Returns:
+            Groups per part
+        """
+        pending: Deque[OutputSplitGroup] = deque(groups_to_pack)
+        planned_parts: List[List[OutputSplitGroup]] = []
+        current_groups: List[OutputSplitGroup] = []
+        current_body_bytes = 0
+        current_tree: Dict = {}
+        # Bounds on the current part's envelope size; equal right after an exact envelope render
+        envelope_low = envelope_high = 0
+
+        while pending or current_groups:
+            part_index = first_part_index + len(planned_parts)
+            if pending:
+                group = pending[0]
+                report_progress(f"Generating output... (part {part_index}) evaluating {group.root_entry}")
+
+                # Part size is envelope + files-section wrapper + body bytes; only the envelope
+                # needs rendering, and even that is skipped when the bounds already decide
+                group_body_bytes = get_body_bytes(group)
+                group_tree = get_group_tree(group)
+                fixed_bytes = files_wrapper_bytes + current_body_bytes + group_body_bytes
+                growth_bound = get_envelope_growth_bound(group)
+
+                # Try the group in place rather than copying the part's group list per candidate
+                current_groups.append(group)
+                current_tree.update(group_tree)
+
+                if len(current_groups) == 1:
+                    # The first group of a part is always placed, so only its envelope bounds are needed;
+                    # they start from the cached empty-part envelope instead of a fresh render
+                    envelope_low = get_envelope_base_bytes(part_index)
+                    envelope_high = envelope_low + growth_bound
+                    fits = envelope_low + fixed_bytes <= max_bytes_per_part
+                elif envelope_low + fixed_bytes > max_bytes_per_part:
+                    # Adding files never shrinks the envelope, so this cannot fit
+                    fits = False
+                elif envelope_high + growth_bound + fixed_bytes <= max_bytes_per_part:
+                    # Fits even in the worst case; accept without rendering
+                    envelope_high += growth_bound
+                    fits = True
+                else:
+                    envelope_bytes = render_envelope_bytes(current_groups, part_index, current_tree)
+                    fits = envelope_bytes + fixed_bytes <= max_bytes_per_part
+                    if fits:
+                        envelope_low = envelope_high = envelope_bytes
+
+                if fits:
+                    current_body_bytes += group_body_bytes
+                    pending.popleft()
+                    continue
+
+                if len(current_groups) == 1:
+                    # A lone group is judged by its exact render, which raises if it cannot fit at all
+                    pending.popleft()
+                else:
+                    current_groups.pop()
+                    for root_name in group_tree:
+                        del current_tree[root_name]
+
+            # Close the current part (or the last one once every group is placed)
+            planned_parts.append(current_groups)
+            current_groups = []
+            current_body_bytes = 0
+            current_tree = {}
+            envelope_low = envelope_high = 0
+
+        return planned_parts
+
+    def render_parts(planned_parts: List[List[OutputSplitGroup]]) -> List[OutputSplitPart]:
+        """Render planned parts, re-packing the rest in order if a part has to hand groups back"""
+        parts: List[OutputSplitPart] = []
+        queue: Deque[List[OutputSplitGroup]] = deque(planned_parts)
+        while queue:
+            part_groups = queue.popleft()
+            report_progress(f"Generating output... (part {len(parts) + 1}) rendering {len(part_groups)} root entries")
+            returned_groups: Deque[OutputSplitGroup] = deque()
+            parts.append(finalize_part(part_groups, len(parts) + 1, returned_groups))
+            if returned_groups:
+                rest = [*returned_groups, *(group for later_groups in queue for group in later_groups)]
+                queue = deque(pack_sequentially(rest, len(parts) + 1))
+        return parts
+
+    # Output that fits in one part is never split. Body bytes are exact and the envelope only
+    # grows with files, so the whole output is rendered only when it might fit
+    lower_bound_bytes = get_envelope_base_bytes(1) + files_wrapper_bytes + sum(get_body_bytes(g) for g in groups)
+    if lower_bound_bytes <= max_bytes_per_part:
+        content = render_groups(groups, 1, file_tree=build_part_tree(groups))
+        byte_length = get_utf8_byte_length(content)
+        if byte_length <= max_bytes_per_part:
+            return [
+                OutputSplitPart(
+                    index=1,
+                    file_path=build_split_output_file_path(base_config.output.file_path, 1),
+                    content=content,
+                    byte_length=byte_length,
+                    groups=list(groups),
+                )
+            ]
+
+    planned_parts = pack_sequentially(groups, 1)
+    # Reordering only pays off once there are enough groups to fill more than one part, and its
+    # parts are kept only when the over-estimated sizes still need fewer of them
+    if len(planned_parts) > 1 and len(groups) >= _BIN_PACKING_MIN_GROUPS:
+        bins = pack_first_fit_decreasing()
+        if bins is not None and len(bins) < len(planned_parts):
+            planned_parts = bins
+
+    return render_parts(planned_parts)
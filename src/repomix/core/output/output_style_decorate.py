@@ -155,6 +155,32 @@ class OutputStyle(ABC):
         """
         pass
 
+    def generate_files_body(
+        self,
+        files: List[ProcessedFile],
+        file_char_counts: Dict[str, int],
+        file_token_counts: Dict[str, int],
+    ) -> str:
+        """Generate the file sections of a files section, without its heading or wrapper
+
+        Args:
+            files: List of processed files
+            file_char_counts: Dictionary of character counts per file
+            file_token_counts: Dictionary of token counts per file
+
+        Returns:
+            File sections as they are laid out inside the files section
+        """
+        return "".join(
+            self.generate_file_section(
+                file_path=file.path,
+                content=file.content,
+                char_count=file_char_counts.get(file.path, 0),
+                token_count=file_token_counts.get(file.path, 0),
+            )
+            for file in files
+        )
+
     @abstractmethod
     def generate_statistics(self, total_files: int, total_chars: int, total_tokens: int) -> str:
         """Generate statistics
@@ -3,12 +3,57 @@ JSON Output Style Module - Implements JSON Format Output
 """
 
 import json
-from typing import Dict, List, Any
+from typing import Dict, List, Any, TextIO
 
 from ._utils import format_file_tree
 from ...file.file_types import ProcessedFile
 from ..output_style_decorate import OutputStyle
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+def dumps_json_document(json_document: Dict[str, Any]) -> str:
+    """Serialize a JSON output document with two-space indentation
+
+    Uses orjson when it is installed, which produces the same text as
+    json.dumps(indent=2, ensure_ascii=False) considerably faster.
+
+    Args:
+        json_document: Document to serialize
+
+    Returns:
+        JSON formatted string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(json_document, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            # e.g. lone surrogates in file content, which only the stdlib encoder accepts
+            pass
+    return json.dumps(json_document, indent=2, ensure_ascii=False)
+
+
+def dump_json_document(json_document: Dict[str, Any], fp: TextIO) -> None:
+    """Write a JSON output document to a text stream
+
+    Same text as dumps_json_document. Without orjson the stdlib encoder streams
+    chunks into fp, so the full document string is never held in memory.
+
+    Args:
+        json_document: Document to serialize
+        fp: Writable text stream
+    """
+    if orjson is not None:
+        try:
+            fp.write(orjson.dumps(json_document, option=orjson.OPT_INDENT_2).decode("utf-8"))
+            return
+        except TypeError:
+            pass
+    json.dump(json_document, fp, indent=2, ensure_ascii=False)
+
 
 class JsonStyle(OutputStyle):
     """JSON Output Style"""
@@ -31,8 +76,17 @@ class JsonStyle(OutputStyle):
         return ""
 
     def generate_file_section(self, file_path: str, content: str, char_count: int, token_count: int) -> str:
-        """Generate JSON format file section - not used directly"""
-        return ""
+        """Generate a JSON files-object member as it is laid out in the full document
+
+        Not used by generate_json_output; split output uses it to size groups of files.
+        """
+        file_entry: Dict[str, Any] = {"content": content}
+        if self.config.output.show_file_stats:
+            file_entry["charCount"] = char_count
+            file_entry["tokenCount"] = token_count
+
+        entry_json = json.dumps(file_entry, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+        return f"    {json.dumps(file_path, ensure_ascii=False)}: {entry_json},\n"
 
     def generate_statistics(self, total_files: int, total_chars: int, total_tokens: int) -> str:
         """Generate JSON format statistics - not used directly"""
@@ -70,6 +124,90 @@ class JsonStyle(OutputStyle):
         Returns:
             JSON formatted output string
         """
+        return dumps_json_document(
+            self.build_json_document(
+                files,
+                file_char_counts,
+                file_token_counts,
+                file_tree,
+                total_files,
+                total_chars,
+                total_tokens,
+                git_diff_result,
+                git_log_result,
+            )
+        )
+
+    def write_json_output(
+        self,
+        fp: TextIO,
+        files: List[ProcessedFile],
+        file_char_counts: Dict[str, int],
+        file_token_counts: Dict[str, int],
+        file_tree: Dict,
+        total_files: int,
+        total_chars: int,
+        total_tokens: int,
+        git_diff_result: Any = None,
+        git_log_result: Any = None,
+    ) -> None:
+        """Write complete JSON output to a text stream instead of returning it as a string
+
+        Args:
+            fp: Writable text stream
+            files: List of processed files
+            file_char_counts: File character count statistics
+            file_token_counts: File token count statistics
+            file_tree: File tree structure
+            total_files: Total number of files
+            total_chars: Total character count
+            total_tokens: Total token count
+            git_diff_result: Git diff result (optional)
+            git_log_result: Git log result (optional)
+        """
+        dump_json_document(
+            self.build_json_document(
+                files,
+                file_char_counts,
+                file_token_counts,
+                file_tree,
+                total_files,
+                total_chars,
+                total_tokens,
+                git_diff_result,
+                git_log_result,
+            ),
+            fp,
+        )
+
+    def build_json_document(
+        self,
+        files: List[ProcessedFile],
+        file_char_counts: Dict[str, int],
+        file_token_counts: Dict[str, int],
+        file_tree: Dict,
+        total_files: int,
+        total_chars: int,
+        total_tokens: int,
+        git_diff_result: Any = None,
+        git_log_result: Any = None,
+    ) -> Dict[str, Any]:
+        """Build the JSON output document
+
+        Args:
+            files: List of processed files
+            file_char_counts: File character count statistics
+            file_token_counts: File token count statistics
+            file_tree: File tree structure
+            total_files: Total number of files
+            total_chars: Total character count
+            total_tokens: Total token count
+            git_diff_result: Git diff result (optional)
+            git_log_result: Git log result (optional)
+
+        Returns:
+            JSON output document
+        """
         json_document: Dict[str, Any] = {}
 
         # Add file summary section
@@ -92,16 +230,21 @@ class JsonStyle(OutputStyle):
 
         # Add files section
         if self.config.output.files:
-            json_document["files"] = {}
-            for file in files:
-                file_entry: Dict[str, Any] = {"content": file.content}
-
-                # Add file stats if configured
-                if self.config.output.show_file_stats:
-                    file_entry["charCount"] = file_char_counts.get(file.path, 0)
-                    file_entry["tokenCount"] = file_token_counts.get(file.path, 0)
-
-                json_document["files"][file.path] = file_entry
+            # Add file stats if configured; each branch is a single dict comprehension
+            if self.config.output.show_file_stats:
+                # Bound lookups avoid re-resolving .get on both count dicts for every file
+                char_count_of = file_char_counts.get
+                token_count_of = file_token_counts.get
+                json_document["files"] = {
+                    file.path: {
+                        "content": file.content,
+                        "charCount": char_count_of(file.path, 0),
+                        "tokenCount": token_count_of(file.path, 0),
+                    }
+                    for file in files
+                }
+            else:
+                json_document["files"] = {file.path: {"content": file.content} for file in files}
 
         # Add git diffs if available
         if git_diff_result and self.config.output.git.include_diffs:
@@ -128,7 +271,7 @@ class JsonStyle(OutputStyle):
             "totalTokens": total_tokens,
         }
 
-        return json.dumps(json_document, indent=2, ensure_ascii=False)
+        return json_document
 
     def _get_file_format_description(self) -> str:
         """Get file format description for JSON output"""
@@ -2,6 +2,7 @@
 XML Output Style Module - Implements XML Format Output
 """
 
+from io import StringIO
 from xml.dom import minidom
 from typing import Dict, List, Any
 import xml.etree.ElementTree as ET
@@ -45,10 +46,27 @@ class XmlStyle(OutputStyle):
         Returns:
             XML format files section content
         """
-        # Create root element for files section
-        files_elem = ET.Element("repository_files")
+        if not files:
+            return self._pretty_print(ET.tostring(ET.Element("repository_files"), encoding="unicode"))
+        return f"<repository_files>\n{self.generate_files_body(files, file_char_counts, file_token_counts)}</repository_files>\n"
 
-        # Generate section for each file
+    def generate_files_body(
+        self,
+        files: List[ProcessedFile],
+        file_char_counts: Dict[str, int],
+        file_token_counts: Dict[str, int],
+    ) -> str:
+        """Generate the file elements of the files section, indented as inside <repository_files>
+
+        Args:
+            files: List of processed files
+            file_char_counts: Dictionary of character counts per file
+            file_token_counts: Dictionary of token counts per file
+
+        Returns:
+            XML file elements, pretty-printed one level deep
+        """
+        writer = StringIO()
         for file in files:
             file_content = self.generate_file_section(
                 file_path=file.path,
@@ -56,13 +74,10 @@ class XmlStyle(OutputStyle):
                 char_count=file_char_counts.get(file.path, 0),
                 token_count=file_token_counts.get(file.path, 0),
             )
-            # Parse the file content back to XML and append to files element
-            file_xml = ET.fromstring(file_content)
-            files_elem.append(file_xml)
-
-        # Convert to string and format
-        xml_str = ET.tostring(files_elem, encoding="unicode")
-        return self._pretty_print(xml_str)
+            # Parse the file section back and lay it out as a child of the files element
+            file_xml = ET.tostring(ET.fromstring(file_content), encoding="unicode")
+            minidom.parseString(file_xml).documentElement.writexml(writer, indent="  ", addindent="  ", newl="\n")
+        return writer.getvalue()
 
     def generate_file_section(self, file_path: str, content: str, char_count: int, token_count: int) -> str:
         """Generate XML format file section
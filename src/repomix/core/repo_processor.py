@@ -1,19 +1,22 @@
+import os
 from pathlib import Path
-from fnmatch import fnmatch
+import fnmatch
 from dataclasses import dataclass
-from typing import Dict, List, Any, Sequence
+from typing import Dict, List, Any, Sequence, Tuple
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 
+import tiktoken
 
 from ..config.config_load import load_config
 from ..config.config_schema import RepomixConfig
 from ..core.file.file_collect import collect_files
-from ..core.file.file_types import RawFile
+from ..core.file.file_types import ProcessedFile, RawFile
 from ..core.file.file_process import process_files
 from ..core.file.file_search import search_files, get_ignore_patterns
-from ..core.output.output_generate import generate_output
+from ..core.output.output_generate import generate_output, prepare_display_tree
 from ..core.security.security_check import check_files, SuspiciousFileResult
 from ..shared.error_handle import RepomixError
 from ..shared.fs_utils import create_temp_directory, cleanup_temp_directory
@@ -21,14 +24,120 @@ from ..shared.git_utils import format_git_url, clone_repository
 
 logger = logging.getLogger(__name__)
 
+# Directory names always skipped by the ignore-aware tree builder
+_COMMON_IGNORED_DIRS = frozenset(
+    {
+        "node_modules",
+        ".git",
+        ".svn",
+        ".hg",
+        ".cache",
+        "__pycache__",
+        ".pytest_cache",
+        "venv",
+        ".venv",
+        "env",
+        ".env",
+        "build",
+        "dist",
+        ".idea",
+        ".vscode",
+        "logs",
+        "tmp",
+        "cache",
+    }
+)
+
+# Extensions (without the dot) of compiled artifacts left out of the ignore-aware tree
+_COMPILED_FILE_EXTENSIONS = frozenset({"pyc", "pyo", "class", "o", "so", "dll"})
+
+# Upper bound on roots walked concurrently in multi-directory runs
+_MAX_ROOT_WALK_THREADS = 8
+
+# Characters per write when saving output, bounding the encoded copy held at once
+_OUTPUT_WRITE_CHUNK_CHARS = 1 << 20
+
+# Files longer than this many characters are tokenized in line-aligned chunks of at most
+# _TOKEN_COUNT_CHUNK_CHARS, bounding the encoder's buffers for huge generated files
+_TOKEN_COUNT_CHUNK_THRESHOLD_CHARS = 512_000
+_TOKEN_COUNT_CHUNK_CHARS = 256_000
+
+
+# fnmatch.fnmatch compares case-insensitively where the platform normalizes case
+_GLOB_CASE_INSENSITIVE = os.path.normcase("A") == "a"
+_GLOB_META_RE = re.compile(r"[*?\[]")
+
+
+def compile_glob_patterns(patterns: Sequence[str]) -> re.Pattern | None:
+    """Compile glob patterns into a single regular expression matching any of them.
+
+    Args:
+        patterns: fnmatch-style glob patterns
+
+    Returns:
+        Combined compiled pattern, or None when there is nothing to match
+    """
+    flags = re.IGNORECASE if _GLOB_CASE_INSENSITIVE else 0
+    translated = []
+    for pattern in patterns:
+        regex = fnmatch.translate(pattern)
+        try:
+            re.compile(regex, flags)
+        except (re.error, OverflowError, RecursionError):
+            # A pattern that cannot be compiled never matches, as with fnmatch before
+            logger.debug(f"Skipping invalid ignore pattern '{pattern}'")
+            continue
+        translated.append(regex)
 
-@lru_cache(maxsize=1000)
-def cached_fnmatch(filename: str, pattern: str) -> bool:
-    """Cached version of fnmatch for better performance."""
+    if not translated:
+        return None
     try:
-        return fnmatch(filename, pattern)
-    except (re.error, OverflowError, RecursionError):
-        return False
+        return re.compile("|".join(translated), flags)
+    except (re.error, OverflowError, RecursionError) as e:
+        logger.debug(f"Failed to combine ignore patterns: {e}")
+        return None
+
+
+@lru_cache(maxsize=256)
+def _compile_glob_tuple(patterns: Tuple[str, ...]) -> re.Pattern | None:
+    """Cached compile_glob_patterns for the pattern subsets used while walking a tree."""
+    return compile_glob_patterns(patterns)
+
+
+@lru_cache(maxsize=4096)
+def _glob_literal_prefix(pattern: str) -> Tuple[str, bool]:
+    """Split off the part of a glob pattern before its first wildcard, case-folded like matching.
+
+    Returns:
+        Tuple of (literal prefix, whether the pattern has any wildcard)
+    """
+    meta = _GLOB_META_RE.search(pattern)
+    prefix = pattern[: meta.start()] if meta else pattern
+    return (prefix.lower() if _GLOB_CASE_INSENSITIVE else prefix), meta is not None
+
+
+def narrow_glob_patterns(patterns: Tuple[str, ...], rel_dir_prefix: str) -> Tuple[str, ...]:
+    """Keep only the glob patterns that could match some path below a directory.
+
+    A pattern whose literal (wildcard-free) prefix diverges from the directory's relative
+    path can never match anything inside it, so the whole subtree skips that pattern.
+
+    Args:
+        patterns: fnmatch-style glob patterns
+        rel_dir_prefix: Directory path relative to the tree root, ending with "/"
+
+    Returns:
+        Patterns that may still match inside the directory
+    """
+    if _GLOB_CASE_INSENSITIVE:
+        rel_dir_prefix = rel_dir_prefix.lower()
+    narrowed = []
+    for pattern in patterns:
+        literal, has_wildcard = _glob_literal_prefix(pattern)
+        # Either the pattern names something inside this directory, or its wildcards start at or above it
+        if literal.startswith(rel_dir_prefix) or (has_wildcard and rel_dir_prefix.startswith(literal)):
+            narrowed.append(pattern)
+    return tuple(narrowed)
 
 
 def build_full_file_tree(directory: str | Path) -> Dict:
@@ -43,61 +152,60 @@ def build_full_file_tree(directory: str | Path) -> Dict:
     Returns:
         Dictionary representing the complete file tree
     """
-    return _build_full_tree_recursive(Path(directory))
+    return _build_full_tree(os.fspath(directory))
 
 
-def _build_full_tree_recursive(directory: Path, base_dir: Path | None = None) -> Dict:
-    """Recursively build full file tree without filtering."""
-    tree: Dict[str, Any] = {}
-    if base_dir is None:
-        base_dir = directory
+def _build_full_tree(root_directory: str) -> Dict:
+    """Build full file tree without filtering, walking directories with an explicit stack."""
+    root_tree: Dict[str, Any] = {}
+    # Each directory's dict is created in its parent when the parent is scanned, so entry
+    # order matches the sorted listing regardless of the order directories are visited in
+    stack: List[Tuple[str, Dict[str, Any]]] = [(root_directory, root_tree)]
 
-    try:
-        entries = sorted(directory.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-    except (OSError, PermissionError):
-        return tree
+    while stack:
+        directory, tree = stack.pop()
 
-    for path in entries:
+        # scandir entries carry the file type from the directory listing, so is_dir() needs no stat()
+        # call; it is read once per entry and shared by the sort key and the loop. The order
+        # (directories first, then case-insensitive names) is what the tree sections render.
+        # Listing or type errors are OSErrors and skip just this directory.
         try:
-            path_name = path.name
-            is_dir = path.is_dir()
+            with os.scandir(directory) as it:
+                entries = sorted(((entry.is_dir(), entry.name.lower(), entry) for entry in it), key=lambda x: (not x[0], x[1]))
+        except OSError:
+            continue
 
+        for is_dir, _, entry in entries:
             if is_dir:
-                # Recursively build subtree for all directories
-                subtree = _build_full_tree_recursive(path, base_dir)
-                tree[path_name] = subtree if subtree else {}
+                # Every directory is kept, empty ones as {}
+                subtree: Dict[str, Any] = {}
+                tree[entry.name] = subtree
+                stack.append((entry.path, subtree))
             else:
-                tree[path_name] = ""
-        except Exception as e:
-            logger.debug(f"Error processing path '{path}': {e}")
-            continue
+                tree[entry.name] = ""
 
-    return tree
+    return root_tree
 
 
 def build_file_tree_with_ignore(directory: str | Path, config: RepomixConfig) -> Dict:
     """Builds a file tree, respecting ignore patterns - HEAVILY OPTIMIZED for large projects."""
     ignore_patterns = get_ignore_patterns(directory, config)
+    dir_exact_matches, dir_patterns, file_patterns = _classify_ignore_patterns(tuple(ignore_patterns))
+    return _build_file_tree_super_optimized(os.fspath(directory), dir_exact_matches, dir_patterns, file_patterns)
 
-    # OPTIMIZATION: Pre-compile common ignore patterns for faster matching
-    common_ignores = {
-        "node_modules",
-        ".git",
-        "__pycache__",
-        ".pytest_cache",
-        "venv",
-        ".venv",
-        "env",
-        ".env",
-        "build",
-        "dist",
-        ".idea",
-        ".vscode",
-        "logs",
-        "tmp",
-        "cache",
-    }
 
+@lru_cache(maxsize=32)
+def _classify_ignore_patterns(ignore_patterns: Tuple[str, ...]) -> Tuple[frozenset, Tuple[str, ...], Tuple[str, ...]]:
+    """Normalize ignore patterns and split them by how they are matched.
+
+    Cached per pattern list, so multi-root runs sharing ignore rules classify them once.
+
+    Args:
+        ignore_patterns: Raw ignore patterns
+
+    Returns:
+        Tuple of (exact directory names, directory glob patterns, file glob patterns)
+    """
     # Separate patterns by type for faster processing
     dir_exact_matches = set()  # Exact directory names to ignore
     dir_patterns = []  # Pattern-based directory ignores
@@ -122,89 +230,179 @@ def build_file_tree_with_ignore(directory: str | Path, config: RepomixConfig) ->
             # Also check as directory pattern
             dir_patterns.append(pattern)
 
-    # Add common ignores to exact matches for super fast filtering
-    dir_exact_matches.update(common_ignores)
+    # Add common and VCS/cache directories to exact matches, so one set lookup filters them all
+    dir_exact_matches.update(_COMMON_IGNORED_DIRS)
 
-    return _build_file_tree_super_optimized(Path(directory), dir_exact_matches, dir_patterns, file_patterns)
+    return frozenset(dir_exact_matches), tuple(dir_patterns), tuple(file_patterns)
 
 
 def _build_file_tree_super_optimized(
-    directory: Path,
-    dir_exact_matches: set,
-    dir_patterns: List[str],
-    file_patterns: List[str],
-    base_dir: Path | None = None,
+    root_directory: str,
+    dir_exact_matches: frozenset,
+    dir_patterns: Tuple[str, ...],
+    file_patterns: Tuple[str, ...],
 ) -> Dict:
-    """Super optimized recursive file tree builder with aggressive pruning."""
-    tree = {}
-    if base_dir is None:
-        base_dir = directory
+    """Super optimized file tree builder with aggressive pruning, walking directories with an explicit stack."""
+    root_tree: Dict[str, Any] = {}
+    # (directory, its tree dict, relative path prefix, patterns that can still match below it)
+    stack: List[Tuple[str, Dict[str, Any], str, Tuple[str, ...], Tuple[str, ...]]] = [
+        (root_directory, root_tree, "", dir_patterns, file_patterns),
+    ]
+    # (parent tree, name, subtree) for every directory added, in the order they were added
+    added_dirs: List[Tuple[Dict[str, Any], str, Dict[str, Any]]] = []
+
+    while stack:
+        directory, tree, rel_prefix, dir_patterns, file_patterns = stack.pop()
+
+        # Each bucket is matched with one combined regex instead of an fnmatch call per pattern;
+        # subtrees no pattern can reach get no regex at all
+        dir_regex = _compile_glob_tuple(dir_patterns) if dir_patterns else None
+        file_regex = _compile_glob_tuple(file_patterns) if file_patterns else None
+
+        # scandir entries carry the file type from the directory listing, so is_dir() needs no stat()
+        # call; entries are split by type up front so each loop below handles one kind only
+        dir_entries: List[os.DirEntry] = []
+        file_entries: List[os.DirEntry] = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        (dir_entries if entry.is_dir() else file_entries).append(entry)
+                    except OSError as e:
+                        logger.debug(f"Error processing path '{entry.path}': {e}")
+        except OSError:
+            continue
 
-    try:
-        entries = list(directory.iterdir())
-    except (OSError, PermissionError):
-        return tree
+        for entry in dir_entries:
+            path_name = entry.name
+
+            # SUPER OPTIMIZATION 1: Check exact matches first (O(1) lookup)
+            if path_name in dir_exact_matches:
+                continue  # Skip immediately - no need to even calculate relative path
+
+            # Relative paths are built by string concatenation down the tree
+            rel_path = rel_prefix + path_name
+
+            # Check directory patterns
+            if dir_regex is not None and dir_regex.match(rel_path):
+                continue
+
+            # Pruning is decided here, so ignored directories are never pushed
+            sub_prefix = rel_path + "/"
+            subtree: Dict[str, Any] = {}
+            tree[path_name] = subtree
+            added_dirs.append((tree, path_name, subtree))
+            stack.append(
+                (
+                    entry.path,
+                    subtree,
+                    sub_prefix,
+                    narrow_glob_patterns(dir_patterns, sub_prefix),
+                    narrow_glob_patterns(file_patterns, sub_prefix),
+                )
+            )
 
-    for path in entries:
-        try:
-            path_name = path.name
-            is_dir = path.is_dir()
+        for entry in file_entries:
+            path_name = entry.name
 
-            if is_dir:
-                # SUPER OPTIMIZATION 1: Check exact matches first (O(1) lookup)
-                if path_name in dir_exact_matches:
-                    continue  # Skip immediately - no need to even calculate relative path
-
-                # SUPER OPTIMIZATION 2: Early skip for hidden/temp directories
-                if path_name.startswith(".") and path_name in {
-                    ".git",
-                    ".svn",
-                    ".hg",
-                    ".cache",
-                }:
-                    continue
-
-                # Only calculate relative path if needed for pattern matching
-                rel_path = path.relative_to(base_dir).as_posix()
-
-                # Check directory patterns
-                should_ignore_dir = False
-                for pattern in dir_patterns:
-                    if cached_fnmatch(rel_path, pattern):
-                        should_ignore_dir = True
-                        break
-
-                if should_ignore_dir:
-                    continue
-
-                # Recursively build subtree
-                subtree = _build_file_tree_super_optimized(path, dir_exact_matches, dir_patterns, file_patterns, base_dir)
-                if subtree:
-                    tree[path_name] = subtree
-            else:
-                # SUPER OPTIMIZATION 3: Quick file extension checks
-                if path_name.endswith((".pyc", ".pyo", ".class", ".o", ".so", ".dll")):
-                    continue  # Skip compiled files immediately
-
-                # Only check file patterns if needed
-                if file_patterns:
-                    rel_path = path.relative_to(base_dir).as_posix()
-                    should_ignore_file = False
-                    for pattern in file_patterns:
-                        if cached_fnmatch(rel_path, pattern):
-                            should_ignore_file = True
-                            break
-
-                    if not should_ignore_file:
-                        tree[path_name] = ""
-                else:
-                    tree[path_name] = ""
+            # SUPER OPTIMIZATION 2: Quick file extension checks
+            dot = path_name.rfind(".")
+            if dot >= 0 and path_name[dot + 1 :] in _COMPILED_FILE_EXTENSIONS:
+                continue  # Skip compiled files immediately
 
-        except Exception as e:
-            logger.debug(f"Error processing path '{path}': {e}")
-            continue
+            # Only check file patterns if needed
+            if file_regex is None or not file_regex.match(rel_prefix + path_name):
+                tree[path_name] = ""
+
+    # Drop directories that ended up with no files; children were added after their
+    # parents, so walking backwards empties nested chains bottom-up
+    for parent, name, subtree in reversed(added_dirs):
+        if not subtree:
+            del parent[name]
+
+    return root_tree
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """Get a tiktoken encoding, loaded once per name for the life of the process."""
+    return tiktoken.get_encoding(encoding_name)
+
+
+def _split_for_token_count(content: str, chunk_chars: int | None = None) -> List[str]:
+    """Split content into chunks of at most chunk_chars, cutting after newlines where possible.
 
-    return tree
+    BPE merges do not cross line breaks in practice, so the summed chunk counts match
+    the whole-file count closely; lines longer than a chunk are cut at the limit.
+
+    Args:
+        content: Text to split
+        chunk_chars: Maximum characters per chunk (defaults to _TOKEN_COUNT_CHUNK_CHARS)
+
+    Returns:
+        Chunks that concatenate back to content
+    """
+    if chunk_chars is None:
+        chunk_chars = _TOKEN_COUNT_CHUNK_CHARS
+    chunks = []
+    start = 0
+    length = len(content)
+    while length - start > chunk_chars:
+        cut = content.rfind("\n", start, start + chunk_chars) + 1
+        if cut <= start:
+            cut = start + chunk_chars
+        chunks.append(content[start:cut])
+        start = cut
+    chunks.append(content[start:])
+    return chunks
+
+
+def _count_tokens(token_encoding: tiktoken.Encoding, processed_files: List[ProcessedFile]) -> List[int]:
+    """Count tokens for every file, encoding them in one multi-threaded batch.
+
+    tiktoken releases the GIL while encoding a batch, so files are tokenized in parallel.
+    Files over _TOKEN_COUNT_CHUNK_THRESHOLD_CHARS are split into line-aligned chunks that
+    join the batch, so a single huge file is encoded in parallel pieces too.
+    If the batch fails (e.g. a file contains a special token), files are encoded one by
+    one so only the offending files count as zero.
+
+    Args:
+        token_encoding: Encoding used to tokenize file contents
+        processed_files: Files to count
+
+    Returns:
+        Token count per file, in the order of processed_files
+    """
+    pieces: List[str] = []
+    owners: List[int] = []
+    for index, processed_file in enumerate(processed_files):
+        content = processed_file.content
+        if len(content) > _TOKEN_COUNT_CHUNK_THRESHOLD_CHARS:
+            chunks = _split_for_token_count(content)
+            pieces.extend(chunks)
+            owners.extend([index] * len(chunks))
+        else:
+            pieces.append(content)
+            owners.append(index)
+
+    try:
+        token_counts = [0] * len(processed_files)
+        for owner, tokens in zip(owners, token_encoding.encode_batch(pieces, num_threads=os.cpu_count() or 1), strict=True):
+            token_counts[owner] += len(tokens)
+        return token_counts
+    except Exception as e:
+        logger.debug(f"Batch token calculation failed, counting files individually: {e}")
+
+    token_counts = []
+    for processed_file in processed_files:
+        content = processed_file.content
+        chunks = _split_for_token_count(content) if len(content) > _TOKEN_COUNT_CHUNK_THRESHOLD_CHARS else [content]
+        try:
+            token_counts.append(sum(len(token_encoding.encode(chunk)) for chunk in chunks))
+        except Exception as e:
+            logger.debug(f"Token calculation failed for {processed_file.path}: {e}")
+            token_counts.append(0)
+    return token_counts
 
 
 @dataclass
@@ -272,15 +470,13 @@ class RepoProcessor:
     def process(self, write_output: bool = True) -> RepoProcessorResult:
         """Process the code repository and return results."""
         if self.config and self.config.output.calculate_tokens:
-            import tiktoken
-
             encoding_name = getattr(self.config, 'token_count', None)
             encoding_name = encoding_name.encoding if encoding_name else "o200k_base"
             try:
-                token_encoding = tiktoken.get_encoding(encoding_name)
+                token_encoding = _get_encoding(encoding_name)
             except Exception:
                 logger.warning(f"Unknown encoding '{encoding_name}', falling back to o200k_base")
-                token_encoding = tiktoken.get_encoding("o200k_base")
+                token_encoding = _get_encoding("o200k_base")
         else:
             token_encoding = None
 
@@ -301,15 +497,12 @@ class RepoProcessor:
 
             # Use predefined file paths if available (stdin mode)
             if self._predefined_file_paths is not None:
-                # Convert absolute paths to relative paths based on directory
-                dir_path = Path(self.directories[0]).resolve()
-                relative_paths = []
-                for abs_path in self._predefined_file_paths:
-                    try:
-                        rel_path = Path(abs_path).relative_to(dir_path)
-                        relative_paths.append(str(rel_path))
-                    except ValueError:
-                        relative_paths.append(abs_path)
+                # Convert absolute paths to relative paths based on directory. Stdin paths are
+                # already resolved, so stripping the directory prefix is enough; paths outside
+                # the directory are kept as they are.
+                dir_prefix = os.path.join(Path(self.directories[0]).resolve(), "")
+                prefix_len = len(dir_prefix)
+                relative_paths = [abs_path[prefix_len:] if abs_path.startswith(dir_prefix) else abs_path for abs_path in self._predefined_file_paths]
 
                 raw_files = collect_files(relative_paths, self.directories[0])
                 file_tree = self._build_tree_for_directory(self.directories[0])
@@ -327,39 +520,30 @@ class RepoProcessor:
 
             processed_files = process_files(raw_files, self.config)
 
-            file_char_counts: Dict[str, int] = {}
-            file_token_counts: Dict[str, int] = {}
-            total_chars = 0
-            total_tokens = 0
-
-            # Optimize character and token counting
-            if self.config.output.calculate_tokens and token_encoding:
-                for processed_file in processed_files:
-                    char_count = len(processed_file.content)
-                    file_char_counts[processed_file.path] = char_count
-                    total_chars += char_count
-                    try:
-                        token_count = len(token_encoding.encode(processed_file.content))
-                        file_token_counts[processed_file.path] = token_count
-                        total_tokens += token_count
-                    except Exception as e:
-                        logger.debug(f"Token calculation failed for {processed_file.path}: {e}")
-                        file_token_counts[processed_file.path] = 0
-            else:
-                for processed_file in processed_files:
-                    char_count = len(processed_file.content)
-                    file_char_counts[processed_file.path] = char_count
-                    file_token_counts[processed_file.path] = 0
-                    total_chars += char_count
-
+            # Drop suspicious files before counting so totals only cover files in the output
             suspicious_files_results = []
             if self.config.security.enable_security_check:
                 file_contents = {file.path: file.content for file in raw_files}
                 file_paths = [file.path for file in raw_files]
                 # Use first directory for security check base path
                 suspicious_files_results = check_files(self.directories[0], file_paths, file_contents)
-                suspicious_file_paths = {result.file_path for result in suspicious_files_results}
-                processed_files = [file for file in processed_files if file.path not in suspicious_file_paths]
+                if suspicious_files_results:
+                    suspicious_file_paths = {result.file_path for result in suspicious_files_results}
+                    processed_files = [file for file in processed_files if file.path not in suspicious_file_paths]
+
+            # Count per file in bulk: lengths via map(len) and dicts built from zipped columns
+            paths = [processed_file.path for processed_file in processed_files]
+            char_counts = list(map(len, (processed_file.content for processed_file in processed_files)))
+            total_chars = sum(char_counts)
+            file_char_counts: Dict[str, int] = dict(zip(paths, char_counts, strict=True))
+
+            if self.config.output.calculate_tokens and token_encoding:
+                token_counts = _count_tokens(token_encoding, processed_files)
+                total_tokens = sum(token_counts)
+                file_token_counts: Dict[str, int] = dict(zip(paths, token_counts, strict=True))
+            else:
+                total_tokens = 0
+                file_token_counts = dict.fromkeys(paths, 0)
 
             output_content = generate_output(
                 processed_files,
@@ -367,6 +551,9 @@ class RepoProcessor:
                 file_char_counts,
                 file_token_counts,
                 file_tree,
+                total_chars=total_chars,
+                total_tokens=total_tokens,
+                display_tree=prepare_display_tree(processed_files, self.config, file_tree),
             )
 
             if write_output:
@@ -403,24 +590,30 @@ class RepoProcessor:
             Tuple of (merged raw_files, merged file_tree)
         """
         assert self.config is not None
+        config = self.config
         all_raw_files = []
         merged_tree: Dict[str, Any] = {}
 
-        for directory in self.directories:
+        def walk_root(directory: str | Path) -> Tuple[List[str], Dict]:
+            # Directory walks are I/O bound, so roots are searched and scanned concurrently
+            return search_files(directory, config).file_paths, self._build_tree_for_directory(directory)
+
+        with ThreadPoolExecutor(max_workers=min(len(self.directories), _MAX_ROOT_WALK_THREADS)) as executor:
+            walk_results = list(executor.map(walk_root, self.directories))
+
+        for directory, (file_paths, dir_tree) in zip(self.directories, walk_results, strict=True):
             dir_path = Path(directory).resolve()
             root_label = dir_path.name or str(dir_path)
 
-            # Search and collect files for this directory
-            search_result = search_files(directory, self.config)
-            dir_raw_files = collect_files(search_result.file_paths, directory)
+            # Files are collected one root at a time; collect_files already reads in a worker pool
+            dir_raw_files = collect_files(file_paths, directory)
 
             # Prefix file paths with root label for multi-root
             for raw_file in dir_raw_files:
                 prefixed_path = f"{root_label}/{raw_file.path}"
                 all_raw_files.append(RawFile(path=prefixed_path, content=raw_file.content))
 
-            # Build tree for this directory and nest under root label
-            dir_tree = self._build_tree_for_directory(directory)
+            # Nest this directory's tree under its root label
             merged_tree[root_label] = dir_tree
 
         return all_raw_files, merged_tree
@@ -440,4 +633,8 @@ class RepoProcessor:
         else:
             output_path = Path(self.config.output.file_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(output_content, encoding="utf-8")
+            # Write in slices so only one slice at a time is held in encoded form,
+            # rather than a UTF-8 copy of the whole output next to the string
+            with open(output_path, "w", encoding="utf-8") as f:
+                for start in range(0, len(output_content), _OUTPUT_WRITE_CHUNK_CHARS):
+                    f.write(output_content[start : start + _OUTPUT_WRITE_CHUNK_CHARS])
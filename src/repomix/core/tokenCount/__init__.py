@@ -8,6 +8,7 @@ from .token_count_tree import (
     TreeNode,
     build_token_count_tree,
     format_token_count_tree,
+    iter_token_count_tree,
     report_token_count_tree,
 )
 
@@ -17,5 +18,6 @@ __all__ = [
     "TreeNode",
     "build_token_count_tree",
     "format_token_count_tree",
+    "iter_token_count_tree",
     "report_token_count_tree",
 ]
@@ -2,102 +2,113 @@
 Token Count Tree Module - Builds and displays token count tree structure
 """
 
-from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Iterator, List, NamedTuple, Sequence, Tuple
 
 from ...config.config_schema import RepomixConfig
 from ..file.file_types import ProcessedFile
 
 
-@dataclass
-class FileTokenInfo:
+class FileTokenInfo(NamedTuple):
     """Token information for a single file"""
 
     name: str
     tokens: int
 
 
-@dataclass
-class FileWithTokens:
-    """File path with token count"""
+class FileWithTokens(NamedTuple):
+    """File path with token count (a plain (path, tokens) tuple works too)"""
 
     path: str
     tokens: int
 
 
+# Tree drawing pieces: connectors before an entry's name, and indents for its children
+_CONNECTOR_MID = "├── "
+_CONNECTOR_LAST = "└── "
+_INDENT_MID = "│   "
+_INDENT_LAST = "    "
+
+
 class TreeNode:
-    """Tree node for token count structure"""
+    """Tree node for token count structure
+
+    Files are stored as parallel lists of names and token counts, so filtering and
+    summing run over plain values; the files property gives the FileTokenInfo view.
+    """
+
+    __slots__ = ("file_names", "file_tokens", "token_sum", "children")
 
     def __init__(self):
-        self.files: List[FileTokenInfo] = []
+        self.file_names: List[str] = []
+        self.file_tokens: List[int] = []
         self.token_sum: int = 0
         self.children: Dict[str, TreeNode] = {}
 
+    @property
+    def files(self) -> List[FileTokenInfo]:
+        """Files directly in this directory, built from the parallel name and token lists"""
+        return list(map(FileTokenInfo, self.file_names, self.file_tokens))
 
-def build_token_count_tree(files_with_tokens: List[FileWithTokens]) -> TreeNode:
+
+def build_token_count_tree(files_with_tokens: Sequence[FileWithTokens | Tuple[str, int]]) -> TreeNode:
     """Build a tree structure with token counts
 
+    Files are inserted in path order (compared component by component), so every node's
+    children and files come out already sorted by name.
+
     Args:
-        files_with_tokens: List of files with their token counts
+        files_with_tokens: Files with their token counts, as FileWithTokens or (path, tokens) tuples
 
     Returns:
         Root TreeNode with the complete structure
     """
     root = TreeNode()
 
-    for file in files_with_tokens:
-        if not file.path or not isinstance(file.path, str):
+    split_files = []
+    for path, tokens in files_with_tokens:
+        if not path or not isinstance(path, str):
             continue
 
-        # Always use forward slash for consistency across platforms
-        parts = file.path.replace("\\", "/").split("/")
-        file_name = parts.pop() if parts else file.path
-        if not file_name:
+        # Always use forward slash for consistency across platforms; the containment check
+        # is a single fast scan that lets POSIX paths skip the replace entirely
+        if "\\" in path:
+            path = path.replace("\\", "/")
+        parts = path.split("/")
+        if not parts[-1]:
             continue
+        split_files.append((parts, tokens))
+
+    split_files.sort(key=itemgetter(0))
+
+    for parts, tokens in split_files:
+        file_name = parts.pop()
 
-        # Navigate/create the directory structure
+        # Navigate/create the directory structure, adding the file's tokens to every
+        # directory on its path so the sums are complete once all files are inserted
         current = root
+        current.token_sum += tokens
         for part in parts:
-            if part not in current.children:
-                current.children[part] = TreeNode()
-            current = current.children[part]
+            child = current.children.get(part)
+            if child is None:
+                child = current.children[part] = TreeNode()
+            current = child
+            current.token_sum += tokens
 
         # Add the file
-        current.files.append(FileTokenInfo(name=file_name, tokens=file.tokens))
-
-    # Calculate token sums for each directory
-    _calculate_token_sums(root)
+        current.file_names.append(file_name)
+        current.file_tokens.append(tokens)
 
     return root
 
 
-def _calculate_token_sums(node: TreeNode) -> int:
-    """Calculate token sums for a node and all its children
-
-    Args:
-        node: TreeNode to calculate sums for
-
-    Returns:
-        Total token count for this node and all children
-    """
-    total_tokens = 0
-
-    # Add tokens from files in this directory
-    total_tokens += sum(f.tokens for f in node.files)
-
-    # Add tokens from subdirectories
-    for child in node.children.values():
-        total_tokens += _calculate_token_sums(child)
-
-    node.token_sum = total_tokens
-    return total_tokens
-
-
 def format_token_count_tree(
     node: TreeNode,
     min_token_count: int = 0,
     prefix: str = "",
     is_root: bool = True,
+    compress_chains: bool = True,
 ) -> str:
     """Format token count tree as a string
 
@@ -106,62 +117,111 @@ def format_token_count_tree(
         min_token_count: Minimum token count to display
         prefix: Prefix for indentation
         is_root: Whether this is the root node
+        compress_chains: Whether to show chains of directories that only contain one
+            subdirectory (e.g. src/main/java/com/example/) as a single entry
 
     Returns:
         Formatted string representation of the tree
     """
-    lines: List[str] = []
-
-    # Get directories filtered by minimum token count
-    entries = [(name, child) for name, child in node.children.items() if child.token_sum >= min_token_count]
+    return "\n".join(iter_token_count_tree(node, min_token_count, prefix, is_root, compress_chains))
 
-    # Get files filtered by minimum token count
-    files = [f for f in node.files if f.tokens >= min_token_count]
 
-    # Sort entries alphabetically
-    entries.sort(key=lambda x: x[0])
-    files.sort(key=lambda x: x.name)
+def iter_token_count_tree(
+    node: TreeNode,
+    min_token_count: int = 0,
+    prefix: str = "",
+    is_root: bool = True,
+    compress_chains: bool = True,
+) -> Iterator[str]:
+    """Yield the lines of the formatted token count tree one at a time
 
-    # Display files first
-    for i, file in enumerate(files):
-        is_last_file = i == len(files) - 1 and len(entries) == 0
-        connector = "└── " if is_last_file else "├── "
-        token_info = f"({file.tokens:,} tokens)"
+    Lines can be written out as they are produced, so only the pending entries along the
+    current path are held in memory rather than the whole formatted tree.
 
-        if is_root and prefix == "":
-            lines.append(f"{connector}{file.name} {token_info}")
-        else:
-            lines.append(f"{prefix}{connector}{file.name} {token_info}")
+    Args:
+        node: TreeNode to format
+        min_token_count: Minimum token count to display
+        prefix: Prefix for indentation
+        is_root: Whether this is the root node
+        compress_chains: Whether to merge single-subdirectory chains into one entry
 
-    # Display directories
-    for i, (name, child_node) in enumerate(entries):
-        is_last_entry = i == len(entries) - 1
-        connector = "└── " if is_last_entry else "├── "
-        token_info = f"({child_node.token_sum:,} tokens)"
+    Yields:
+        Formatted tree lines, without trailing newlines
+    """
+    # Items are either a finished line or a (node, prefix) pair still to be expanded; a
+    # node's items are pushed in reverse so they pop in display order
+    stack: List[str | Tuple[TreeNode, str]] = [(node, prefix)]
+    emitted = False
+    # Token counts are never negative, so a threshold of zero or less keeps everything
+    filtering = min_token_count > 0
+
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            emitted = True
+            yield item
+            continue
 
-        if is_root and prefix == "":
-            lines.append(f"{connector}{name}/ {token_info}")
-        else:
-            lines.append(f"{prefix}{connector}{name}/ {token_info}")
+        current, current_prefix = item
 
-        # Prepare prefix for children
-        if is_root and prefix == "":
-            child_prefix = "    " if is_last_entry else "│   "
+        # Get directories and files filtered by minimum token count; both are already in
+        # name order, as build_token_count_tree inserts them sorted. Subdirectories below the
+        # threshold are dropped here, so their subtrees are never expanded; without a
+        # threshold nothing can be dropped and the comparisons are skipped.
+        if filtering:
+            entries = [(name, child) for name, child in current.children.items() if child.token_sum >= min_token_count]
+            files = [(name, tokens) for name, tokens in zip(current.file_names, current.file_tokens, strict=True) if tokens >= min_token_count]
         else:
-            child_prefix = prefix + ("    " if is_last_entry else "│   ")
-
-        child_output = format_token_count_tree(child_node, min_token_count, child_prefix, False)
-        if child_output:
-            lines.append(child_output)
+            entries = list(current.children.items())
+            files = list(zip(current.file_names, current.file_tokens, strict=True))
+
+        # Line and child prefixes only depend on this node's prefix, so they are built once
+        # here instead of once per line
+        mid_prefix = current_prefix + _CONNECTOR_MID
+        last_prefix = current_prefix + _CONNECTOR_LAST
+        mid_child_prefix = current_prefix + _INDENT_MID
+        last_child_prefix = current_prefix + _INDENT_LAST
+
+        items: List[str | Tuple[TreeNode, str]] = []
+
+        # Display files first
+        last_file_index = -1 if entries else len(files) - 1
+        for i, (name, tokens) in enumerate(files):
+            line_prefix = last_prefix if i == last_file_index else mid_prefix
+            items.append(f"{line_prefix}{name} ({_format_token_count(tokens)} tokens)")
+
+        # Display directories, each followed directly by its children
+        last_entry_index = len(entries) - 1
+        for i, (name, child_node) in enumerate(entries):
+            if compress_chains:
+                # A directory with no files and a single subdirectory has the same token sum
+                # as that subdirectory, so the pair is shown as one entry without losing anything
+                while not child_node.file_names and len(child_node.children) == 1:
+                    ((sub_name, child_node),) = child_node.children.items()
+                    name = f"{name}/{sub_name}"
+
+            if i == last_entry_index:
+                items.append(f"{last_prefix}{name}/ ({_format_token_count(child_node.token_sum)} tokens)")
+                items.append((child_node, last_child_prefix))
+            else:
+                items.append(f"{mid_prefix}{name}/ ({_format_token_count(child_node.token_sum)} tokens)")
+                items.append((child_node, mid_child_prefix))
+
+        items.reverse()
+        stack.extend(items)
 
     # If this is the root and it's empty, show a message
-    if is_root and len(files) == 0 and len(entries) == 0:
+    if is_root and not emitted:
         if min_token_count > 0:
-            lines.append(f"No files or directories found with {min_token_count}+ tokens.")
+            yield f"No files or directories found with {min_token_count}+ tokens."
         else:
-            lines.append("No files found.")
+            yield "No files found."
+
 
-    return "\n".join(lines)
+@lru_cache(maxsize=4096)
+def _format_token_count(tokens: int) -> str:
+    """Format a token count with thousands separators, cached since small counts repeat often"""
+    return f"{tokens:,}"
 
 
 def report_token_count_tree(
@@ -189,11 +249,10 @@ def report_token_count_tree(
         min_token_count = 0
 
     # Build files with tokens list
-    files_with_tokens: List[FileWithTokens] = []
-    for file in processed_files:
-        tokens = file_token_counts.get(file.path)
-        if tokens is not None:
-            files_with_tokens.append(FileWithTokens(path=file.path, tokens=tokens))
+    token_count_of = file_token_counts.get
+    files_with_tokens: List[FileWithTokens] = [
+        FileWithTokens(file.path, tokens) for file in processed_files if (tokens := token_count_of(file.path)) is not None
+    ]
 
     # Build the tree
     tree = build_token_count_tree(files_with_tokens)
@@ -204,7 +263,7 @@ def report_token_count_tree(
     if min_token_count > 0:
         output_lines.append(f"Showing entries with {min_token_count}+ tokens:")
 
-    tree_output = format_token_count_tree(tree, min_token_count)
-    output_lines.append(tree_output)
+    # Tree lines go straight into the report, which is joined once
+    output_lines.extend(iter_token_count_tree(tree, min_token_count))
 
     return "\n".join(output_lines)
@@ -2,6 +2,8 @@
 
 from typing import Dict
 
+from . import queries
+
 # Mapping of languages to their query module names
 lang2query: Dict[str, str] = {
     "python": "query_python",
@@ -30,3 +32,20 @@ def get_query_module_name(language: str) -> str | None:
         Query module name if available, None otherwise
     """
     return lang2query.get(language)
+
+
+def get_query_string(language: str) -> str | None:
+    """Get the tree-sitter query source for a given language.
+
+    Each query module exports its query under the module's own name (e.g. query_csharp).
+
+    Args:
+        language: Language name (e.g., 'python', 'c_sharp')
+
+    Returns:
+        Query source if available, None otherwise
+    """
+    query_module_name = lang2query.get(language)
+    if query_module_name is None:
+        return None
+    return getattr(queries, query_module_name, None)
@@ -6,7 +6,7 @@ from typing import Dict, Optional
 from tree_sitter import Parser, Query
 
 from .load_language import language_loader
-from .lang2query import get_query_module_name
+from .lang2query import get_query_module_name, get_query_string
 from .parse_strategies.parse_strategy import ParseStrategy, ParseStrategyFactory
 
 
@@ -18,7 +18,7 @@ class LanguageParser:
 
     _instance: Optional["LanguageParser"] = None
     _parsers: Dict[str, Parser] = {}
-    _queries: Dict[str, Query] = {}
+    _queries: Dict[str, Query | None] = {}
     _strategies: Dict[str, ParseStrategy] = {}
 
     def __new__(cls) -> "LanguageParser":
@@ -47,6 +47,9 @@ class LanguageParser:
     def get_query(self, language: str) -> Query | None:
         """Get or create a query for the given language.
 
+        The query is compiled once per language and shared by every file; languages
+        without a usable query are remembered too, so they are not retried per file.
+
         Args:
             language: Language name
 
@@ -56,44 +59,32 @@ class LanguageParser:
         if language in self._queries:
             return self._queries[language]
 
+        # Remember the language as having no query until one compiles
+        self._queries[language] = None
+
         query_module_name = get_query_module_name(language)
         if query_module_name is None:
+            logger.debug(f"No query mapping for {language}")
             return None
 
-        try:
-            # Import the query module dynamically
-            module = __import__(
-                f"repomix.core.tree_sitter.queries.{query_module_name}",
-                fromlist=[query_module_name],
-            )
-
-            # Get the query string from the module
-            query_attr_name = f"query_{language}"
-            if hasattr(module, query_attr_name):
-                query_string = getattr(module, query_attr_name)
-            else:
-                # Try alternative naming
-                query_string = getattr(module, "query", None)
-
-            if query_string is None:
-                logger.warning(f"No query string found in {query_module_name}")
-                return None
-
-            # Get the language to create the query
-            tree_sitter_language = language_loader.get_language(language)
-            if tree_sitter_language is None:
-                return None
-
-            query = tree_sitter.Query(tree_sitter_language, query_string)
-            self._queries[language] = query
-            return query
+        query_string = get_query_string(language)
+        if query_string is None:
+            logger.warning(f"No query string found in {query_module_name}")
+            return None
 
-        except ImportError:
-            logger.warning(f"Query module {query_module_name} not found")
+        # Get the language to create the query
+        tree_sitter_language = language_loader.get_language(language)
+        if tree_sitter_language is None:
             return None
+
+        try:
+            query = tree_sitter.Query(tree_sitter_language, query_string)
         except Exception as e:
             logger.error(f"Error loading query for {language}: {e}")
-            return None
+            query = None
+
+        self._queries[language] = query
+        return query
 
     def get_strategy(self, language: str) -> ParseStrategy:
         """Get or create a parse strategy for the given language.
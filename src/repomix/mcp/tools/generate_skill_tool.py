@@ -1,8 +1,9 @@
 """Generate skill MCP tool - Creates Claude Agent Skills from codebase."""
 
 import os
+import stat
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
@@ -47,6 +48,48 @@ class GenerateSkillOutput(BaseModel):
     total_lines: int = Field(description="Total lines of code")
 
 
+def _list_generated_files(skill_output_dir: str) -> List[str]:
+    """List generated skill files relative to the output directory, in os.walk order.
+
+    scandir entries carry the file type from the directory listing, so no per-entry stat()
+    is needed. Symlinked directories are listed but not descended into, as with os.walk.
+
+    Args:
+        skill_output_dir: Directory the skill was written to
+
+    Returns:
+        Relative paths of the generated files
+    """
+    generated_files: List[str] = []
+    # (absolute directory, its path relative to skill_output_dir)
+    stack: List[Tuple[str, str]] = [(skill_output_dir, "")]
+
+    while stack:
+        directory, rel_dir = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs: List[Tuple[str, str]] = []
+        for entry in entries:
+            rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                generated_files.append(rel_path)
+            elif not entry.is_symlink():
+                subdirs.append((entry.path, rel_path))
+
+        # Pushed in reverse so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+    return generated_files
+
+
 def register_generate_skill_tool(server: FastMCP) -> None:
     """Register the generate_skill tool with the MCP server."""
 
@@ -66,7 +109,9 @@ def register_generate_skill_tool(server: FastMCP) -> None:
     ) -> Dict[str, Any]:
         """Generate a Claude Agent Skill from a codebase."""
 
-        if not is_mcp_silent_mode():
+        silent = is_mcp_silent_mode()
+
+        if not silent:
             logger.log("🔨 MCP Tool Called: generate_skill")
             logger.log(f"   📁 Directory: {directory}")
             if skill_name:
@@ -77,30 +122,33 @@ def register_generate_skill_tool(server: FastMCP) -> None:
                 logger.log(f"   ❌ Ignore: {ignore_patterns}")
 
         try:
-            # Validate directory exists
+            # Validate directory exists, with a single stat for both checks
             directory_path = Path(directory)
 
-            if not directory_path.exists():
+            try:
+                directory_mode = os.stat(directory_path).st_mode
+            except OSError:
                 error_msg = f"Directory does not exist: {directory}"
-                if not is_mcp_silent_mode():
+                if not silent:
                     logger.warn(f"   ⚠️ {error_msg}")
                 return build_mcp_tool_error_response({"error_message": error_msg})
 
-            if not directory_path.is_dir():
+            if not stat.S_ISDIR(directory_mode):
                 error_msg = f"Path is not a directory: {directory}"
-                if not is_mcp_silent_mode():
+                if not silent:
                     logger.warn(f"   ⚠️ {error_msg}")
                 return build_mcp_tool_error_response({"error_message": error_msg})
 
-            if not is_mcp_silent_mode():
+            if not silent:
                 logger.log("   🏗️ Creating workspace...")
 
             # Create temporary workspace for skill output
             temp_dir = await create_tool_workspace()
             skill_output_dir = os.path.join(temp_dir, "skill")
-            os.makedirs(skill_output_dir, exist_ok=True)
+            # The workspace is freshly created, so the skill directory cannot exist yet
+            os.mkdir(skill_output_dir)
 
-            if not is_mcp_silent_mode():
+            if not silent:
                 logger.log(f"   📝 Skill will be saved to: {skill_output_dir}")
 
             # Determine skill name
@@ -116,7 +164,7 @@ def register_generate_skill_tool(server: FastMCP) -> None:
                 quiet=True,
             )
 
-            if not is_mcp_silent_mode():
+            if not silent:
                 logger.log("   🔄 Processing repository for skill generation...")
 
             # Run the CLI to process the codebase
@@ -124,24 +172,19 @@ def register_generate_skill_tool(server: FastMCP) -> None:
 
             if not result:
                 error_msg = "Failed to generate skill output"
-                if not is_mcp_silent_mode():
+                if not silent:
                     logger.error(f"   ❌ {error_msg}")
                 return build_mcp_tool_error_response({"error_message": error_msg})
 
-            # List generated files
-            generated_files = []
-            for root, _dirs, files in os.walk(skill_output_dir):
-                for file in files:
-                    rel_path = os.path.relpath(os.path.join(root, file), skill_output_dir)
-                    generated_files.append(rel_path)
+            generated_files = _list_generated_files(skill_output_dir)
 
-            if not is_mcp_silent_mode():
+            if not silent:
                 logger.log("   ✅ Skill generation completed!")
                 logger.log(f"   📊 Files processed: {result.pack_result.total_files}")
                 logger.log(f"   📝 Generated files: {len(generated_files)}")
 
-            # Calculate total lines from file char counts (approximate)
-            total_lines = sum(result.pack_result.file_char_counts.values()) // 40 if result.pack_result.file_char_counts else 0
+            # Approximate total lines from the character total the pack already computed
+            total_lines = result.pack_result.total_chars // 40
 
             # Build response
             response = {
@@ -153,12 +196,12 @@ def register_generate_skill_tool(server: FastMCP) -> None:
                 "total_lines": total_lines,
             }
 
-            if not is_mcp_silent_mode():
+            if not silent:
                 logger.log("   🎉 MCP response generated successfully")
 
             return response
 
         except Exception as error:
-            if not is_mcp_silent_mode():
+            if not silent:
                 logger.error(f"   ❌ Error in generate_skill tool: {error}")
             return build_mcp_tool_error_response(convert_error_to_json(error))
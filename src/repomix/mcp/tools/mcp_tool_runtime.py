@@ -1,9 +1,12 @@
 """MCP tool runtime utilities for Repomix."""
 
 import json
+import os
+import secrets
 import tempfile
+import threading
 import uuid
-from pathlib import Path
+from collections import OrderedDict
 from typing import Any, Dict, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -44,16 +47,77 @@ def convert_error_to_json(error: Exception) -> Dict[str, Any]:
     return {"error_message": str(error), "error_type": type(error).__name__}
 
 
+# Parent directory of all tool workspaces, created on first use. TemporaryDirectory removes
+# it (with every workspace inside) when it is garbage collected or the process exits.
+_workspace_root: tempfile.TemporaryDirectory | None = None
+
+
+def _get_workspace_root() -> str:
+    """Get the per-process parent directory for tool workspaces, creating it on first use."""
+    global _workspace_root
+    if _workspace_root is None:
+        _workspace_root = tempfile.TemporaryDirectory(prefix="repomix_mcp_")
+    return _workspace_root.name
+
+
 async def create_tool_workspace() -> str:
-    """Create a temporary workspace directory for MCP tools."""
-    temp_dir = tempfile.mkdtemp(prefix="repomix_mcp_")
+    """Create a temporary workspace directory for MCP tools.
+
+    Workspaces live under one per-process root, so outputs stay readable for the life of the
+    server and are all removed when it exits instead of accumulating in the temp directory.
+    """
+    temp_dir = os.path.join(_get_workspace_root(), uuid.uuid4().hex)
+    os.mkdir(temp_dir)
     logger.trace(f"Created MCP tool workspace: {temp_dir}")
     return temp_dir
 
 
+# Bytes read per chunk when counting lines of an output file
+_LINE_COUNT_CHUNK_BYTES = 1 << 20
+
+
+def count_file_lines(file_path: str) -> int:
+    """Count the lines of a file by scanning fixed-size chunks for newlines.
+
+    A final line without a trailing newline still counts, as when iterating the file.
+    """
+    line_count = 0
+    last_byte = b"\n"
+    with open(file_path, "rb") as f:
+        while chunk := f.read(_LINE_COUNT_CHUNK_BYTES):
+            line_count += chunk.count(b"\n")
+            last_byte = chunk[-1:]
+    if last_byte != b"\n":
+        line_count += 1
+    return line_count
+
+
 def generate_output_id() -> str:
     """Generate a unique output ID for tracking repomix outputs."""
-    return str(uuid.uuid4())
+    return secrets.token_urlsafe(16)
+
+
+# Number of directory structure characters shown in pack tool responses
+_DIRECTORY_STRUCTURE_PREVIEW_CHARS = 1000
+
+
+def _preview_directory_structure(file_tree: Any) -> str:
+    """Render the start of a file tree as JSON, encoding only as much as the preview shows."""
+    limit = _DIRECTORY_STRUCTURE_PREVIEW_CHARS
+    if not isinstance(file_tree, dict):
+        text = str(file_tree)
+    else:
+        parts = []
+        length = 0
+        for chunk in json.JSONEncoder(ensure_ascii=False).iterencode(file_tree):
+            parts.append(chunk)
+            length += len(chunk)
+            if length > limit:
+                break
+        text = "".join(parts)
+    if len(text) > limit:
+        return f"{text[:limit]}... (truncated)"
+    return text
 
 
 async def format_pack_tool_response(
@@ -69,18 +133,12 @@ async def format_pack_tool_response(
         output_id = generate_output_id()
 
         # Read the generated output file to get some basic stats
-        output_path = Path(output_file_path)
-
-        if not output_path.exists():
+        try:
+            file_size = os.stat(output_file_path).st_size
+        except FileNotFoundError:
             return build_mcp_tool_error_response({"error_message": f"Output file not found: {output_file_path}"})
 
-        file_size = output_path.stat().st_size
-
-        # Get line count more efficiently without reading entire file into memory
-        line_count = 0
-        with open(output_file_path, "rb") as f:
-            for _ in f:
-                line_count += 1
+        line_count = count_file_lines(output_file_path)
 
         # Build response
         description = (
@@ -95,7 +153,7 @@ async def format_pack_tool_response(
 
         # Convert file_tree to string carefully
         try:
-            directory_structure = json.dumps(pack_result.file_tree) if isinstance(pack_result.file_tree, dict) else str(pack_result.file_tree)
+            directory_structure = _preview_directory_structure(pack_result.file_tree)
         except Exception:
             directory_structure = "Error: Could not serialize directory structure"
 
@@ -112,7 +170,7 @@ Output Details:
 - Line Count: {line_count:,}
 
 Directory Structure:
-{directory_structure[:1000]}{"... (truncated)" if len(directory_structure) > 1000 else ""}
+{directory_structure}
 
 Use 'read_repomix_output' with outputId '{output_id}' to access the full content."""
 
@@ -125,16 +183,28 @@ Use 'read_repomix_output' with outputId '{output_id}' to access the full content
         return build_mcp_tool_error_response(convert_error_to_json(e))
 
 
-# Global storage for output ID to file path mapping
-_output_mappings: Dict[str, str] = {}
+# Maximum number of output ID mappings kept before the least recently used is evicted
+_MAX_OUTPUT_MAPPINGS = 1024
+
+# Global storage for output ID to file path mapping, ordered from least to most recently used
+_output_mappings: "OrderedDict[str, str]" = OrderedDict()
+_output_mappings_lock = threading.Lock()
 
 
 def _store_output_mapping(output_id: str, file_path: str) -> None:
     """Store mapping between output ID and file path."""
-    _output_mappings[output_id] = file_path
+    with _output_mappings_lock:
+        _output_mappings[output_id] = file_path
+        _output_mappings.move_to_end(output_id)
+        if len(_output_mappings) > _MAX_OUTPUT_MAPPINGS:
+            _output_mappings.popitem(last=False)
     logger.trace(f"Stored output mapping: {output_id} -> {file_path}")
 
 
 def get_output_file_path(output_id: str) -> str | None:
     """Get file path for a given output ID."""
-    return _output_mappings.get(output_id)
+    with _output_mappings_lock:
+        file_path = _output_mappings.get(output_id)
+        if file_path is not None:
+            _output_mappings.move_to_end(output_id)
+        return file_path
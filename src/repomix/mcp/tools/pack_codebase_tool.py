@@ -86,7 +86,9 @@ def register_pack_codebase_tool(server: FastMCP) -> None:
     ) -> Dict[str, Any]:
         """Pack a local codebase into a consolidated XML file."""
 
-        if not is_mcp_silent_mode():
+        silent = is_mcp_silent_mode()
+
+        if not silent:
             logger.log("🔨 MCP Tool Called: pack_codebase")
             logger.log(f"   📁 Directory: {directory}")
             logger.log(f"   🗜️ Compress: {compress}")
@@ -104,24 +106,24 @@ def register_pack_codebase_tool(server: FastMCP) -> None:
 
             if not directory_path.exists():
                 error_msg = f"Directory does not exist: {directory}"
-                if not is_mcp_silent_mode():
+                if not silent:
                     logger.warn(f"   ⚠️ {error_msg}")
                 return build_mcp_tool_error_response({"error_message": error_msg})
 
             if not directory_path.is_dir():
                 error_msg = f"Path is not a directory: {directory}"
-                if not is_mcp_silent_mode():
+                if not silent:
                     logger.warn(f"   ⚠️ {error_msg}")
                 return build_mcp_tool_error_response({"error_message": error_msg})
 
-            if not is_mcp_silent_mode():
+            if not silent:
                 logger.log("   🏗️ Creating workspace...")
 
             # Create temporary workspace
             temp_dir = await create_tool_workspace()
             output_file_path = os.path.join(temp_dir, "repomix-output.xml")
 
-            if not is_mcp_silent_mode():
+            if not silent:
                 logger.log(f"   📝 Output will be saved to: {output_file_path}")
 
             # Prepare CLI options
@@ -136,7 +138,7 @@ def register_pack_codebase_tool(server: FastMCP) -> None:
                 quiet=True,
             )
 
-            if not is_mcp_silent_mode():
+            if not silent:
                 logger.log("   🔄 Processing repository...")
 
             # Run the CLI
@@ -144,11 +146,11 @@ def register_pack_codebase_tool(server: FastMCP) -> None:
 
             if not result:
                 error_msg = "Failed to generate repomix output"
-                if not is_mcp_silent_mode():
+                if not silent:
                     logger.error(f"   ❌ {error_msg}")
                 return build_mcp_tool_error_response({"error_message": error_msg})
 
-            if not is_mcp_silent_mode():
+            if not silent:
                 logger.log("   ✅ Processing completed!")
                 logger.log(f"   📊 Files processed: {result.pack_result.total_files}")
                 logger.log(f"   📝 Characters: {result.pack_result.total_chars:,}")
@@ -166,12 +168,12 @@ def register_pack_codebase_tool(server: FastMCP) -> None:
             # Format the response properly
             response = await format_pack_tool_response(request_params, result.pack_result, output_file_path, top_files_length)
 
-            if not is_mcp_silent_mode():
+            if not silent:
                 logger.log("   🎉 MCP response generated successfully")
 
             return response
 
         except Exception as error:
-            if not is_mcp_silent_mode():
+            if not silent:
                 logger.error(f"   ❌ Error in pack_codebase tool: {error}")
             return build_mcp_tool_error_response(convert_error_to_json(error))
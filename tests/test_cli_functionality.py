@@ -27,6 +27,17 @@ class TestCLIParser:
         assert isinstance(parser, argparse.ArgumentParser)
         assert parser.description and "Repomix" in parser.description
 
+    def test_create_parser_reused_across_parses(self):
+        """Test the parser is built once and repeated parses do not affect each other"""
+        parser = create_parser()
+        assert create_parser() is parser
+
+        first = parser.parse_args(["src", "--include", "*.py", "--verbose"])
+        second = parser.parse_args([])
+
+        assert first.directories == ["src"] and first.include == "*.py" and first.verbose is True
+        assert second.directories == ["."] and second.include is None and second.verbose is False
+
     def test_parser_default_arguments(self):
         """Test parser with default arguments"""
         parser = create_parser()
@@ -399,6 +410,18 @@ class TestCLIActions:
 
         mock_version.assert_called_once()
 
+    @patch("src.repomix.cli.cli_run.create_parser")
+    @patch("src.repomix.cli.cli_run.run_version_action")
+    def test_run_version_fast_path(self, mock_version, mock_create_parser):
+        """Test bare --version skips parser construction"""
+        from src.repomix.cli.cli_run import run
+
+        with patch.object(sys, "argv", ["repomix", "--version"]):
+            run()
+
+        mock_version.assert_called_once()
+        mock_create_parser.assert_not_called()
+
     @patch("src.repomix.cli.cli_run.run_init_action")
     def test_execute_action_init(self, mock_init):
         """Test execute_action with init flag"""
@@ -11,6 +11,8 @@ from src.repomix.core.file.file_manipulate import (
     TreeSitterManipulator,
     get_file_manipulator,
 )
+from src.repomix.core.tree_sitter.lang2query import get_query_string, lang2query
+from src.repomix.core.tree_sitter.language_parser import language_parser
 
 
 class TestPythonManipulator:
@@ -597,5 +599,48 @@ if __name__ == "__main__":
         assert result == unknown_code
 
 
+class TestTreeSitterQueries:
+    """Test cases for tree-sitter query lookup and caching"""
+
+    def test_every_language_has_query_string(self):
+        """Test each mapped language resolves to its query source"""
+        for language in lang2query:
+            query_string = get_query_string(language)
+            assert isinstance(query_string, str) and query_string.strip(), language
+
+        assert get_query_string("unknown") is None
+
+    def test_query_compiled_once_per_language(self):
+        """Test the compiled query is reused across calls"""
+        pytest.importorskip("tree_sitter_python")
+        language_parser.clear_cache()
+
+        query = language_parser.get_query("python")
+
+        assert query is not None
+        assert language_parser.get_query("python") is query
+
+    def test_missing_grammar_is_not_retried(self, monkeypatch):
+        """Test a language whose grammar is not installed is looked up only once"""
+        from src.repomix.core.tree_sitter import language_parser as language_parser_module
+
+        calls = []
+
+        def get_language(language):
+            calls.append(language)
+            return None
+
+        monkeypatch.setattr(language_parser_module.language_loader, "get_language", get_language)
+        language_parser.clear_cache()
+        try:
+            assert language_parser.get_query("ruby") is None
+            assert language_parser.get_query("ruby") is None
+            assert language_parser.get_query("unknown") is None
+        finally:
+            language_parser.clear_cache()
+
+        assert calls == ["ruby"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
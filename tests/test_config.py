@@ -9,7 +9,7 @@ from src.repomix.config.config_schema import (
     RepomixConfigOutput,
     RepomixOutputStyle,
 )
-from src.repomix.config.config_load import migrate_config_format
+from src.repomix.config.config_load import merge_configs, migrate_config_format
 
 
 class TestRepomixConfigOutput:
@@ -93,6 +93,35 @@ class TestRepomixConfig:
         assert full_config.output.calculate_tokens is True
         assert full_config.include == ["*"]
 
+    def test_from_dict(self):
+        """Test building a config from a plain dictionary"""
+        config = RepomixConfig.from_dict(
+            {
+                "output": {"style": "XML", "git": {"include_logs": True}},
+                "ignore": {"custom_patterns": ["*.log"]},
+                "include": ["src/**"],
+            }
+        )
+
+        assert isinstance(config.output, RepomixConfigOutput)
+        assert config.output.style_enum == RepomixOutputStyle.XML
+        assert config.output.git.include_logs is True
+        assert config.ignore.custom_patterns == ["*.log"]
+        assert config.include == ["src/**"]
+        assert config.security.enable_security_check is True
+
+    def test_merge_configs_slotted_sections(self):
+        """Test merging into slotted config sections keeps style handling"""
+        local_config = RepomixConfig.from_dict({"output": {"style": "plain", "git": {"include_logs": True}}})
+
+        merged = merge_configs(None, local_config, {"output": {"style": "xml", "show_line_numbers": True}})
+
+        assert not hasattr(merged.output, "__dict__")
+        assert merged.output.style_enum == RepomixOutputStyle.XML
+        assert merged.output.style == "xml"
+        assert merged.output.show_line_numbers is True
+        assert merged.output.git.include_logs is True
+
     def test_json_config_loading(self):
         """Test loading configuration from JSON-like structure"""
         # Create a complete config similar to repomix.config.json
@@ -2,18 +2,24 @@
 Test suite for core RepoProcessor functionality
 """
 
+import os
 import tempfile
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 from src.repomix.core.repo_processor import (
+    _count_tokens,
+    _split_for_token_count,
     RepoProcessor,
     RepoProcessorResult,
     build_file_tree_with_ignore,
+    compile_glob_patterns,
+    narrow_glob_patterns,
 )
 from src.repomix.config.config_schema import RepomixConfig, RepomixOutputStyle
 from src.repomix.shared.error_handle import RepomixError
+from src.repomix.core.file.file_types import ProcessedFile
 from src.repomix.core.security.security_check import SuspiciousFileResult
 
 
@@ -145,6 +151,105 @@ class TestRepoProcessor:
             assert "main.py" in tree["src"]
             assert "utils.py" in tree["src"]
 
+    def test_compile_glob_patterns(self):
+        """Test ignore globs are combined into one regex matching any of them"""
+        regex = compile_glob_patterns(["*.log", "docs/*.md", "build"])
+
+        assert regex is not None
+        assert regex.match("app.log")
+        assert regex.match("docs/readme.md")
+        assert regex.match("build")
+        assert not regex.match("build2")
+        assert not regex.match("src/main.py")
+        assert compile_glob_patterns([]) is None
+
+    def test_narrow_glob_patterns(self):
+        """Test patterns whose literal prefix leaves a directory are dropped for its subtree"""
+        patterns = ("*.log", "docs/*.md", "src/gen/*", "src")
+
+        assert narrow_glob_patterns(patterns, "src/") == ("*.log", "src/gen/*")
+        assert narrow_glob_patterns(patterns, "src/gen/deep/") == ("*.log", "src/gen/*")
+        assert narrow_glob_patterns(patterns, "tests/") == ("*.log",)
+        assert narrow_glob_patterns(("docs/*.md",), "lib/") == ()
+
+    def test_build_file_tree_with_ignore_nested_patterns(self):
+        """Test path patterns still apply deep in the tree after narrowing"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "src" / "gen").mkdir(parents=True)
+            (temp_path / "src" / "gen" / "out.py").write_text("x = 1")
+            (temp_path / "src" / "main.py").write_text("x = 2")
+            (temp_path / "docs").mkdir()
+            (temp_path / "docs" / "guide.md").write_text("# Guide")
+            (temp_path / "docs" / "app.log").write_text("log")
+
+            config = RepomixConfig()
+            config.ignore.custom_patterns = ["src/gen/*.py", "*.log"]
+            tree = build_file_tree_with_ignore(temp_path, config)
+
+            assert "main.py" in tree["src"]
+            assert "gen" not in tree["src"]
+            assert tree["docs"] == {"guide.md": ""}
+
+    def test_count_tokens_uses_batch_encoding(self):
+        """Test token counts come from a single batched encode call"""
+        encoding = Mock()
+        encoding.encode_batch.return_value = [[1, 2, 3], [4]]
+        files = [ProcessedFile(path="a.py", content="a b c"), ProcessedFile(path="b.py", content="d")]
+
+        assert _count_tokens(encoding, files) == [3, 1]
+        encoding.encode_batch.assert_called_once()
+        assert encoding.encode_batch.call_args.args[0] == ["a b c", "d"]
+        encoding.encode.assert_not_called()
+
+    def test_count_tokens_falls_back_per_file(self):
+        """Test a file the encoder rejects counts as zero without affecting the others"""
+
+        def encode(text):
+            if "<|endoftext|>" in text:
+                raise ValueError("disallowed special token")
+            return text.split()
+
+        encoding = Mock()
+        encoding.encode_batch.side_effect = ValueError("disallowed special token")
+        encoding.encode.side_effect = encode
+        files = [
+            ProcessedFile(path="ok.py", content="print ( 'hello' )"),
+            ProcessedFile(path="special.txt", content="<|endoftext|>"),
+        ]
+
+        assert _count_tokens(encoding, files) == [4, 0]
+
+    def test_split_for_token_count(self):
+        """Test chunks are cut after newlines and long lines are cut at the limit"""
+        assert _split_for_token_count("ab\ncd\nef", 5) == ["ab\n", "cd\nef"]
+        assert _split_for_token_count("abcdefgh", 3) == ["abc", "def", "gh"]
+        assert _split_for_token_count("short", 10) == ["short"]
+
+    def test_count_tokens_chunks_large_files(self, monkeypatch):
+        """Test files over the threshold are encoded in chunks and their counts summed"""
+        monkeypatch.setattr("src.repomix.core.repo_processor._TOKEN_COUNT_CHUNK_THRESHOLD_CHARS", 8)
+        monkeypatch.setattr("src.repomix.core.repo_processor._TOKEN_COUNT_CHUNK_CHARS", 6)
+        encoding = Mock()
+        encoding.encode_batch.side_effect = lambda texts, num_threads: [text.split() for text in texts]
+        files = [ProcessedFile(path="big.txt", content="a b\nc d\ne f\n"), ProcessedFile(path="small.txt", content="g h")]
+
+        assert _count_tokens(encoding, files) == [6, 2]
+        assert encoding.encode_batch.call_args.args[0] == ["a b\n", "c d\n", "e f\n", "g h"]
+
+    def test_write_output_in_chunks(self, monkeypatch):
+        """Test output written in slices matches the full content"""
+        monkeypatch.setattr("src.repomix.core.repo_processor._OUTPUT_WRITE_CHUNK_CHARS", 7)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = RepomixConfig()
+            config.output.file_path = str(Path(temp_dir) / "out" / "repomix-output.md")
+            processor = RepoProcessor(directory=temp_dir, config=config)
+            content = "# Title\n\nnon-ASCII é ü 中文 spans chunk boundaries\n" * 3
+
+            processor.write_output(content)
+
+            assert Path(config.output.file_path).read_text(encoding="utf-8") == content
+
     @patch("src.repomix.core.repo_processor.clone_repository")
     @patch("src.repomix.core.repo_processor.create_temp_directory")
     def test_repo_processor_with_remote_repository(self, mock_create_temp, mock_clone_repo):
@@ -193,6 +298,40 @@ class TestRepoProcessor:
                 assert result.suspicious_files_results[0].file_path.endswith(".env")
                 assert "API key pattern" in result.suspicious_files_results[0].messages[0]
 
+    def test_repo_processor_totals_exclude_suspicious_files(self):
+        """Test character totals only count files that remain after the security check"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "secrets.txt").write_text("API_KEY=secret123")
+            (temp_path / "normal.py").write_text("print('normal')")
+
+            with patch("src.repomix.core.repo_processor.check_files") as mock_check:
+                mock_check.return_value = [SuspiciousFileResult(file_path="secrets.txt", messages=["Contains API key pattern"])]
+
+                config = RepomixConfig()
+                config.output.file_path = str(temp_path / "repomix-output.md")
+                result = RepoProcessor(directory=temp_dir, config=config).process(write_output=False)
+
+            assert result.total_files == 1
+            assert result.file_char_counts == {"normal.py": len("print('normal')")}
+            assert result.total_chars == len("print('normal')")
+
+    def test_repo_processor_predefined_file_paths(self):
+        """Test stdin file paths under the directory are packed with relative paths"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir).resolve()
+            (temp_path / "src").mkdir()
+            (temp_path / "src" / "main.py").write_text("print('main')")
+            (temp_path / "other.py").write_text("print('other')")
+
+            config = RepomixConfig()
+            config.output.file_path = str(temp_path / "repomix-output.md")
+            processor = RepoProcessor(directory=temp_dir, config=config)
+            processor.set_predefined_file_paths([str(temp_path / "src" / "main.py")])
+            result = processor.process(write_output=False)
+
+            assert list(result.file_char_counts) == [os.path.join("src", "main.py")]
+
     def test_repo_processor_result_dataclass(self):
         """Test RepoProcessorResult dataclass"""
         config = RepomixConfig()
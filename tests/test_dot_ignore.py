@@ -2,12 +2,15 @@
 Test suite for .ignore file support and --no-dot-ignore flag (Issue #17)
 """
 
+import sys
 import tempfile
+import threading
 from pathlib import Path
 
 from src.repomix.cli.cli_run import create_parser
 from src.repomix.config.config_schema import RepomixConfig
-from src.repomix.core.file.file_search import get_ignore_patterns
+from src.repomix.core.file import file_search
+from src.repomix.core.file.file_search import get_ignore_patterns, read_ignore_file
 
 
 class TestDotIgnoreFlag:
@@ -97,3 +100,104 @@ class TestDotIgnoreFileReading:
             patterns = get_ignore_patterns(tmpdir, config)
             # Should not raise, just return empty (or only repomixignore patterns)
             assert isinstance(patterns, list)
+
+    def test_ignore_patterns_cache_invalidated_by_changes(self):
+        """Test cached ignore patterns follow ignore file edits and config changes"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ignore_file = Path(tmpdir) / ".ignore"
+            ignore_file.write_text("*.log\n")
+
+            config = RepomixConfig()
+            config.ignore.use_default_ignore = False
+            config.ignore.use_gitignore = False
+
+            assert get_ignore_patterns(tmpdir, config) == ["*.log"]
+            assert get_ignore_patterns(tmpdir, config) == ["*.log"]
+
+            ignore_file.write_text("*.tmp\nbuild/\n")
+            assert get_ignore_patterns(tmpdir, config) == ["*.tmp", "build/"]
+
+            config.ignore.custom_patterns = ["dist/"]
+            assert get_ignore_patterns(tmpdir, config) == ["*.tmp", "build/", "dist/"]
+
+            config.ignore.use_dot_ignore = False
+            assert get_ignore_patterns(tmpdir, config) == ["dist/"]
+
+    def test_read_ignore_file_cached_until_modified(self):
+        """Test parsed ignore files are reused until their contents change"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ignore_file = Path(tmpdir) / ".gitignore"
+            assert read_ignore_file(ignore_file) is None
+
+            ignore_file.write_text("# comment\n*.log\n\n  build/  \n")
+            first = read_ignore_file(ignore_file)
+            assert first == ("*.log", "build/")
+            assert read_ignore_file(ignore_file) is first
+
+            ignore_file.write_text("dist/\n")
+            assert read_ignore_file(ignore_file) == ("dist/",)
+
+    def test_ignore_caches_keep_one_entry_per_file(self):
+        """Test edited ignore files replace their cache entries instead of adding new ones"""
+        file_search.clear_ignore_patterns_cache()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ignore_file = Path(tmpdir) / ".ignore"
+            config = RepomixConfig()
+            config.ignore.use_default_ignore = False
+            config.ignore.use_gitignore = False
+
+            for i in range(5):
+                ignore_file.write_text(f"pattern{i}/\n" * (i + 1))
+                assert get_ignore_patterns(tmpdir, config)[-1] == f"pattern{i}/"
+
+            assert len(file_search._ignore_patterns_cache) == 1
+            assert list(file_search._ignore_file_cache) == [str(ignore_file)]
+        file_search.clear_ignore_patterns_cache()
+
+    def test_read_ignore_file_cache_bounded(self, monkeypatch):
+        """Test the ignore file cache evicts its oldest entry when full"""
+        file_search.clear_ignore_patterns_cache()
+        monkeypatch.setattr(file_search, "_MAX_IGNORE_FILE_CACHE_ENTRIES", 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [Path(tmpdir) / f"ignore{i}" for i in range(3)]
+            for path in paths:
+                path.write_text("*.log\n")
+                read_ignore_file(path)
+
+            assert list(file_search._ignore_file_cache) == [str(paths[1]), str(paths[2])]
+        file_search.clear_ignore_patterns_cache()
+
+    def test_cache_eviction_from_concurrent_threads(self):
+        """Test concurrent stores into a full cache never evict the same entry twice"""
+        cache = {}
+        errors = []
+
+        def store(thread_index):
+            try:
+                for i in range(10000):
+                    file_search._store_cache_entry(cache, (thread_index, i), i, 4)
+            except Exception as error:
+                errors.append(error)
+
+        # Switch threads as often as possible so racing evictions would show up
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=store, args=(index,)) for index in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert errors == []
+        assert len(cache) <= 4
+
+    def test_read_ignore_file_line_handling(self):
+        """Test comments, blank lines, surrounding whitespace and line endings in ignore files"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ignore_file = Path(tmpdir) / ".ignore"
+            ignore_file.write_bytes(b"# comment\r\n*.log\r\n \t\r\n  #kept  \rbuild/\t\n\xc3\xa9t\xc3\xa9/")
+
+            assert read_ignore_file(ignore_file) == ("*.log", "#kept", "build/", "\u00e9t\u00e9/")
@@ -6,6 +6,7 @@ import tempfile
 import pytest
 from pathlib import Path
 import os
+from unittest.mock import patch
 
 from src.repomix.core.file.file_search import search_files, get_ignore_patterns
 from src.repomix.core.file.file_collect import collect_files
@@ -213,6 +214,28 @@ class TestFileProcessing:
         for processed_file in processed_files:
             assert len(processed_file.content) > 0
 
+    def test_process_files_without_manipulation_skips_pool(self):
+        """Test plain processing runs inline without starting a worker pool"""
+        raw_files = [RawFile(path=f"f{i}.py", content=f"  x = {i}  \n") for i in range(5)]
+
+        with patch("src.repomix.core.file.file_process.get_process_concurrency") as mock_pool:
+            processed_files = process_files(raw_files, RepomixConfig())
+
+        mock_pool.assert_not_called()
+        assert [f.path for f in processed_files] == [f"f{i}.py" for i in range(5)]
+        assert [f.content for f in processed_files] == [f"x = {i}" for i in range(5)]
+
+    def test_process_files_with_manipulation_keeps_order(self):
+        """Test files processed in the worker pool come back in input order"""
+        raw_files = [RawFile(path=f"f{i}.py", content=f"x = {i}\n\n\ny = {i}") for i in range(20)]
+        config = RepomixConfig()
+        config.output.remove_empty_lines = True
+
+        processed_files = process_files(raw_files, config)
+
+        assert [f.path for f in processed_files] == [f"f{i}.py" for i in range(20)]
+        assert processed_files[3].content == "x = 3\ny = 3"
+
     def test_process_content_basic(self):
         """Test basic content processing"""
         content = "def hello():\n    print('Hello, World!')\n    return True"
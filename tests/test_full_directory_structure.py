@@ -11,6 +11,7 @@ from src.repomix.core.repo_processor import (
 from src.repomix.core.output.output_generate import (
     build_filtered_file_tree,
     generate_output,
+    prepare_display_tree,
 )
 from src.repomix.core.file.file_types import ProcessedFile
 from src.repomix.config.config_schema import RepomixConfig
@@ -151,6 +152,33 @@ class TestBuildFilteredFileTree:
         assert "deep.py" in result["a"]["b"]["c"]
 
 
+class TestPrepareDisplayTree:
+    """Test cases for prepare_display_tree function"""
+
+    def test_filtered_by_default(self):
+        """Test only processed files are shown when the full structure is disabled"""
+        files = [ProcessedFile(path="src/main.py", content="")]
+        full_tree = {"src": {"main.py": "", "skipped.py": ""}, "docs": {}}
+
+        assert prepare_display_tree(files, RepomixConfig(), full_tree) == {"src": {"main.py": ""}}
+
+    def test_full_structure(self):
+        """Test the full tree is passed through when the full structure is enabled"""
+        config = RepomixConfig()
+        config.output.include_full_directory_structure = True
+        full_tree = {"src": {"main.py": "", "skipped.py": ""}, "docs": {}}
+
+        assert prepare_display_tree([], config, full_tree) is full_tree
+
+    def test_generate_output_uses_given_display_tree(self):
+        """Test generate_output renders a precomputed display tree as-is"""
+        files = [ProcessedFile(path="src/main.py", content="print('hi')")]
+
+        output = generate_output(files, RepomixConfig(), {}, {}, {}, display_tree={"precomputed.txt": ""})
+
+        assert "precomputed.txt" in output
+
+
 class TestGenerateOutputWithFullStructure:
     """Test cases for generate_output with full directory structure"""
 
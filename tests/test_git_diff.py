@@ -3,13 +3,22 @@ Test suite for Git Diff functionality
 """
 
 import json
+import os
+import subprocess
+import sys
 import tempfile
+import threading
 import pytest
 from pathlib import Path
 
+from src.repomix.core.file import git_command
 from src.repomix.core.file.git_command import (
     is_git_repository,
+    is_not_git_repository_error,
     exec_git_diff,
+    exec_git_diff_both,
+    get_git_ignore_patterns,
+    iter_git_log_filenames,
 )
 from src.repomix.core.file.git_diff_handle import (
     GitDiffResult,
@@ -42,6 +51,14 @@ class TestGitCommand:
             result = is_git_repository(temp_dir)
             assert result is False
 
+    def test_is_git_repository_follows_git_init(self):
+        """Test is_git_repository reflects a repository created after the first check"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            assert is_git_repository(temp_dir) is False
+
+            subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
+            assert is_git_repository(temp_dir) is True
+
     def test_exec_git_diff_empty_repo(self):
         """Test exec_git_diff on empty repository"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -52,6 +69,14 @@ class TestGitCommand:
             result = exec_git_diff(temp_dir)
             assert result == ""
 
+    def test_exec_git_diff_non_git_repo_error(self):
+        """Test exec_git_diff failure outside a repository is recognized as such"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(subprocess.CalledProcessError) as exc_info:
+                exec_git_diff(temp_dir)
+
+            assert is_not_git_repository_error(exc_info.value)
+
     def test_exec_git_diff_with_changes(self):
         """Test exec_git_diff with uncommitted changes"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -86,6 +111,115 @@ class TestGitCommand:
             result = exec_git_diff(temp_dir)
             assert "modified content" in result or "initial content" in result
 
+    def test_exec_git_diff_both_separates_work_tree_and_staged(self):
+        """Test exec_git_diff_both returns work tree and staged diffs separately"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
+            subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=temp_dir, capture_output=True)
+            subprocess.run(["git", "config", "user.name", "Test"], cwd=temp_dir, capture_output=True)
+
+            staged_file = Path(temp_dir) / "staged.txt"
+            work_file = Path(temp_dir) / "work.txt"
+            staged_file.write_text("staged initial")
+            work_file.write_text("work initial")
+            subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
+            subprocess.run(["git", "commit", "-m", "initial"], cwd=temp_dir, capture_output=True)
+
+            staged_file.write_text("staged modified")
+            subprocess.run(["git", "add", "staged.txt"], cwd=temp_dir, capture_output=True)
+            work_file.write_text("work modified")
+
+            work_tree_diff, staged_diff = exec_git_diff_both(temp_dir)
+
+            assert "work modified" in work_tree_diff
+            assert "staged modified" not in work_tree_diff
+            assert "staged modified" in staged_diff
+            assert "work modified" not in staged_diff
+
+    def test_get_git_ignore_patterns_reparses_modified_file(self):
+        """Test cached .gitignore patterns are refreshed when the file changes"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            gitignore = Path(temp_dir) / ".gitignore"
+            gitignore.write_text("# comment\n*.log\n\n  build/  \n")
+
+            assert get_git_ignore_patterns(temp_dir) == ["*.log", "build/"]
+            assert get_git_ignore_patterns(temp_dir) == ["*.log", "build/"]
+
+            gitignore.write_text("dist/\n")
+            stat = gitignore.stat()
+            os.utime(gitignore, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            assert get_git_ignore_patterns(temp_dir) == ["dist/"]
+
+    def test_get_git_ignore_patterns_reparses_resized_file_with_same_mtime(self):
+        """Test a .gitignore edit that keeps the modification time is detected by its size"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            gitignore = Path(temp_dir) / ".gitignore"
+            gitignore.write_text("*.log\n")
+            mtime_ns = gitignore.stat().st_mtime_ns
+            assert get_git_ignore_patterns(temp_dir) == ["*.log"]
+
+            gitignore.write_text("*.log\nbuild/\n")
+            os.utime(gitignore, ns=(mtime_ns, mtime_ns))
+            assert get_git_ignore_patterns(temp_dir) == ["*.log", "build/"]
+
+    def test_get_git_ignore_patterns_cache_keeps_one_entry_per_file(self, monkeypatch):
+        """Test edited .gitignore files replace their cache entry and the cache stays bounded"""
+        monkeypatch.setattr(git_command, "_gitignore_patterns_cache", {})
+        monkeypatch.setattr(git_command, "_MAX_GITIGNORE_PATTERNS_CACHE_ENTRIES", 2)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo_dirs = [Path(temp_dir) / f"repo{i}" for i in range(3)]
+            for repo_dir in repo_dirs:
+                repo_dir.mkdir()
+
+            gitignore = repo_dirs[0] / ".gitignore"
+            for i in range(3):
+                gitignore.write_text(f"pattern{i}/\n")
+                stat = gitignore.stat()
+                os.utime(gitignore, ns=(stat.st_atime_ns, stat.st_mtime_ns + (i + 1) * 1_000_000_000))
+                assert get_git_ignore_patterns(repo_dirs[0]) == [f"pattern{i}/"]
+            assert list(git_command._gitignore_patterns_cache) == [str(gitignore)]
+
+            for repo_dir in repo_dirs[1:]:
+                (repo_dir / ".gitignore").write_text("*.log\n")
+                assert get_git_ignore_patterns(repo_dir) == ["*.log"]
+            assert list(git_command._gitignore_patterns_cache) == [str(repo_dir / ".gitignore") for repo_dir in repo_dirs[1:]]
+
+    def test_iter_git_log_filenames_non_git_repo_error(self):
+        """Test streaming git log outside a repository raises with git's stderr"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(subprocess.CalledProcessError) as exc_info:
+                list(iter_git_log_filenames(temp_dir))
+
+            assert is_not_git_repository_error(exc_info.value)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX shell script as git")
+    def test_iter_git_log_filenames_large_stderr(self, tmp_path, monkeypatch):
+        """Test git writing more than a pipe buffer to stderr does not block the stdout stream"""
+        fake_git = tmp_path / "git"
+        script_lines = [
+            "#!/bin/sh",
+            "i=0",
+            'while [ $i -lt 20000 ]; do echo "warning: noisy repository configuration" >&2; i=$((i+1)); done',
+            "printf 'a.py\\n\\nb.py\\n'",
+        ]
+        fake_git.write_text("\n".join(script_lines) + "\n")
+        fake_git.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+
+        result = []
+        worker = threading.Thread(target=lambda: result.extend(iter_git_log_filenames(tmp_path)), daemon=True)
+        worker.start()
+        worker.join(timeout=30)
+
+        assert not worker.is_alive()
+        assert result == ["a.py", "b.py"]
+
+    def test_get_git_ignore_patterns_missing_file(self):
+        """Test missing .gitignore yields no patterns"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            assert get_git_ignore_patterns(temp_dir) == []
+
 
 class TestGitDiffHandle:
     """Test cases for git diff handle functions"""
@@ -12,6 +12,7 @@ from src.repomix.core.file.git_command import exec_git_log
 from src.repomix.core.file.git_log_handle import (
     GitLogCommit,
     GitLogResult,
+    iter_parse_git_log,
     parse_git_log,
     get_git_log,
     get_git_logs,
@@ -112,6 +113,41 @@ class TestGitLogParsing:
         assert result.log_content == "raw log"
         assert len(result.commits) == 1
 
+    def test_git_log_result_defaults_to_no_commits(self):
+        """Test GitLogResult without commits keeps an empty commit list and compares by value"""
+        result = GitLogResult(log_content="2024-01-15|Not parsed")
+
+        assert result.commits == []
+        assert result == GitLogResult(log_content="2024-01-15|Not parsed")
+        assert result != GitLogResult(log_content="2024-01-15|Not parsed", max_commits=5)
+        assert not hasattr(result, "__dict__")
+
+    def test_git_log_result_lazy_commits(self):
+        """Test GitLogResult.from_log_content parses commits from log_content on first access"""
+        sep = GIT_LOG_RECORD_SEPARATOR
+        log_content = f"{sep}2024-01-15|First\na.txt\n{sep}2024-01-14|Second\nb.txt\n"
+        result = GitLogResult.from_log_content(log_content, max_commits=2)
+
+        # repr shows the unparsed state without forcing the parse
+        assert "_commits=None" in repr(result)
+        assert result._commits is None
+
+        commits = result.commits
+        assert [c.message for c in commits] == ["First", "Second"]
+        assert result.commits is commits
+        assert result == GitLogResult(log_content=log_content, commits=parse_git_log(log_content), max_commits=2)
+
+    def test_iter_parse_git_log_is_lazy(self):
+        """Test iter_parse_git_log yields commits one at a time"""
+        sep = GIT_LOG_RECORD_SEPARATOR
+        commits = iter_parse_git_log(f"{sep}2024-01-15|First\na.txt\n{sep}2024-01-14|Second\n")
+
+        first = next(commits)
+        assert first.message == "First"
+        assert first.files == ["a.txt"]
+        assert next(commits).message == "Second"
+        assert next(commits, None) is None
+
 
 class TestGitLogHandle:
     """Test cases for git log handle functions"""
@@ -122,6 +158,15 @@ class TestGitLogHandle:
             result = get_git_log(temp_dir, max_commits=10)
             assert result == ""
 
+    def test_get_git_log_other_git_error(self, monkeypatch):
+        """Test get_git_log returns empty string when git fails for another reason"""
+
+        def fail_git_log(directory, max_commits, separator):
+            raise subprocess.CalledProcessError(128, ["git", "log"], stderr="fatal: detected dubious ownership in repository")
+
+        monkeypatch.setattr("src.repomix.core.file.git_log_handle.exec_git_log", fail_git_log)
+        assert get_git_log(".", max_commits=10) == ""
+
     def test_get_git_logs_disabled(self):
         """Test get_git_logs returns None when disabled"""
         config = RepomixConfig()
@@ -2,9 +2,22 @@
 Test suite for MCP tools
 """
 
+import asyncio
+import json
+import os
+from collections import OrderedDict
+
 import pytest
 
 from src.repomix.mcp.mcp_server import create_mcp_server
+from src.repomix.mcp.tools.generate_skill_tool import _list_generated_files
+from src.repomix.mcp.tools.mcp_tool_runtime import (
+    _preview_directory_structure,
+    _store_output_mapping,
+    count_file_lines,
+    create_tool_workspace,
+    get_output_file_path,
+)
 
 
 class TestMCPServer:
@@ -30,6 +43,79 @@ class TestGenerateSkillTool:
         # Check that the server has tools registered
         assert server is not None
 
+    def test_invalid_directory_errors(self, tmp_path):
+        """Test missing paths and non-directories are rejected before packing"""
+        server = create_mcp_server(silent=True)
+        not_a_dir = tmp_path / "file.txt"
+        not_a_dir.write_text("content")
+
+        _, missing = asyncio.run(server.call_tool("generate_skill", {"directory": str(tmp_path / "missing")}))
+        _, file_result = asyncio.run(server.call_tool("generate_skill", {"directory": str(not_a_dir)}))
+
+        assert missing["result"]["isError"] is True
+        assert "Directory does not exist" in missing["result"]["content"][0]["text"]
+        assert file_result["result"]["isError"] is True
+        assert "Path is not a directory" in file_result["result"]["content"][0]["text"]
+
+    def test_list_generated_files(self, tmp_path):
+        """Test generated files are listed relative to the output directory in walk order"""
+        (tmp_path / "references").mkdir()
+        (tmp_path / "SKILL.md").write_text("skill")
+        (tmp_path / "references" / "files.md").write_text("files")
+
+        expected = [os.path.relpath(os.path.join(root, name), tmp_path) for root, _dirs, files in os.walk(tmp_path) for name in files]
+
+        assert _list_generated_files(str(tmp_path)) == expected
+        assert sorted(expected) == ["SKILL.md", os.path.join("references", "files.md")]
+
+
+class TestMCPToolRuntime:
+    """Test cases for MCP tool runtime helpers"""
+
+    def test_count_file_lines_across_chunks(self, tmp_path, monkeypatch):
+        """Test newline counting matches line iteration, with and without a trailing newline"""
+        monkeypatch.setattr("src.repomix.mcp.tools.mcp_tool_runtime._LINE_COUNT_CHUNK_BYTES", 4)
+        for content in [b"", b"one\n", b"one\ntwo", b"one\ntwo\nthree\n", b"\n\n\n"]:
+            path = tmp_path / "output.txt"
+            path.write_bytes(content)
+            with open(path, "rb") as f:
+                expected = sum(1 for _ in f)
+
+            assert count_file_lines(str(path)) == expected, content
+
+    def test_create_tool_workspace_shares_one_root(self):
+        """Test each workspace is a new directory under a single per-process root"""
+        first = asyncio.run(create_tool_workspace())
+        second = asyncio.run(create_tool_workspace())
+
+        assert first != second
+        assert os.path.isdir(first) and os.path.isdir(second)
+        assert os.path.dirname(first) == os.path.dirname(second)
+        assert os.path.basename(os.path.dirname(first)).startswith("repomix_mcp_")
+
+    def test_output_mappings_evict_least_recently_used(self, monkeypatch):
+        """Test output mappings are capped and evict the least recently used ID"""
+        monkeypatch.setattr("src.repomix.mcp.tools.mcp_tool_runtime._MAX_OUTPUT_MAPPINGS", 2)
+        monkeypatch.setattr("src.repomix.mcp.tools.mcp_tool_runtime._output_mappings", OrderedDict())
+
+        _store_output_mapping("a", "/tmp/a.xml")
+        _store_output_mapping("b", "/tmp/b.xml")
+        assert get_output_file_path("a") == "/tmp/a.xml"
+        _store_output_mapping("c", "/tmp/c.xml")
+
+        assert get_output_file_path("b") is None
+        assert get_output_file_path("a") == "/tmp/a.xml"
+        assert get_output_file_path("c") == "/tmp/c.xml"
+
+    def test_preview_directory_structure_truncates(self, monkeypatch):
+        """Test the directory structure preview matches the encoded tree and is cut at the limit"""
+        monkeypatch.setattr("src.repomix.mcp.tools.mcp_tool_runtime._DIRECTORY_STRUCTURE_PREVIEW_CHARS", 20)
+        small_tree = {"文档": ["a.py"]}
+        large_tree = {"src": [f"file_{i}.py" for i in range(50)]}
+
+        assert _preview_directory_structure(small_tree) == '{"文档": ["a.py"]}'
+        assert _preview_directory_structure(large_tree) == json.dumps(large_tree)[:20] + "... (truncated)"
+
 
 class TestMCPToolCount:
     """Test cases for MCP tool count"""
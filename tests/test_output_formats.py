@@ -2,6 +2,7 @@
 Test suite for output format functionality
 """
 
+import io
 import json
 import tempfile
 import pytest
@@ -9,6 +10,7 @@ from pathlib import Path
 import xml.etree.ElementTree as ET
 
 from src.repomix.core.output.output_generate import generate_output
+from src.repomix.core.output.output_styles.json_style import JsonStyle, dump_json_document, dumps_json_document
 from src.repomix.config.config_schema import RepomixConfig, RepomixOutputStyle
 from src.repomix.core.file.file_types import ProcessedFile
 
@@ -175,6 +177,50 @@ class TestOutputGeneration:
         assert "tokenCount" in parsed["files"]["src/main.py"]
         assert parsed["files"]["src/main.py"]["charCount"] == 45
 
+    def test_dumps_json_document_matches_stdlib(self):
+        """Test the JSON serializer produces the same text as json.dumps"""
+        document = {
+            "files": {"src/中文.py": {"content": 'print("héllo")\n\ttab \\ \u0001', "charCount": 12}},
+            "gitLogs": [],
+            "empty": {},
+            "statistics": {"totalFiles": 1, "totalCharacters": 12, "totalTokens": 0},
+        }
+
+        assert dumps_json_document(document) == json.dumps(document, indent=2, ensure_ascii=False)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dump_json_document_streams_same_text(self, use_orjson, monkeypatch):
+        """Test writing the document to a stream matches the string serializer"""
+        from src.repomix.core.output.output_styles import json_style
+
+        if not use_orjson:
+            monkeypatch.setattr(json_style, "orjson", None)
+        document = {"files": {"a.py": {"content": "é = 1\n"}}, "statistics": {"totalFiles": 1}}
+
+        buffer = io.StringIO()
+        dump_json_document(document, buffer)
+
+        assert buffer.getvalue() == json.dumps(document, indent=2, ensure_ascii=False)
+
+    def test_write_json_output_matches_generate_json_output(self):
+        """Test JsonStyle.write_json_output writes what generate_json_output returns"""
+        config = RepomixConfig()
+        config.output.style_enum = RepomixOutputStyle.JSON
+        config.output.file_summary = False
+        style = JsonStyle(config)
+        args = (self.processed_files, self.file_char_counts, self.file_token_counts, self.file_tree, 3, 100, 26)
+
+        buffer = io.StringIO()
+        style.write_json_output(buffer, *args)
+
+        assert buffer.getvalue() == style.generate_json_output(*args)
+
+    def test_dumps_json_document_lone_surrogate(self):
+        """Test content that only the stdlib encoder accepts is still serialized"""
+        document = {"files": {"bad.txt": {"content": "broken \udc80 byte"}}}
+
+        assert dumps_json_document(document) == json.dumps(document, indent=2, ensure_ascii=False)
+
     def test_generate_output_basic_functionality(self):
         """Test basic output generation functionality"""
         config = RepomixConfig()
@@ -6,6 +6,7 @@ import tempfile
 import subprocess
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from src.repomix.core.output.output_sort import (
     get_file_change_count,
@@ -15,6 +16,7 @@ from src.repomix.core.output.output_sort import (
 )
 from src.repomix.config.config_schema import RepomixConfig
 from src.repomix.core.file.file_types import ProcessedFile
+from src.repomix.core.file.git_log_handle import GitLogCommit, GitLogResult
 
 
 class TestGetFileChangeCount:
@@ -101,6 +103,13 @@ class TestCheckGitAvailability:
             result = _check_git_availability(temp_dir)
             assert result is False
 
+    def test_check_git_availability_skips_git_probe_without_git_folder(self):
+        """Test the git installation probe is not run when there is no .git folder"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch("src.repomix.core.output.output_sort.is_git_installed") as mock_installed:
+                assert _check_git_availability(temp_dir) is False
+                mock_installed.assert_not_called()
+
 
 class TestSortOutputFiles:
     """Test cases for sort_output_files function"""
@@ -122,6 +131,14 @@ class TestSortOutputFiles:
         result = sort_output_files(files, config)
         assert result == files  # Should return unchanged
 
+    def test_sort_output_files_empty(self):
+        """Test sort_output_files returns immediately for an empty file list"""
+        config = RepomixConfig()
+
+        with patch("src.repomix.core.output.output_sort._get_file_change_counts") as mock_counts:
+            assert sort_output_files([], config) == []
+            mock_counts.assert_not_called()
+
     def test_sort_output_files_enabled(self):
         """Test sort_output_files when sorting is enabled"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -191,6 +208,49 @@ class TestSortOutputFiles:
             assert result[1].path == "file2.txt"
             assert result[2].path == "file1.txt"
 
+    def test_sort_output_files_uses_git_log_result(self):
+        """Test change counts are derived from an existing git log without running git"""
+        config = RepomixConfig()
+        config.output.git.sort_by_changes_max_commits = 2
+
+        git_log_result = GitLogResult(
+            log_content="",
+            commits=[
+                GitLogCommit(date="2024-01-03", message="third", files=["a.txt", "b.txt"]),
+                GitLogCommit(date="2024-01-02", message="second", files=["a.txt"]),
+                GitLogCommit(date="2024-01-01", message="first", files=["c.txt", "c.txt"]),
+            ],
+            max_commits=3,
+        )
+        files = [
+            ProcessedFile(path="a.txt", content="a"),
+            ProcessedFile(path="b.txt", content="b"),
+            ProcessedFile(path="c.txt", content="c"),
+        ]
+
+        with patch("src.repomix.core.output.output_sort._get_file_change_counts") as mock_counts:
+            result = sort_output_files(files, config, git_log_result=git_log_result)
+            mock_counts.assert_not_called()
+
+        # Only the newest two commits count, so c.txt has no changes
+        assert [f.path for f in result] == ["c.txt", "b.txt", "a.txt"]
+
+    def test_sort_output_files_git_log_result_too_short(self):
+        """Test a truncated git log shorter than the sort window falls back to git"""
+        config = RepomixConfig()
+        config.output.git.sort_by_changes_max_commits = 100
+
+        git_log_result = GitLogResult(
+            log_content="",
+            commits=[GitLogCommit(date="2024-01-01", message="only", files=["a.txt"])],
+            max_commits=1,
+        )
+        files = [ProcessedFile(path="a.txt", content="a")]
+
+        with patch("src.repomix.core.output.output_sort._get_file_change_counts", return_value=None) as mock_counts:
+            assert sort_output_files(files, config, git_log_result=git_log_result) == files
+            mock_counts.assert_called_once()
+
     def test_sort_output_files_non_git_repo(self):
         """Test sort_output_files with non-git directory"""
         with tempfile.TemporaryDirectory() as temp_dir:
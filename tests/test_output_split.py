@@ -4,14 +4,19 @@ Test suite for Output Split functionality
 
 import pytest
 
+from src.repomix.core.output import output_split
 from src.repomix.core.output.output_split import (
+    OutputSplitGroup,
     get_root_entry,
     build_output_split_groups,
     build_split_output_file_path,
     get_utf8_byte_length,
     generate_split_output_parts,
+    make_chunk_config,
+    render_group_body,
 )
 from src.repomix.core.output.output_generate import generate_output
+from src.repomix.core.output.output_styles import get_output_style
 from src.repomix.config.config_schema import RepomixConfig
 from src.repomix.core.file.file_types import ProcessedFile
 
@@ -123,6 +128,61 @@ class TestGetUtf8ByteLength:
         assert get_utf8_byte_length("") == 0
 
 
+class TestMakeChunkConfig:
+    """Test cases for make_chunk_config function"""
+
+    def test_first_part_uses_base_config(self):
+        """Test the first part keeps the base configuration"""
+        config = RepomixConfig()
+        assert make_chunk_config(config, 1) is config
+
+    def test_later_parts_disable_git_sections(self):
+        """Test later parts drop git diffs/logs without touching the base config"""
+        config = RepomixConfig()
+        config.output.style = "xml"
+        config.output.include_diffs = True
+        config.output.git.include_diffs = True
+        config.output.git.include_logs = True
+
+        chunk_config = make_chunk_config(config, 2)
+
+        assert chunk_config.output.git.include_diffs is False
+        assert chunk_config.output.git.include_logs is False
+        assert chunk_config.output.style_enum == config.output.style_enum
+        assert chunk_config.ignore is config.ignore
+        assert config.output.git.include_diffs is True
+        assert config.output.git.include_logs is True
+
+
+class TestRenderGroupBody:
+    """Test cases for render_group_body function"""
+
+    @pytest.mark.parametrize("style", ["markdown", "plain", "xml"])
+    def test_group_body_matches_files_section(self, style):
+        """Test a group's body is exactly the file sections inside the style's files section"""
+        config = RepomixConfig()
+        config.output.style = style
+        config.output.show_file_stats = True
+        files = [
+            ProcessedFile(path="src/a.py", content="if a < b and c > d:\n    pass\n"),
+            ProcessedFile(path="src/b.py", content="x = 'é & ü'\n"),
+        ]
+        char_counts = {f.path: len(f.content) for f in files}
+        group = OutputSplitGroup(root_entry="src", processed_files=files)
+
+        body = render_group_body(group, config, char_counts, {})
+        output_style = get_output_style(config)
+        files_section = output_style.generate_files_section(files, char_counts, {})
+        empty_section = output_style.generate_files_section([], char_counts, {})
+
+        assert "src/a.py" in body and "src/b.py" in body
+        assert body in files_section
+        if style == "xml":
+            assert files_section == f"<repository_files>\n{body}</repository_files>\n"
+        else:
+            assert len(files_section) == len(empty_section) + len(body)
+
+
 class TestGenerateSplitOutputParts:
     """Test cases for generate_split_output_parts function"""
 
@@ -206,6 +266,140 @@ class TestGenerateSplitOutputParts:
         for i, part in enumerate(result):
             assert part.index == i + 1
 
+    @pytest.mark.parametrize("style", ["markdown", "plain", "xml", "json"])
+    def test_split_renders_file_contents_once_per_part(self, style):
+        """Test file contents are fully rendered only when a part is finalized"""
+        self.config.output.style = style
+        files = [ProcessedFile(path=f"dir{i}/file.py", content=f"print({i})\n" * 200) for i in range(6)]
+        char_counts = {f.path: len(f.content) for f in files}
+        token_counts = {f.path: 10 for f in files}
+        full_renders = []
+
+        def counting_generate_output(*args, **kwargs):
+            if args[1].output.files:
+                full_renders.append(len(args[0]))
+            return generate_output(*args, **kwargs)
+
+        result = generate_split_output_parts(
+            processed_files=files,
+            all_file_paths=[f.path for f in files],
+            max_bytes_per_part=8000,
+            base_config=self.config,
+            generate_output_fn=counting_generate_output,
+            file_char_counts=char_counts,
+            file_token_counts=token_counts,
+        )
+
+        assert len(result) > 1
+        assert len(full_renders) == len(result)
+        assert sum(len(part.groups) for part in result) == len(files)
+        for part in result:
+            assert part.byte_length == get_utf8_byte_length(part.content)
+            assert part.byte_length <= 8000
+
+    def test_split_parallel_body_measurement_matches_serial(self, monkeypatch):
+        """Test measuring group bodies in a worker pool yields the same parts as serial measurement"""
+        files = [ProcessedFile(path=f"dir{i}/file.py", content=f"print({i})\n" * 200) for i in range(10)]
+        kwargs = {
+            "processed_files": files,
+            "all_file_paths": [f.path for f in files],
+            "max_bytes_per_part": 8000,
+            "base_config": self.config,
+            "generate_output_fn": generate_output,
+            "file_char_counts": {f.path: len(f.content) for f in files},
+            "file_token_counts": {f.path: 10 for f in files},
+        }
+        serial = generate_split_output_parts(**kwargs)
+
+        measured = []
+        original_measure = output_split.measure_group_bodies_parallel
+
+        def recording_measure(*args):
+            result = original_measure(*args)
+            measured.append(result)
+            return result
+
+        monkeypatch.setattr(output_split, "_PARALLEL_MIN_TOTAL_CHARS", 0)
+        monkeypatch.setattr(output_split, "measure_group_bodies_parallel", recording_measure)
+        parallel = generate_split_output_parts(**kwargs)
+
+        assert measured and measured[0] is not None and len(measured[0]) == len(files)
+        assert [part.content for part in parallel] == [part.content for part in serial]
+
+    def test_split_bin_packing_uses_fewer_parts(self):
+        """Test first-fit-decreasing packing fills parts that sequential packing would leave short"""
+        sizes = {"a": 4000, "b": 7000, "c": 3000, "d": 6000}
+        files = [ProcessedFile(path=f"{root}/file.py", content="x" * size) for root, size in sizes.items()]
+
+        result = generate_split_output_parts(
+            processed_files=files,
+            all_file_paths=[f.path for f in files],
+            max_bytes_per_part=12200,
+            base_config=self.config,
+            generate_output_fn=generate_output,
+            file_char_counts={f.path: len(f.content) for f in files},
+            file_token_counts={},
+        )
+
+        # Sequential packing yields [a], [b, c], [d]
+        assert [[g.root_entry for g in part.groups] for part in result] == [["a", "d"], ["b", "c"]]
+        assert all(part.byte_length <= 12200 for part in result)
+
+    @pytest.mark.parametrize("style", ["markdown", "plain", "xml", "json"])
+    def test_split_output_that_fits_stays_single_part(self, style):
+        """Test output exactly at the limit is not split by the over-estimated bin packing sizes"""
+        self.config.output.style = style
+        files = [ProcessedFile(path=f"{root}/file.py", content="x" * 1500) for root in "abcdef"]
+        kwargs = {
+            "processed_files": files,
+            "all_file_paths": [f.path for f in files],
+            "base_config": self.config,
+            "generate_output_fn": generate_output,
+            "file_char_counts": {f.path: len(f.content) for f in files},
+            "file_token_counts": {},
+        }
+        whole = generate_split_output_parts(max_bytes_per_part=10**9, **kwargs)[0]
+
+        result = generate_split_output_parts(max_bytes_per_part=whole.byte_length, **kwargs)
+
+        assert len(result) == 1
+        assert result[0].content == whole.content
+        assert [g.root_entry for g in result[0].groups] == list("abcdef")
+
+    def test_split_bin_packing_not_fewer_parts_keeps_sequential(self):
+        """Test parts stay contiguous alphabetical runs when bin packing would not save a part"""
+        sizes = {"a": 3000, "b": 2000, "c": 3000, "d": 2000}
+        files = [ProcessedFile(path=f"{root}/file.py", content="x" * size) for root, size in sizes.items()]
+
+        result = generate_split_output_parts(
+            processed_files=files,
+            all_file_paths=[f.path for f in files],
+            max_bytes_per_part=9000,
+            base_config=self.config,
+            generate_output_fn=generate_output,
+            file_char_counts={f.path: len(f.content) for f in files},
+            file_token_counts={},
+        )
+
+        # First-fit-decreasing would also use two parts, as [a, c] and [b, d]
+        assert [[g.root_entry for g in part.groups] for part in result] == [["a", "b"], ["c", "d"]]
+        assert all(part.byte_length <= 9000 for part in result)
+
+    def test_split_group_exceeding_limit(self):
+        """Test a single root entry larger than the limit raises"""
+        files = [ProcessedFile(path="big/file.py", content="x" * 5000)]
+
+        with pytest.raises(ValueError, match="root entry 'big' exceeds max size"):
+            generate_split_output_parts(
+                processed_files=files,
+                all_file_paths=["big/file.py"],
+                max_bytes_per_part=1000,
+                base_config=self.config,
+                generate_output_fn=generate_output,
+                file_char_counts={"big/file.py": 5000},
+                file_token_counts={},
+            )
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -2,6 +2,8 @@
 Test suite for Token Count Tree functionality
 """
 
+import sys
+
 import pytest
 
 from src.repomix.core.tokenCount.token_count_tree import (
@@ -10,6 +12,7 @@ from src.repomix.core.tokenCount.token_count_tree import (
     TreeNode,
     build_token_count_tree,
     format_token_count_tree,
+    iter_token_count_tree,
     report_token_count_tree,
 )
 from src.repomix.config.config_schema import RepomixConfig
@@ -43,6 +46,8 @@ class TestTreeNode:
         """Test TreeNode creation"""
         node = TreeNode()
         assert node.files == []
+        assert node.file_names == []
+        assert node.file_tokens == []
         assert node.token_sum == 0
         assert node.children == {}
 
@@ -58,6 +63,8 @@ class TestBuildTokenCountTree:
         assert len(tree.files) == 1
         assert tree.files[0].name == "main.py"
         assert tree.files[0].tokens == 100
+        assert tree.file_names == ["main.py"]
+        assert tree.file_tokens == [100]
         assert tree.token_sum == 100
 
     def test_build_tree_nested_files(self):
@@ -96,6 +103,22 @@ class TestBuildTokenCountTree:
         assert "utils" in tree.children["src"].children["core"].children
         assert tree.token_sum == 200
 
+    def test_build_tree_deeper_than_recursion_limit(self):
+        """Test token sums for paths nested deeper than the recursion limit"""
+        deep_path = "/".join(["d"] * (sys.getrecursionlimit() + 100)) + "/leaf.py"
+        tree = build_token_count_tree([FileWithTokens(path=deep_path, tokens=7), FileWithTokens(path="d/top.py", tokens=3)])
+
+        assert tree.token_sum == 10
+        assert tree.children["d"].token_sum == 10
+        assert tree.children["d"].children["d"].token_sum == 7
+
+    def test_build_tree_from_plain_tuples(self):
+        """Test plain (path, tokens) tuples build the same tree as FileWithTokens"""
+        tree = build_token_count_tree([("src/main.py", 100), ("src/util.py", 20)])
+
+        assert tree.token_sum == 120
+        assert tree.children["src"].file_names == ["main.py", "util.py"]
+
     def test_build_tree_empty_list(self):
         """Test building tree with empty list"""
         tree = build_token_count_tree([])
@@ -131,6 +154,67 @@ class TestFormatTokenCountTree:
         assert "100" in output
         assert "50" in output
 
+    def test_format_sorts_entries_per_directory(self):
+        """Test entries are listed by name within each directory regardless of input order"""
+        files = [
+            FileWithTokens(path="b.py", tokens=1),
+            FileWithTokens(path="a-b/x.py", tokens=2),
+            FileWithTokens(path="a/z.py", tokens=3),
+            FileWithTokens(path="a.py", tokens=4),
+            FileWithTokens(path="a/y.py", tokens=5),
+        ]
+        output = format_token_count_tree(build_token_count_tree(files))
+
+        names = [line.split("── ")[1].split(" (")[0] for line in output.splitlines()]
+        assert names == ["a.py", "b.py", "a/", "y.py", "z.py", "a-b/", "x.py"]
+
+    def test_format_compresses_single_directory_chains(self):
+        """Test directories holding only one subdirectory are merged into one entry"""
+        files = [
+            FileWithTokens(path="src/main/java/com/example/App.java", tokens=100),
+            FileWithTokens(path="src/main/java/com/example/util/Strings.java", tokens=50),
+            FileWithTokens(path="README.md", tokens=10),
+        ]
+        tree = build_token_count_tree(files)
+
+        output = format_token_count_tree(tree)
+        assert output.splitlines() == [
+            "├── README.md (10 tokens)",
+            "└── src/main/java/com/example/ (150 tokens)",
+            "    ├── App.java (100 tokens)",
+            "    └── util/ (50 tokens)",
+            "        └── Strings.java (50 tokens)",
+        ]
+
+        uncompressed = format_token_count_tree(tree, compress_chains=False)
+        assert "└── src/ (150 tokens)" in uncompressed
+        assert "└── example/ (150 tokens)" in uncompressed
+
+    def test_iter_matches_format(self):
+        """Test the line iterator yields the formatted tree lazily, line by line"""
+        files = [
+            FileWithTokens(path="src/main.py", tokens=100),
+            FileWithTokens(path="src/lib/util.py", tokens=30),
+            FileWithTokens(path="setup.py", tokens=5),
+        ]
+        tree = build_token_count_tree(files)
+
+        lines = iter_token_count_tree(tree)
+        assert next(lines) == "├── setup.py (5 tokens)"
+        assert next(lines) == "└── src/ (130 tokens)"
+        assert "\n".join(iter_token_count_tree(tree)) == format_token_count_tree(tree)
+        assert list(iter_token_count_tree(TreeNode())) == ["No files found."]
+
+    def test_iter_handles_trees_deeper_than_recursion_limit(self):
+        """Test formatting does not recurse once per directory"""
+        depth = sys.getrecursionlimit() + 100
+        tree = build_token_count_tree([FileWithTokens(path="/".join(f"d{i}" for i in range(depth)) + "/leaf.py", tokens=1), ("d0/top.py", 1)])
+
+        lines = list(iter_token_count_tree(tree, compress_chains=False))
+
+        assert len(lines) == depth + 2
+        assert lines[-1].endswith("└── leaf.py (1 tokens)")
+
     def test_format_with_min_token_count(self):
         """Test formatting with minimum token count filter"""
         files = [